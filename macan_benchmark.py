@@ -0,0 +1,388 @@
+# Nama File: macan_benchmark.py
+# Deskripsi: Benchmark mesin pembersihan Macan Conquer dengan pohon folder sintetis.
+#            Membuat skenario (lebar, dalam, banyak file kecil, sedikit file besar,
+#            file read-only, dan item terkunci) di folder scratch, menjalankan logika yang
+#            sama dengan tombol 'Clear Temporary Files' (pipeline + DeletionEngine), lalu
+#            melaporkan item/s, byte/s, jumlah syscall, dan puncak memori dalam JSON.
+#
+# Cara Menjalankan (Windows maupun Linux CI, tanpa PySide6):
+#   python macan_benchmark.py --output hasil.json
+#   python macan_benchmark.py --scale 0.1 --scenario wide --scenario deep
+#   python macan_benchmark.py --compare baseline.json --fail-on-regression 15
+#
+# Catatan:
+# - Setiap skenario dijalankan `--repeat` kali tanpa instrumentasi untuk pengukuran
+#   waktu, lalu sekali lagi dengan penghitung syscall dan tracemalloc (yang memperlambat
+#   eksekusi) untuk mengisi "syscalls" dan "peak_python_bytes".
+# - Syscall dihitung dengan membungkus fungsi modul `os` (scandir, stat, unlink, rmdir,
+#   ...). DirEntry.is_dir()/stat() yang memakai cache scandir tidak terhitung. Di Linux,
+#   "io_syscalls" berisi selisih syscr/syscw dari /proc/self/io.
+# - Skenario "locked" di Linux memakai folder tanpa izin tulis (tidak berpengaruh jika
+#   dijalankan sebagai root); di Windows memakai handle file yang tetap terbuka.
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from macan_cleanup import DeletionEngine, default_worker_count, format_bytes
+from macan_pipeline import CleanupTarget, PipelineProgress, run_pipeline
+
+SCHEMA_VERSION = 1
+COUNTED_CALLS = ("scandir", "stat", "lstat", "unlink", "remove", "rmdir", "rename", "mkdir", "chmod")
+CHUNK = 1024 * 1024
+
+
+# --- Generator Pohon Sintetis ---
+
+def _scaled(value, scale):
+    return max(1, int(value * scale))
+
+
+def _write_files(folder, count, size, prefix="f"):
+    data = b"x" * size
+    for i in range(count):
+        with open(os.path.join(folder, f"{prefix}{i:06d}.tmp"), "wb") as f:
+            f.write(data)
+
+
+def _write_big_file(path, size):
+    chunk = b"\0" * CHUNK
+    with open(path, "wb") as f:
+        for _ in range(size // CHUNK):
+            f.write(chunk)
+        f.write(chunk[:size % CHUNK])
+
+
+def gen_wide(root, scale):
+    """Satu folder dengan puluhan ribu file kecil."""
+    _write_files(root, _scaled(20000, scale), 64)
+    return {}
+
+
+def gen_deep(root, scale):
+    """Rantai folder yang sangat dalam, beberapa file di setiap level."""
+    folder = root
+    for level in range(_scaled(200, scale)):
+        folder = os.path.join(folder, f"d{level:03d}")
+        os.mkdir(folder)
+        _write_files(folder, 5, 256)
+    return {}
+
+
+def gen_tiny(root, scale):
+    """Banyak folder berisi banyak file sangat kecil (pola %TEMP% pada umumnya)."""
+    for d in range(_scaled(200, scale)):
+        folder = os.path.join(root, f"dir{d:04d}")
+        os.mkdir(folder)
+        _write_files(folder, 100, 512)
+    return {}
+
+
+def gen_huge(root, scale):
+    """Sedikit file berukuran besar (pola cache Windows Update)."""
+    for i in range(8):
+        _write_big_file(os.path.join(root, f"big{i}.cab"), _scaled(16 * CHUNK, scale))
+    return {}
+
+
+def gen_readonly(root, scale):
+    """File bertanda read-only; di Windows os.unlink gagal untuk file seperti ini."""
+    for d in range(_scaled(20, scale)):
+        folder = os.path.join(root, f"ro{d:03d}")
+        os.mkdir(folder)
+        _write_files(folder, 100, 128)
+        for entry in os.scandir(folder):
+            os.chmod(entry.path, stat.S_IREAD)
+    return {}
+
+
+def gen_locked(root, scale):
+    """Item yang tidak bisa dihapus selama run: handle terbuka (Windows) atau folder tanpa izin tulis."""
+    handles, locked_dirs = [], []
+    for d in range(_scaled(20, scale)):
+        folder = os.path.join(root, f"lk{d:03d}")
+        os.mkdir(folder)
+        _write_files(folder, 50, 128)
+        if os.name == "nt":
+            handles.append(open(os.path.join(folder, "f000000.tmp"), "rb"))
+        elif d % 2 == 0:
+            os.chmod(folder, stat.S_IREAD | stat.S_IEXEC)
+            locked_dirs.append(folder)
+    _write_files(root, _scaled(500, scale), 128, prefix="free")
+    return {"handles": handles, "locked_dirs": locked_dirs}
+
+
+SCENARIOS = {
+    "wide": gen_wide,
+    "deep": gen_deep,
+    "tiny": gen_tiny,
+    "huge": gen_huge,
+    "readonly": gen_readonly,
+    "locked": gen_locked,
+}
+
+
+def _release(state):
+    for handle in state.get("handles", ()):
+        handle.close()
+    for folder in state.get("locked_dirs", ()):
+        if os.path.isdir(folder):  # Sebagai root/admin folder ini tetap bisa terhapus
+            os.chmod(folder, stat.S_IRWXU)
+
+
+def _tree_totals(root):
+    """(items, bytes) di dalam `root`; dihitung di luar bagian yang diukur waktunya."""
+    items, total = 0, 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        items += len(dirnames) + len(filenames)
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return items, total
+
+
+def _force_rmtree(path):
+    def onerror(func, target, _):
+        os.chmod(target, stat.S_IRWXU)
+        func(target)
+    if os.path.lexists(path):
+        os.chmod(path, stat.S_IRWXU)
+        shutil.rmtree(path, onerror=onerror)
+
+
+# --- Instrumentasi ---
+
+class SyscallCounter:
+    """Membungkus fungsi modul `os` selama blok `with` dan menghitung pemanggilannya."""
+
+    def __init__(self, names=COUNTED_CALLS):
+        self.names = [name for name in names if hasattr(os, name)]
+        self.counters = {}
+        self._originals = {}
+
+    def __enter__(self):
+        for name in self.names:
+            original = getattr(os, name)
+            counter = itertools.count()
+            self._originals[name] = original
+            self.counters[name] = counter
+            setattr(os, name, self._wrap(original, counter))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+    @staticmethod
+    def _wrap(original, counter):
+        def wrapper(*args, **kwargs):
+            next(counter)  # itertools.count aman dipakai dari banyak thread (GIL)
+            return original(*args, **kwargs)
+        return wrapper
+
+    def totals(self):
+        # repr(count(n)) == 'count(n)'; membaca nilai tanpa menaikkannya
+        totals = {name: int(repr(counter)[6:-1]) for name, counter in self.counters.items()}
+        return {name: value for name, value in totals.items() if value}
+
+
+def _proc_io():
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(fields["syscr"]), int(fields["syscw"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _max_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+# --- Eksekusi ---
+
+def _clean(root, workers):
+    """Logika yang sama dengan _clear_temp_action: pipeline satu target, mode non-instan."""
+    target = CleanupTarget("Benchmark", [root], log_name="Benchmark")
+    [result] = run_pipeline([target], progress=PipelineProgress([target], None),
+                            engine_factory=lambda: DeletionEngine(max_workers=workers))
+    return result.results[0] if result.results else None
+
+
+def _run_once(scratch, name, scale, workers, instrument):
+    root = os.path.join(scratch, name)
+    _force_rmtree(root)
+    os.mkdir(root)
+    state = SCENARIOS[name](root, scale)
+    items, total_bytes = _tree_totals(root)
+
+    run = {}
+    try:
+        if instrument:
+            io_before = _proc_io()
+            tracemalloc.start()
+            with SyscallCounter() as counter:
+                cleanup = _clean(root, workers)
+            run["peak_python_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            run["syscalls"] = counter.totals()
+            io_after = _proc_io()
+            if io_before and io_after:
+                run["io_syscalls"] = {"read": io_after[0] - io_before[0], "write": io_after[1] - io_before[1]}
+        else:
+            start = time.perf_counter()
+            cleanup = _clean(root, workers)
+            run["seconds"] = time.perf_counter() - start
+    finally:
+        _release(state)
+
+    remaining_items, remaining_bytes = _tree_totals(root)
+    run.update(items=items, bytes=total_bytes,
+               removed_items=items - remaining_items, removed_bytes=total_bytes - remaining_bytes,
+               failed_groups=len(cleanup.failures.groups) if cleanup else 0,
+               failures=cleanup.failures.total if cleanup else 0)
+    _force_rmtree(root)
+    return run
+
+
+def run_scenario(scratch, name, scale=1.0, workers=None, repeat=1, instrument=True):
+    runs = [_run_once(scratch, name, scale, workers, False) for _ in range(repeat)]
+    best = min(runs, key=lambda r: r["seconds"])
+    seconds = max(best["seconds"], 1e-9)
+    result = {
+        "name": name,
+        "items": best["items"],
+        "bytes": best["bytes"],
+        "removed_items": best["removed_items"],
+        "removed_bytes": best["removed_bytes"],
+        "failures": best["failures"],
+        "seconds": best["seconds"],
+        "seconds_all": [r["seconds"] for r in runs],
+        "items_per_sec": best["removed_items"] / seconds,
+        "bytes_per_sec": best["removed_bytes"] / seconds,
+    }
+    if instrument:
+        profiled = _run_once(scratch, name, scale, workers, True)
+        result["syscalls"] = profiled["syscalls"]
+        result["peak_python_bytes"] = profiled["peak_python_bytes"]
+        if "io_syscalls" in profiled:
+            result["io_syscalls"] = profiled["io_syscalls"]
+    result["max_rss_bytes"] = _max_rss_bytes()
+    return result
+
+
+def run_suite(names, scale=1.0, workers=None, repeat=1, instrument=True, scratch=None, log=None):
+    workers = workers or default_worker_count()
+    own_scratch = scratch is None
+    scratch = scratch or tempfile.mkdtemp(prefix="macan-bench-")
+    report = {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "scale": scale,
+        "repeat": repeat,
+        "engine": {"max_workers": workers},
+        "scenarios": [],
+    }
+    try:
+        for name in names:
+            if log:
+                log(f"Menjalankan skenario '{name}'...")
+            report["scenarios"].append(run_scenario(scratch, name, scale, workers, repeat, instrument))
+    finally:
+        if own_scratch:
+            _force_rmtree(scratch)
+    return report
+
+
+# --- Laporan ---
+
+def format_report(report, baseline=None):
+    base = {s["name"]: s for s in (baseline or {}).get("scenarios", [])}
+    lines = [f"{'Skenario':<10} {'Item':>8} {'Ukuran':>10} {'Detik':>8} {'Item/s':>10} {'MB/s':>8} "
+             f"{'Syscall':>8} {'Memori':>10} {'Gagal':>6}" + (f" {'vs baseline':>12}" if base else "")]
+    for s in report["scenarios"]:
+        syscalls = sum(s.get("syscalls", {}).values()) if "syscalls" in s else "-"
+        memory = format_bytes(s["peak_python_bytes"]) if "peak_python_bytes" in s else "-"
+        line = (f"{s['name']:<10} {s['items']:>8} {format_bytes(s['bytes']):>10} {s['seconds']:>8.3f} "
+                f"{s['items_per_sec']:>10.0f} {s['bytes_per_sec'] / CHUNK:>8.1f} {syscalls:>8} "
+                f"{memory:>10} {s['failures']:>6}")
+        delta = compare_scenario(s, base.get(s["name"]))
+        if base:
+            line += f" {delta:>+11.1f}%" if delta is not None else f" {'-':>12}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def compare_scenario(current, previous):
+    """Perubahan item/s dalam persen terhadap baseline (negatif = lebih lambat)."""
+    if not previous or not previous.get("items_per_sec"):
+        return None
+    return (current["items_per_sec"] / previous["items_per_sec"] - 1) * 100
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark mesin pembersihan Macan Conquer.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Skenario yang dijalankan (boleh diulang). Default: semua.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Pengali jumlah/ukuran file.")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah run terukur per skenario (diambil yang tercepat).")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah worker DeletionEngine.")
+    parser.add_argument("--scratch", default=None, help="Folder scratch (default: folder temp baru).")
+    parser.add_argument("--no-instrument", action="store_true", help="Lewati run dengan penghitung syscall & tracemalloc.")
+    parser.add_argument("--output", default=None, help="Tulis hasil JSON ke file ini (default: stdout).")
+    parser.add_argument("--compare", default=None, help="File JSON hasil sebelumnya sebagai baseline.")
+    parser.add_argument("--fail-on-regression", type=float, default=None, metavar="PERSEN",
+                        help="Exit code 1 jika item/s turun lebih dari PERSEN terhadap baseline.")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    if args.scratch:
+        os.makedirs(args.scratch, exist_ok=True)
+    log = lambda message: print(message, file=sys.stderr)
+    report = run_suite(names, args.scale, args.workers, max(args.repeat, 1),
+                       not args.no_instrument, args.scratch, log)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    log(format_report(report, baseline))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if baseline and args.fail_on_regression is not None:
+        base = {s["name"]: s for s in baseline.get("scenarios", [])}
+        regressions = [s["name"] for s in report["scenarios"]
+                       if (compare_scenario(s, base.get(s["name"])) or 0) < -args.fail_on_regression]
+        if regressions:
+            log(f"❌ Regresi lebih dari {args.fail_on_regression}%: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
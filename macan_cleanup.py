@@ -0,0 +1,874 @@
+# Nama File: macan_cleanup.py
+# Deskripsi: Mesin penghapusan (deletion engine) bersama untuk semua aksi pembersihan
+#            Macan Conquer (Temp, Windows Update Cache, dan target pembersihan berikutnya).
+#
+# Changelog:
+# - [FITUR] Penghapusan paralel: item level atas (dan subtree besar) dibagi ke
+#           thread pool dengan jumlah worker terbatas.
+# - [PERFORMA] Enumerasi memakai os.scandir/DirEntry secara streaming. Tipe file
+#              diambil dari cache DirEntry, tanpa probing isfile/islink/isdir per item.
+# - [FITUR] Pembersihan dua fase: hitung cepat secara paralel, lalu hapus sambil
+#           melaporkan progres berdasarkan byte dan jumlah item (dengan ETA dan MB/s).
+# - [PERFORMA] Kegagalan dikumpulkan per errno dan folder induk (FailureReport) dan
+#              dilaporkan sekali di akhir, bukan satu sinyal log per file yang gagal.
+# - [FITUR] Pembersihan instan: folder target di-rename menjadi "tombstone" di volume
+#           yang sama, folder kosong dibuat ulang, lalu tombstone dihapus di latar
+#           belakang dengan prioritas rendah. Tombstone sisa crash dihapus saat start.
+# - [FITUR] Pembatas laju token bucket (file/detik dan MB/detik) dan mode latar belakang
+#           (prioritas CPU & I/O worker diturunkan), bisa diatur per run.
+# - [FITUR] Pembatalan kooperatif: semua fase menerima `cancel` (CancelToken dari
+#           macan_tasks.py) dan berhenti menjadwalkan pekerjaan baru saat dibatalkan.
+# - [FITUR] Filter file (`entry_filter`): file yang tidak lolos filter dibiarkan, dan
+#           folder yang masih berisi file tersebut tidak di-rmdir (bukan dihitung gagal).
+# - [PERBAIKAN] Junction NTFS dan reparse point folder lainnya tidak lagi dimasuki saat
+#               menghitung maupun menghapus (sebelumnya isi target junction ikut terhapus
+#               dan junction yang menunjuk ke atas membuat hitung cepat berputar tanpa henti).
+#               Reparse point dihapus sebagai satu item dengan rmdir/unlink.
+#
+# Modul ini sengaja tidak meng-import PySide6 agar bisa dipakai dari Worker thread,
+# dari jalur QProcess (macan_conquer8.py), maupun dari script lain.
+
+import os
+import sys
+import time
+import threading
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Perkiraan kedalaman antrean I/O storage per core. Penghapusan file didominasi
+# oleh latensi metadata disk, bukan CPU, jadi worker dibuat lebih banyak dari core.
+DEFAULT_QUEUE_DEPTH = 4
+MAX_WORKERS = 32
+
+# Folder dengan file sebanyak ini (atau lebih) dipecah menjadi beberapa batch
+# file yang dihapus paralel. Subfolder selalu menjadi task sendiri.
+SPLIT_THRESHOLD = 64
+
+# Jumlah task maksimum yang antre di pool per worker. Entry level atas dibaca dari
+# scandir hanya saat ada slot kosong, jadi folder raksasa tidak dimuat sekaligus.
+INFLIGHT_PER_WORKER = 4
+
+# Batas laporan kegagalan: contoh path per grup, jumlah grup (errno, folder) yang
+# dilacak terpisah, dan jumlah grup yang ditampilkan di ringkasan.
+FAILURE_SAMPLE_LIMIT = 3
+FAILURE_MAX_GROUPS = 200
+FAILURE_SUMMARY_GROUPS = 10
+
+# Penanda nama folder tombstone dan jumlah worker untuk purge latar belakang.
+TOMBSTONE_MARKER = ".macan-tombstone-"
+BACKGROUND_WORKERS = 2
+
+# Nilai nice untuk worker mode latar belakang (non-Windows) dan ukuran burst token bucket.
+BACKGROUND_NICE = 10
+RATE_BURST_SECONDS = 0.5
+
+# Jarak minimum antar laporan progres (detik), agar sinyal ke GUI thread tidak membanjir.
+PROGRESS_INTERVAL = 0.25
+
+# Atribut Win32 untuk junction, symlink, dan reparse point lainnya (st_file_attributes).
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+
+def app_data_dir(*parts):
+    """Folder data aplikasi: %LOCALAPPDATA%\\MacanConquer (dibuat jika belum ada)."""
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    path = os.path.join(base, "MacanConquer", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def default_failure_log_path(target_name):
+    """Path file daftar kegagalan lengkap untuk satu target pembersihan."""
+    safe_name = "".join(c if c.isalnum() else "_" for c in target_name)
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    return os.path.join(app_data_dir("logs"), f"Failures_{safe_name}_{timestamp}.txt")
+
+
+def default_worker_count(queue_depth=DEFAULT_QUEUE_DEPTH):
+    """Menghitung jumlah worker dari jumlah core CPU dan kedalaman antrean storage."""
+    cpu_count = os.cpu_count() or 1
+    return max(2, min(MAX_WORKERS, cpu_count * queue_depth))
+
+
+def format_bytes(size):
+    """Format ukuran byte agar mudah dibaca (KB, MB, GB)."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.2f} {unit}"
+        size /= 1024
+
+
+def format_duration(seconds):
+    """Format durasi dalam detik menjadi MM:SS atau H:MM:SS."""
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+# --- Walker berbasis os.scandir ---
+
+def iter_entries(path):
+    """Generator DirEntry untuk isi satu folder. Handle scandir ditutup setelah selesai."""
+    with os.scandir(path) as it:
+        yield from it
+
+
+def walk(root, topdown=True, onerror=None):
+    """
+    Walker streaming berbasis os.scandir (iteratif, tanpa rekursi Python).
+
+    Menghasilkan DirEntry untuk setiap file, link, dan folder di bawah `root`.
+    Dengan topdown=False, sebuah folder baru dihasilkan setelah seluruh isinya
+    (urutan post-order, cocok untuk penghapusan). Symlink, junction, dan reparse point
+    lain tidak diikuti: dihasilkan sebagai satu item, isinya tidak pernah dibaca.
+    Error saat membuka folder diteruskan ke `onerror(path, exc)` lalu dilewati.
+    """
+    try:
+        stack = [(os.scandir(root), None)]
+    except OSError as e:
+        if onerror:
+            onerror(root, e)
+        return
+    while stack:
+        it, dir_entry = stack[-1]
+        for entry in it:
+            if not is_plain_dir(entry):
+                yield entry
+                continue
+            if topdown:
+                yield entry
+            try:
+                stack.append((os.scandir(entry.path), entry))
+            except OSError as e:
+                if onerror:
+                    onerror(entry.path, e)
+                if not topdown:
+                    yield entry
+                continue
+            break
+        else:
+            it.close()
+            stack.pop()
+            if dir_entry is not None and not topdown:
+                yield dir_entry
+
+
+def _is_reparse_point(entry):
+    # Di Windows, is_dir(follow_symlinks=False) bernilai True untuk junction NTFS
+    if os.name != "nt":
+        return False
+    if hasattr(entry, "is_junction") and entry.is_junction():  # Python 3.12+
+        return True
+    # Atribut sudah ada di cache DirEntry (hasil FindNextFile), tanpa syscall tambahan
+    return bool(getattr(entry.stat(follow_symlinks=False), "st_file_attributes", 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def is_plain_dir(entry):
+    """Folder biasa yang boleh dimasuki; symlink, junction, dan reparse point lain bukan."""
+    try:
+        return entry.is_dir(follow_symlinks=False) and not _is_reparse_point(entry)
+    except OSError:
+        return False
+
+
+def _is_dir_link(entry):
+    """Junction/reparse point folder: dihapus dengan rmdir sebagai satu item, targetnya tidak disentuh."""
+    try:
+        return entry.is_dir(follow_symlinks=False) and _is_reparse_point(entry)
+    except OSError:
+        return False
+
+
+def _entry_size(entry):
+    # Di Windows ukuran sudah ada di cache DirEntry (hasil FindNextFile), tanpa syscall tambahan.
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+
+def _enter_background_mode():
+    """
+    Menurunkan prioritas CPU dan I/O thread saat ini, bukan seluruh proses (GUI tetap responsif).
+
+    Windows: SetThreadPriority(THREAD_MODE_BACKGROUND_BEGIN), karena psutil.nice/ionice di
+    Windows hanya berlaku untuk seluruh proses. Linux: psutil nice/ionice pada thread id.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 0x00010000)
+            return
+        import psutil
+        thread = psutil.Process(threading.get_native_id())
+        thread.nice(BACKGROUND_NICE)
+        if hasattr(psutil, "IOPRIO_CLASS_IDLE"):
+            thread.ionice(psutil.IOPRIO_CLASS_IDLE)
+    except Exception:
+        pass
+
+
+class RateLimiter:
+    """
+    Token bucket thread-safe untuk membatasi operasi file/detik dan MB/detik.
+
+    Setiap acquire() langsung mengambil token (boleh minus); thread yang membuat
+    saldo minus tidur sampai utangnya terbayar, sehingga laju total tetap sesuai batas.
+    """
+
+    def __init__(self, files_per_sec=None, mb_per_sec=None, burst_seconds=RATE_BURST_SECONDS):
+        self.files_per_sec = files_per_sec or 0
+        self.mb_per_sec = mb_per_sec or 0
+        self._file_rate = float(self.files_per_sec)
+        self._byte_rate = self.mb_per_sec * 1024 * 1024
+        self._file_capacity = self._file_rate * burst_seconds
+        self._byte_capacity = self._byte_rate * burst_seconds
+        self._file_tokens = self._file_capacity
+        self._byte_tokens = self._byte_capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def limits_bytes(self):
+        return self._byte_rate > 0
+
+    def describe(self):
+        parts = []
+        if self.files_per_sec:
+            parts.append(f"{self.files_per_sec} file/s")
+        if self.mb_per_sec:
+            parts.append(f"{self.mb_per_sec} MB/s")
+        return ", ".join(parts)
+
+    def acquire(self, files=1, size=0, cancel=None):
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._last = now - self._last, now
+            wait_time = 0.0
+            if self._file_rate:
+                self._file_tokens = min(self._file_capacity, self._file_tokens + elapsed * self._file_rate) - files
+                if self._file_tokens < 0:
+                    wait_time = -self._file_tokens / self._file_rate
+            if self._byte_rate:
+                self._byte_tokens = min(self._byte_capacity, self._byte_tokens + elapsed * self._byte_rate) - size
+                if self._byte_tokens < 0:
+                    wait_time = max(wait_time, -self._byte_tokens / self._byte_rate)
+        if wait_time > 0:
+            if cancel is not None:
+                cancel.wait(wait_time)
+            else:
+                time.sleep(wait_time)
+
+
+# --- Fase 1: Hitung Cepat ---
+
+def _count_tree(path, cancel=None, entry_filter=None):
+    """Menghitung item dan byte sebuah subtree (termasuk folder itu sendiri)."""
+    items, total_bytes = 1, 0
+    for entry in walk(path):
+        if cancel is not None and cancel.cancelled:
+            break
+        if is_plain_dir(entry):
+            items += 1
+        elif entry_filter is None or entry_filter(entry):
+            items += 1
+            total_bytes += _entry_size(entry)
+    return items, total_bytes
+
+
+class CleanupProgress:
+    """
+    Pelacak progres pembersihan berdasarkan byte dan jumlah item.
+
+    Persentase adalah rata-rata rasio byte dan rasio item, karena biaya hapus di
+    NTFS ditentukan oleh jumlah file (metadata) sekaligus ukuran datanya.
+    Callback hanya dipanggil paling sering sekali per `interval` detik.
+    """
+
+    def __init__(self, total_items, total_bytes, callback, interval=PROGRESS_INTERVAL):
+        self.total_items = total_items
+        self.total_bytes = total_bytes
+        self.done_items = 0
+        self.done_bytes = 0
+        self.callback = callback
+        self.interval = interval
+        self.start_time = time.monotonic()
+        self._last_report = 0.0
+
+    def add(self, items, size):
+        self.done_items += items
+        self.done_bytes += size
+
+    def elapsed(self):
+        return time.monotonic() - self.start_time
+
+    def ratio(self):
+        item_ratio = self.done_items / self.total_items if self.total_items else 1.0
+        byte_ratio = self.done_bytes / self.total_bytes if self.total_bytes else item_ratio
+        return min(1.0, (item_ratio + byte_ratio) / 2)
+
+    def percent(self):
+        return int(self.ratio() * 100)
+
+    def throughput(self):
+        """Kecepatan dalam byte per detik."""
+        elapsed = self.elapsed()
+        return self.done_bytes / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+        """Perkiraan sisa waktu dalam detik, atau None jika belum bisa diperkirakan."""
+        ratio = self.ratio()
+        if ratio <= 0:
+            return None
+        return self.elapsed() * (1 - ratio) / ratio
+
+    def format(self):
+        eta = self.eta()
+        return (f"Menghapus... {self.percent()}% | "
+                f"{format_bytes(self.done_bytes)} / {format_bytes(self.total_bytes)} | "
+                f"{self.done_items}/{self.total_items} item | "
+                f"{self.throughput() / (1024 * 1024):.1f} MB/s | "
+                f"ETA {format_duration(eta) if eta is not None else '--:--'}")
+
+    def report(self, force=False):
+        now = time.monotonic()
+        if force or now - self._last_report >= self.interval:
+            self._last_report = now
+            self.callback(self)
+
+
+# --- Laporan Kegagalan ---
+
+class FailureReport:
+    """
+    Mengelompokkan kegagalan hapus berdasarkan (errno, folder induk).
+
+    Hanya jumlah dan beberapa contoh path per grup yang disimpan di memori. Daftar
+    lengkap (jika diminta) ditulis langsung ke file `log_path` saat kegagalan terjadi.
+    """
+
+    def __init__(self, log_path=None, sample_limit=FAILURE_SAMPLE_LIMIT, max_groups=FAILURE_MAX_GROUPS):
+        self.total = 0
+        self.groups = {}  # (errno, folder) -> [jumlah, pesan error, contoh path]
+        self.sample_limit = sample_limit
+        self.max_groups = max_groups
+        self.log_path = log_path
+        self._file = None
+
+    def add(self, path, error):
+        self.total += 1
+        code = getattr(error, 'errno', None)
+        message = getattr(error, 'strerror', None) or type(error).__name__
+        key = (code, os.path.dirname(path))
+        if key not in self.groups and len(self.groups) >= self.max_groups:
+            key = (code, "(folder lainnya)")
+        group = self.groups.setdefault(key, [0, message, []])
+        group[0] += 1
+        if len(group[2]) < self.sample_limit:
+            group[2].append(path)
+        if self.log_path:
+            if self._file is None:
+                self._file = open(self.log_path, 'w', encoding='utf-8')
+                self._file.write("errno\terror\tpath\n")
+            self._file.write(f"{code}\t{message}\t{path}\n")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def format(self, max_groups=FAILURE_SUMMARY_GROUPS):
+        """Ringkasan terstruktur multi-baris, grup terbesar lebih dulu."""
+        if not self.total:
+            return ""
+        groups = sorted(self.groups.items(), key=lambda item: item[1][0], reverse=True)
+        lines = [f"❌ {self.total} kegagalan dalam {len(groups)} grup (errno, folder):"]
+        for (code, folder), (count, message, samples) in groups[:max_groups]:
+            lines.append(f"  - [Errno {code}] {message} | {folder} | {count} item")
+            for sample in samples:
+                lines.append(f"      contoh: {sample}")
+        if len(groups) > max_groups:
+            rest = sum(group[0] for _, group in groups[max_groups:])
+            lines.append(f"  ... dan {len(groups) - max_groups} grup lain ({rest} item).")
+        if self.log_path:
+            lines.append(f"  Daftar lengkap kegagalan: {self.log_path}")
+        return "\n".join(lines)
+
+
+# --- Fase 2: Mesin Penghapusan ---
+
+class CleanupResult:
+    """Ringkasan hasil pembersihan: jumlah item level atas yang terhapus/gagal."""
+
+    def __init__(self, root, failure_log=None):
+        self.root = root
+        self.deleted_count = 0
+        self.failed_count = 0
+        self.removed_items = 0  # Semua file & folder yang terhapus (bukan hanya level atas)
+        self.freed_bytes = None  # Hanya diisi jika ukuran file dilacak
+        self.elapsed = 0.0
+        self.limits = ""  # Deskripsi batas laju / mode yang dipakai run ini
+        self.cancelled = False
+        self.kept_files = 0  # File yang dibiarkan oleh entry_filter
+        self.failures = FailureReport(failure_log)
+
+    def rates(self):
+        """Laju yang benar-benar tercapai selama fase hapus."""
+        elapsed = max(self.elapsed, 1e-6)
+        text = f"Laju tercapai: {self.removed_items / elapsed:.0f} item/s"
+        if self.freed_bytes is not None:
+            text += f", {self.freed_bytes / elapsed / (1024 * 1024):.1f} MB/s"
+        text += f" dalam {self.elapsed:.1f} detik"
+        if self.limits:
+            text += f" (batas: {self.limits})"
+        return text + "."
+
+    def summary(self):
+        text = f"Ringkasan: {self.deleted_count} item dihapus, {self.failed_count} item gagal."
+        if self.cancelled:
+            text = "⏹️ Dibatalkan sebelum selesai. " + text
+        if self.freed_bytes is not None:
+            text += f" {format_bytes(self.freed_bytes)} dibebaskan."
+        if self.kept_files:
+            text += f" {self.kept_files} file dilewati oleh filter."
+        text += "\n" + self.rates()
+        if self.failures.total:
+            text += "\n" + self.failures.format()
+        return text
+
+
+class _Node:
+    """Satu item yang sedang dihapus. Folder menunggu semua anaknya selesai sebelum di-rmdir."""
+
+    __slots__ = ("kind", "path", "payload", "parent", "remaining", "failed", "kept", "incomplete")
+
+    def __init__(self, kind, path, payload, parent=None):
+        self.kind = kind  # 'file', 'files' (batch), 'dir', atau 'rmdir'
+        self.path = path
+        self.payload = payload  # (path, size), list of (path, size), atau path folder
+        self.parent = parent
+        self.remaining = 0
+        self.failed = False
+        self.kept = False  # Ada file di dalamnya yang sengaja dibiarkan oleh filter
+        self.incomplete = False  # Dibatalkan sebelum semua isinya diproses
+
+
+def _cancelled(cancel):
+    return cancel is not None and cancel.cancelled
+
+
+def _unlink_all(files, errors, limiter=None, cancel=None):
+    """Mengembalikan (items, bytes, complete); complete False jika berhenti karena dibatalkan."""
+    items, freed = 0, 0
+    for path, size in files:
+        if _cancelled(cancel):
+            return items, freed, False
+        if limiter:
+            limiter.acquire(1, size, cancel)
+            # acquire() kembali lebih awal saat dibatalkan; file ini tidak boleh dihapus lagi
+            if _cancelled(cancel):
+                return items, freed, False
+        try:
+            os.unlink(path)
+        except OSError as e:
+            errors.append((path, e))
+        else:
+            items += 1
+            freed += size
+    return items, freed, True
+
+
+def _rmdir(path, errors, limiter=None, cancel=None):
+    """1 jika terhapus, 0 jika gagal (dicatat di `errors`), None jika dibatalkan lebih dulu."""
+    if limiter:
+        limiter.acquire(1, 0, cancel)
+    if _cancelled(cancel):
+        return None
+    try:
+        os.rmdir(path)
+    except OSError as e:
+        errors.append((path, e))
+        return 0
+    return 1
+
+
+def _run_node(kind, payload, split_threshold, want_sizes, limiter, cancel, entry_filter):
+    """
+    Dijalankan di worker thread. Mengembalikan (children, errors, items, bytes, kept,
+    complete), di mana children adalah list node yang harus selesai sebelum folder ini
+    bisa di-rmdir, items/bytes adalah jumlah yang benar-benar terhapus oleh task ini, kept
+    adalah jumlah file yang dibiarkan oleh `entry_filter`, dan complete False jika task
+    berhenti karena dibatalkan sebelum semua item-nya diproses.
+    """
+    errors = []
+    if kind in ('file', 'files'):
+        items, freed, complete = _unlink_all((payload,) if kind == 'file' else payload, errors, limiter, cancel)
+        return None, errors, items, freed, 0, complete
+    if kind == 'rmdir':
+        removed = _rmdir(payload, errors, limiter, cancel)
+        return None, errors, removed or 0, 0, 0, removed is not None
+
+    # kind == 'dir': satu kali scandir, tipe (dan ukuran) diambil dari cache DirEntry
+    files, links, children, kept = [], [], [], 0
+    try:
+        for entry in iter_entries(payload):
+            if is_plain_dir(entry):
+                children.append(('dir', entry.path, entry.path))
+            elif entry_filter is not None and not entry_filter(entry):
+                kept += 1
+            elif _is_dir_link(entry):
+                links.append(entry.path)
+            else:
+                files.append((entry.path, _entry_size(entry) if want_sizes else 0))
+    except OSError as e:
+        errors.append((payload, e))
+        return None, errors, 0, 0, 0, True
+
+    items, freed, complete = 0, 0, True
+    for link in links:
+        removed = _rmdir(link, errors, limiter, cancel)
+        if removed is None:
+            complete = False
+            break
+        items += removed
+    if complete and len(files) < split_threshold:
+        removed, freed, complete = _unlink_all(files, errors, limiter, cancel)
+        items += removed
+    elif complete:
+        for i in range(0, len(files), split_threshold):
+            children.append(('files', payload, files[i:i + split_threshold]))
+    if complete and not children and not errors and not kept:
+        removed = _rmdir(payload, errors, limiter, cancel)
+        if removed is None:
+            complete = False
+        else:
+            items += removed
+    return children, errors, items, freed, kept, complete
+
+
+class DeletionEngine:
+    """
+    Menghapus isi sebuah folder secara paralel.
+
+    Item level atas dibaca secara streaming dari os.scandir lalu dikirim ke
+    ThreadPoolExecutor. Setiap subfolder menjadi task sendiri dan file dalam folder
+    besar dipecah menjadi batch, lalu folder induknya di-rmdir setelah semua anak
+    selesai. Semua callback (`log`, `progress`) dipanggil dari thread pemanggil, bukan
+    dari worker pool, sehingga aman dipakai dengan add_log() di GUI thread maupun
+    output_signal.emit di Worker.
+    """
+
+    def __init__(self, max_workers=None, split_threshold=SPLIT_THRESHOLD, background=False,
+                 max_files_per_sec=None, max_mb_per_sec=None):
+        self.max_workers = max_workers or default_worker_count()
+        self.split_threshold = split_threshold
+        self.background = background
+        self.limiter = None
+        if max_files_per_sec or max_mb_per_sec:
+            self.limiter = RateLimiter(max_files_per_sec, max_mb_per_sec)
+
+    def describe_limits(self):
+        parts = [self.limiter.describe()] if self.limiter else []
+        if self.background:
+            parts.append("mode latar belakang")
+        return ", ".join(parts)
+
+    def _pool(self):
+        initializer = _enter_background_mode if self.background else None
+        return ThreadPoolExecutor(max_workers=self.max_workers, initializer=initializer)
+
+    def count_contents(self, root, cancel=None, entry_filter=None):
+        """Fase 1: menghitung (items, bytes) di dalam `root` secara paralel per subfolder."""
+        items, total_bytes = 0, 0
+        with self._pool() as pool:
+            futures = []
+            for entry in iter_entries(root):
+                if is_plain_dir(entry):
+                    futures.append(pool.submit(_count_tree, entry.path, cancel, entry_filter))
+                elif entry_filter is None or entry_filter(entry):
+                    items += 1
+                    total_bytes += _entry_size(entry)
+            for future in futures:
+                sub_items, sub_bytes = future.result()
+                items += sub_items
+                total_bytes += sub_bytes
+        return items, total_bytes
+
+    def delete_contents(self, root, log=None, progress=None, failure_log=None, cancel=None,
+                        entry_filter=None):
+        """
+        Menghapus semua item di dalam `root` (folder `root` sendiri tetap ada).
+
+        Jika `progress` diberikan, pembersihan berjalan dua fase: hitung dulu, lalu
+        hapus sambil memanggil `progress(CleanupProgress)` secara berkala. Kegagalan
+        dikumpulkan di `result.failures`; jika `failure_log` diberikan, daftar
+        lengkapnya juga ditulis ke file tersebut. Jika `cancel` dibatalkan, tidak ada
+        pekerjaan baru yang dijadwalkan dan fungsi kembali setelah task yang berjalan selesai.
+        `entry_filter(DirEntry) -> bool` menentukan file mana yang boleh dihapus.
+        """
+        result = CleanupResult(root, failure_log)
+        tracker = None
+        if progress:
+            if log:
+                log(f"Fase 1/2: Menghitung isi {root}...")
+            total_items, total_bytes = self.count_contents(root, cancel, entry_filter)
+            if log:
+                log(f"Ditemukan {total_items} item ({format_bytes(total_bytes)}). Fase 2/2: Menghapus...")
+            tracker = CleanupProgress(total_items, total_bytes, progress)
+            tracker.report(force=True)
+
+        # Ukuran file hanya dibaca jika dibutuhkan (progres atau batas MB/detik).
+        want_sizes = tracker is not None or (self.limiter is not None and self.limiter.limits_bytes)
+        if want_sizes:
+            result.freed_bytes = 0
+        result.limits = self.describe_limits()
+        start_time = time.monotonic()
+        pending = {}
+        ready = deque()
+        max_inflight = self.max_workers * INFLIGHT_PER_WORKER
+        top_level = iter_entries(root)
+
+        def fail(node, path, error):
+            node.failed = True
+            result.failures.add(path, error)
+
+        def finish(node):
+            # Naik ke induk: jadwalkan rmdir folder yang anaknya sudah habis,
+            # hitung item level atas yang selesai.
+            # Item yang baru sebagian diproses saat dibatalkan tidak dihitung terhapus.
+            parent = node.parent
+            if parent is None:
+                if node.failed:
+                    result.failed_count += 1
+                elif not node.kept and not node.incomplete:
+                    result.deleted_count += 1
+                return
+            if node.failed:
+                parent.failed = True
+            if node.kept:
+                parent.kept = True
+            if node.incomplete:
+                parent.incomplete = True
+            parent.remaining -= 1
+            if parent.remaining > 0:
+                return
+            if parent.failed or parent.kept or parent.incomplete:
+                finish(parent)
+            else:
+                parent.kind = 'rmdir'
+                ready.append(parent)
+
+        def refill(pool):
+            while len(pending) < max_inflight:
+                if cancel is not None and cancel.cancelled:
+                    return
+                if ready:
+                    node = ready.popleft()
+                else:
+                    entry = next(top_level, None)
+                    if entry is None:
+                        return
+                    if is_plain_dir(entry):
+                        node = _Node('dir', entry.path, entry.path)
+                    elif entry_filter is not None and not entry_filter(entry):
+                        result.kept_files += 1
+                        continue
+                    elif _is_dir_link(entry):
+                        node = _Node('rmdir', entry.path, entry.path)
+                    else:
+                        size = _entry_size(entry) if want_sizes else 0
+                        node = _Node('file', entry.path, (entry.path, size))
+                future = pool.submit(_run_node, node.kind, node.payload,
+                                     self.split_threshold, want_sizes, self.limiter, cancel,
+                                     entry_filter)
+                pending[future] = node
+
+        with self._pool() as pool:
+            refill(pool)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    try:
+                        children, errors, items, freed, kept, complete = future.result()
+                    except Exception as e:
+                        children, errors, items, freed, kept, complete = None, [(node.path, e)], 0, 0, 0, True
+                    if not complete:
+                        node.incomplete = True
+                    if kept:
+                        node.kept = True
+                        result.kept_files += kept
+                    result.removed_items += items
+                    if want_sizes:
+                        result.freed_bytes += freed
+                    if tracker:
+                        tracker.add(items, freed)
+                    for path, error in errors:
+                        fail(node, path, error)
+                    if children:
+                        node.remaining = len(children)
+                        ready.extend(_Node(kind, path, payload, node) for kind, path, payload in children)
+                    else:
+                        finish(node)
+                refill(pool)
+                if tracker:
+                    tracker.report()
+
+        result.elapsed = time.monotonic() - start_time
+        result.cancelled = cancel is not None and cancel.cancelled
+        result.failures.close()
+        if tracker:
+            tracker.report(force=True)
+        return result
+
+
+# --- Pembersihan Instan: Rename-Aside + Purge Latar Belakang ---
+
+_registry_lock = threading.Lock()
+
+
+def _registry_path():
+    return os.path.join(app_data_dir(), "tombstones.txt")
+
+
+def _read_registry():
+    try:
+        with open(_registry_path(), encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def _write_registry(paths):
+    tmp_path = _registry_path() + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(path + "\n" for path in paths)
+    os.replace(tmp_path, _registry_path())
+
+
+def _register_tombstone(path):
+    with _registry_lock:
+        paths = _read_registry()
+        if path not in paths:
+            _write_registry(paths + [path])
+
+
+def _unregister_tombstone(path):
+    with _registry_lock:
+        _write_registry([p for p in _read_registry() if p != path])
+
+
+def pending_tombstones():
+    """Tombstone yang tercatat tetapi belum selesai dihapus (misalnya karena aplikasi crash)."""
+    with _registry_lock:
+        paths = _read_registry()
+        existing = [p for p in paths if os.path.isdir(p)]
+        if len(existing) != len(paths):
+            _write_registry(existing)
+    return existing
+
+
+def set_aside(path, log=None):
+    """
+    Mengosongkan `path` secara instan dan mengembalikan path tombstone-nya.
+
+    Pertama dicoba rename atomik seluruh folder ke tombstone di folder induk yang sama
+    (volume yang sama), lalu folder kosong dibuat ulang. Jika rename gagal (misalnya
+    ada handle terbuka di dalam %TEMP%), setiap item level atas dipindahkan satu per
+    satu ke tombstone; item yang terkunci dibiarkan di tempat.
+    """
+    path = os.path.abspath(path)
+    parent, name = os.path.split(path.rstrip("\\/"))
+    stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    tombstone = os.path.join(parent, f"{name}{TOMBSTONE_MARKER}{stamp}-{os.getpid()}")
+    # Dicatat sebelum rename, agar tombstone tetap ditemukan meskipun aplikasi crash.
+    _register_tombstone(tombstone)
+    try:
+        os.rename(path, tombstone)
+        os.mkdir(path)
+        if log:
+            log(f"Folder {path} dipindahkan ke {tombstone}.")
+        return tombstone
+    except OSError as e:
+        if not os.path.isdir(path):
+            os.mkdir(path)
+        if not os.path.isdir(tombstone):
+            os.mkdir(tombstone)
+        if log:
+            log(f"Rename folder tidak bisa dilakukan ({e}), memindahkan isi satu per satu...")
+
+    moved, locked = 0, 0
+    for entry in iter_entries(path):
+        try:
+            os.rename(entry.path, os.path.join(tombstone, entry.name))
+            moved += 1
+        except OSError:
+            locked += 1
+    if log:
+        log(f"{moved} item dipindahkan ke {tombstone}, {locked} item terkunci dibiarkan.")
+    return tombstone
+
+
+def purge_tombstone(tombstone, log=None, engine=None, failure_log=None):
+    """
+    Menghapus tombstone lalu mencabutnya dari registry. Tanpa `engine`, dipakai worker
+    berprioritas rendah; `failure_log` sama seperti pada DeletionEngine.delete_contents.
+    """
+    engine = engine or DeletionEngine(max_workers=BACKGROUND_WORKERS, background=True)
+    result = engine.delete_contents(tombstone, failure_log=failure_log)
+    try:
+        os.rmdir(tombstone)
+    except OSError:
+        pass
+    if not os.path.isdir(tombstone):
+        _unregister_tombstone(tombstone)
+    if log:
+        log(f"🧹 Purge latar belakang {tombstone} selesai. {result.summary()}")
+    return result
+
+
+def start_background_purge(tombstones, log=None, engine_factory=None, failure_log=None):
+    """
+    Menjalankan purge_tombstone untuk setiap tombstone di daemon thread terpisah.
+
+    `engine_factory()` membuat DeletionEngine dengan opsi pembersihan pengguna (batas laju,
+    mode latar belakang); tanpa itu dipakai engine berprioritas rendah bawaan purge_tombstone.
+    """
+    def log_path(index):
+        # Satu file daftar kegagalan per tombstone, agar tidak saling menimpa
+        if not failure_log or len(tombstones) == 1:
+            return failure_log
+        base, ext = os.path.splitext(failure_log)
+        return f"{base}_{index + 1}{ext}"
+
+    def run():
+        _enter_background_mode()
+        for index, tombstone in enumerate(tombstones):
+            try:
+                engine = engine_factory() if engine_factory else None
+                purge_tombstone(tombstone, log, engine, log_path(index))
+            except Exception as e:
+                if log:
+                    log(f"❌ Purge latar belakang {tombstone} gagal: {e}")
+
+    thread = threading.Thread(target=run, name="MacanTombstonePurge", daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_purge(thread, cancel=None, log=None):
+    """
+    Menunggu thread dari start_background_purge (mode headless: proses tidak boleh keluar
+    sebelum purge selesai). Jika `cancel` dibatalkan, berhenti menunggu; tombstone yang
+    tersisa tetap tercatat dan dilanjutkan oleh pending_tombstones() pada run berikutnya.
+    """
+    while thread.is_alive():
+        if cancel is not None and cancel.cancelled:
+            if log:
+                log("⏹️ Dibatalkan; sisa tombstone akan di-purge pada run berikutnya.")
+            return False
+        thread.join(0.5)
+    return True
@@ -0,0 +1,274 @@
+# Nama File: macan_cli.py
+# Deskripsi: Mode headless Macan Conquer untuk eksekusi terskrip di banyak mesin. Menjalankan
+#            aksi perawatan yang sama dengan GUI tanpa membuat QApplication, stylesheet, atau
+#            widget apa pun, dan melaporkan progres sebagai NDJSON di stdout.
+#
+# Cara Menjalankan (hak Administrator):
+#   python macan_cli.py --list
+#   python macan_cli.py sfc dism
+#   python macan_cli.py chkdsk defrag --volumes C: D:
+#   python macan_cli.py clean-temp clean-update-cache --instant
+#   (purge tombstone ditunggu sampai selesai sebelum proses keluar; tombstone yang tertinggal
+#   dari run atau sesi GUI sebelumnya di-purge sebagai tugas 'purge-tombstones')
+#   python macan_conquer7.py --headless reset-icon-cache
+#
+# Output (satu objek JSON per baris):
+#   {"event": "start", "task": "sfc /scannow", ...}
+#   {"event": "log", "task": ..., "text": ...}
+#   {"event": "progress", "task": ..., "value": 42, "text": "Verifikasi: 42%"}
+#   {"event": "usage", "task": ..., "cpu_percent": ..., "rss": ..., "io_rate": ..., "activity": ...}
+#   {"event": "cached", "task": ..., "finished_at": ..., "summary": [...]}
+#   {"event": "end", "task": ..., "state": "selesai" | "gagal" | "dilewati" | "dibatalkan", ...}
+#   {"event": "summary", "states": {...}, "seconds": ...}
+# Exit code: 0 semua tugas selesai, 1 ada yang gagal/dilewati, 2 argumen salah, 130 dibatalkan (Ctrl+C).
+#
+# Aksi dijadwalkan lewat Scheduler (macan_scheduler.py) dengan resource yang sama seperti di
+# GUI, sehingga misalnya chkdsk di disk fisik berbeda berjalan bersamaan.
+# Modul ini tidak meng-import PySide6.
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+from macan_cleanup import DeletionEngine, pending_tombstones, start_background_purge, wait_for_purge
+from macan_pipeline import (
+    DEFAULT_TARGETS, TEMP_FILES, UPDATE_CACHE, ICON_CACHE, PipelineProgress, run_pipeline
+)
+from macan_results import ResultCache
+from macan_scheduler import DONE, CANCELLED, Scheduler, Task
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+SFC_ARGS = ["/scannow"]
+DISM_ARGS = ["/Online", "/Cleanup-image", "/Restorehealth"]
+
+ACTIONS = {
+    "sfc": "System File Checker (sfc /scannow); hasil bersih yang masih berlaku dipakai ulang",
+    "dism": "DISM RestoreHealth; hasil bersih yang masih berlaku dipakai ulang",
+    "chkdsk": "Scan Disk read-only untuk --volumes (default: semua volume lokal)",
+    "defrag": "Defrag / Optimize untuk --volumes (default: semua volume lokal)",
+    "clean-temp": "Clear Temporary Files",
+    "clean-update-cache": "Clear Windows Update Cache (stop/start wuauserv & bits)",
+    "reset-icon-cache": "Reset Icon Cache (restart Explorer)",
+    "clean-all": "Temp, cache Windows Update, dan cache ikon sekaligus",
+    "safe-mode-on": "bcdedit: boot ke Safe Mode (minimal) saat restart berikutnya",
+    "safe-mode-off": "bcdedit: hapus pengaturan boot Safe Mode",
+}
+
+
+class NdjsonWriter:
+    """Menulis event sebagai satu baris JSON; aman dipanggil dari thread mana pun."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def write(self, event, **fields):
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **fields}, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class _Emitter:
+    """Objek ber-emit() untuk fungsi tugas (konvensi output_signal/progress_signal GUI)."""
+
+    def __init__(self, callback):
+        self.emit = callback
+
+
+def _usage_fields(sample):
+    return {
+        "cpu_percent": round(sample.cpu_percent, 1),
+        "rss": sample.rss,
+        "read_bytes": sample.read_bytes,
+        "write_bytes": sample.write_bytes,
+        "io_rate": round(sample.io_rate),
+        "threads": sample.threads,
+        "processes": sample.processes,
+        "activity": sample.activity,
+    }
+
+
+def make_task(writer, name, function, *args, resources=(), **kwargs):
+    """Task Scheduler yang menerjemahkan sinyal fungsi tugas menjadi event NDJSON."""
+    state = {"value": 0}
+
+    def progress(value):
+        state["value"] = value
+        writer.write("progress", task=name, value=value)
+
+    def progress_text(text):
+        writer.write("progress", task=name, value=state["value"], text=text)
+
+    def run(cancel_token):
+        writer.write("start", task=name)
+        function(*args, **kwargs,
+                 output_signal=_Emitter(lambda text: writer.write("log", task=name, text=text)),
+                 progress_signal=_Emitter(progress),
+                 progress_text_signal=_Emitter(progress_text),
+                 usage_signal=_Emitter(lambda sample: writer.write("usage", task=name, **_usage_fields(sample))),
+                 cancel_token=cancel_token)
+
+    return Task(name, run, resources=resources)
+
+
+def _run_command(program, args, progress_type=None, **kwargs):
+    from macan_commands import run_command_with_progress  # subprocess hanya dimuat jika ada perintah eksternal
+    return run_command_with_progress(program, args, progress_type, **kwargs)
+
+
+def _run_cleanup(targets, instant=False, **kwargs):
+    output_signal = kwargs.get('output_signal')
+    progress_signal = kwargs.get('progress_signal')
+    run_pipeline(targets, log=output_signal.emit,
+                 progress=PipelineProgress(targets, lambda progress: progress_signal.emit(progress.percent())),
+                 cancel=kwargs.get('cancel_token'), engine_factory=DeletionEngine,
+                 instant=instant, purge_log=output_signal.emit, wait_purge=True)
+    kwargs.get('cancel_token').raise_if_cancelled()  # Pipeline yang terpotong berakhir 'dibatalkan'
+
+
+def _purge_leftovers(tombstones, **kwargs):
+    output_signal = kwargs.get('output_signal')
+    output_signal.emit(f"🧹 Melanjutkan purge {len(tombstones)} tombstone dari sesi sebelumnya...")
+    purge = start_background_purge(tombstones, log=output_signal.emit, engine_factory=DeletionEngine)
+    if not wait_for_purge(purge, kwargs.get('cancel_token'), output_signal.emit):
+        kwargs.get('cancel_token').raise_if_cancelled()
+
+
+def _select_volumes(letters):
+    from macan_volumes import fixed_volumes  # psutil hanya dimuat untuk aksi per volume
+    volumes = fixed_volumes()
+    if not letters:
+        return volumes
+    wanted = {letter.upper().rstrip("\\") for letter in letters}
+    wanted = {letter if letter.endswith(":") else letter + ":" for letter in wanted}
+    return [volume for volume in volumes if volume.letter.upper() in wanted]
+
+
+def build_tasks(writer, actions, args):
+    """Task untuk setiap aksi yang diminta; hasil sfc/DISM yang masih berlaku dilaporkan sebagai 'cached'."""
+    cache = ResultCache()
+    command = _run_command
+    command_kwargs = {"result_cache": cache}
+    tasks = []
+    for action in actions:
+        if action in ("sfc", "dism"):
+            program, program_args = ("sfc", SFC_ARGS) if action == "sfc" else ("DISM.exe", DISM_ARGS)
+            name = " ".join([action] + program_args)
+            cached = None if args.no_cache else cache.lookup(program, program_args)
+            if cached is not None:
+                writer.write("cached", task=name, command=cached.command_line, finished_at=cached.finished_at,
+                             returncode=cached.returncode, summary=cached.summary)
+                continue
+            tasks.append(make_task(writer, name, command, program, program_args, action,
+                                   resources={"servicing"}, **command_kwargs))
+        elif action in ("chkdsk", "defrag"):
+            volumes = _select_volumes(args.volumes)
+            if not volumes:
+                writer.write("log", task=action, text="Tidak ada volume lokal yang cocok.")
+            for volume in volumes:
+                program_args = [volume.letter] if action == "chkdsk" else [volume.letter, "/O"]
+                tasks.append(make_task(writer, f"{action} {volume.letter}", command, action, program_args,
+                                       resources=volume.resources, **command_kwargs))
+        elif action == "clean-temp":
+            tasks.append(make_task(writer, action, _run_cleanup, [TEMP_FILES], args.instant, resources={"temp"}))
+        elif action == "clean-update-cache":
+            tasks.append(make_task(writer, action, _run_cleanup, [UPDATE_CACHE], args.instant, resources={"wuauserv"}))
+        elif action == "reset-icon-cache":
+            tasks.append(make_task(writer, action, _run_cleanup, [ICON_CACHE], args.instant, resources={"explorer"}))
+        elif action == "clean-all":
+            tasks.append(make_task(writer, action, _run_cleanup, list(DEFAULT_TARGETS), args.instant,
+                                   resources={"temp", "wuauserv", "explorer"}))
+        elif action == "safe-mode-on":
+            tasks.append(make_task(writer, action, command, "bcdedit", ["/set", "{current}", "safeboot", "minimal"],
+                                   resources={"bcd"}))
+        elif action == "safe-mode-off":
+            tasks.append(make_task(writer, action, command, "bcdedit", ["/deletevalue", "{current}", "safeboot"],
+                                   resources={"bcd"}))
+    return tasks
+
+
+def is_admin():
+    if os.name != "nt":
+        return os.geteuid() == 0
+    try:
+        import ctypes
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="macan_cli", description="Macan Conquer tanpa GUI (output NDJSON).")
+    parser.add_argument("actions", nargs="*", metavar="AKSI", help="Aksi yang dijalankan (lihat --list).")
+    parser.add_argument("--list", action="store_true", help="Tampilkan daftar aksi.")
+    parser.add_argument("--volumes", nargs="+", metavar="VOL", help="Volume untuk chkdsk/defrag, misalnya C: D:.")
+    parser.add_argument("--instant", action="store_true", help="Pembersihan instan (rename ke tombstone, purge di latar belakang).")
+    parser.add_argument("--no-cache", action="store_true", help="Selalu jalankan sfc/DISM penuh walaupun ada hasil tersimpan.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, description in ACTIONS.items():
+            print(f"{name:<20} {description}")
+        return EXIT_OK
+    unknown = [action for action in args.actions if action not in ACTIONS]
+    if unknown or not args.actions:
+        parser.error(f"aksi tidak dikenal: {', '.join(unknown)}" if unknown else "tidak ada aksi (lihat --list)")
+
+    writer = NdjsonWriter()
+    if not is_admin():
+        writer.write("warning", text="Tidak berjalan sebagai Administrator; sebagian aksi akan gagal.")
+    start = time.monotonic()
+    tasks = build_tasks(writer, args.actions, args)
+    try:
+        leftovers = pending_tombstones()
+    except Exception as e:
+        leftovers = []
+        writer.write("warning", text=f"Gagal membaca daftar tombstone: {e}")
+    if leftovers:
+        tasks.append(make_task(writer, "purge-tombstones", _purge_leftovers, leftovers))
+    if not tasks:
+        writer.write("summary", states={}, seconds=0.0)
+        return EXIT_OK
+
+    done = threading.Event()
+
+    def on_change(task):
+        if task.finished:
+            fields = {"state": task.state, "seconds": round(task.duration, 3)}
+            if task.error is not None:
+                fields["error"] = str(task.error)
+            writer.write("end", task=task.name, **fields)
+            if task.graph is not None and task.graph.done:
+                done.set()
+
+    scheduler = Scheduler(on_change=on_change)
+    graph = scheduler.submit(tasks, "headless")
+    cancelled = False
+    while not done.is_set():
+        try:
+            done.wait(0.5)  # Timeout pendek agar Ctrl+C tetap terbaca di Windows
+        except KeyboardInterrupt:
+            cancelled = True
+            writer.write("log", task="headless", text="Membatalkan semua tugas...")
+            scheduler.cancel_all()
+    scheduler.shutdown()
+
+    states = {}
+    for task in graph.tasks:
+        states[task.state] = states.get(task.state, 0) + 1
+    writer.write("summary", states=states, seconds=round(time.monotonic() - start, 3))
+    if cancelled or states.get(CANCELLED):
+        return EXIT_CANCELLED
+    return EXIT_OK if states.get(DONE, 0) == len(graph.tasks) else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# Nama File: macan_commands.py
+# Deskripsi: Menjalankan satu perintah eksternal (sfc, DISM, chkdsk, defrag, bcdedit) dengan
+#            semua fitur pendukungnya: pembacaan output per chunk (macan_stream.py), parser
+#            progress (macan_progress.py), monitor resource (macan_monitor.py), watchdog
+#            (macan_watchdog.py), dan cache hasil (macan_results.py).
+#
+# Dipakai oleh GUI (macan_conquer7.py) maupun mode headless (macan_cli.py), dengan konvensi
+# fungsi tugas yang sama: output_signal, progress_signal, progress_text_signal,
+# usage_signal (opsional), dan cancel_token diberikan sebagai keyword argument.
+#
+# Modul ini tidak meng-import PySide6.
+
+import collections
+import os
+import subprocess
+
+from macan_monitor import ProcessTreeMonitor
+from macan_progress import command_key, create_parser
+from macan_results import SUMMARY_LINES
+from macan_stream import LINE, iter_stream
+from macan_tasks import kill_process_tree
+from macan_watchdog import Watchdog, limits_for
+
+
+def run_command_with_progress(program, args, progress_type=None, watchdog_limits=None, result_cache=None,
+                              active_watchdogs=None, **kwargs):
+    """
+    Menjalankan `program args` sampai selesai; mengembalikan exit code.
+
+    TaskCancelled jika dibatalkan, WatchdogExpired jika dihentikan watchdog. Hasil bersih
+    disimpan ke `result_cache` jika ada policy untuk perintah ini. Watchdog yang aktif
+    dimasukkan ke `active_watchdogs` (set) selama perintah berjalan.
+    """
+    output_signal = kwargs.get('output_signal')
+    progress_signal = kwargs.get('progress_signal')
+    progress_text_signal = kwargs.get('progress_text_signal')
+    usage_signal = kwargs.get('usage_signal')
+    cancel_token = kwargs.get('cancel_token')
+    output_signal.emit(f"🚀 Memulai: {program} {' '.join(args)}")
+    # Pipe biner tanpa buffer: iter_stream membaca per chunk, men-decode secara incremental
+    # (encoding ditebak sekali), lalu memecah pada '\r' dan '\n'
+    extra = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {}
+    process = subprocess.Popen([program] + list(args), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               bufsize=0, **extra)
+    # Saat dibatalkan, process tree dimatikan sehingga pembacaan di bawah langsung EOF
+    unregister = cancel_token.on_cancel(lambda: kill_process_tree(process.pid))
+    # Watchdog memeriksa batas waktu dan stall setiap sampel monitor
+    watchdog = Watchdog(process.pid, limits_for(command_key(program), watchdog_limits), output_signal.emit)
+    if active_watchdogs is not None:
+        active_watchdogs.add(watchdog)
+
+    def on_sample(sample):
+        if usage_signal:
+            usage_signal.emit(sample)
+        watchdog.check(sample)
+
+    monitor = ProcessTreeMonitor(process.pid, on_sample).start()
+    parser = create_parser(progress_type or program)
+    # Baris terakhir untuk cache hasil
+    tail = collections.deque(maxlen=SUMMARY_LINES) if result_cache and result_cache.policy(program) else None
+    try:
+        for kind, text in iter_stream(process.stdout):
+            watchdog.touch()
+            clean_line = text.strip()
+            if not clean_line:
+                continue
+            # Frame progress yang digambar ulang dengan '\r' hanya dipakai untuk progress
+            if kind == LINE:
+                output_signal.emit(clean_line)
+                if tail is not None:
+                    tail.append(clean_line)
+            value = parser.feed(clean_line) if parser else None
+            if value is not None:
+                progress_signal.emit(value)
+                if parser.label and progress_text_signal:
+                    progress_text_signal.emit(f"{parser.label}: {value}%")
+        process.stdout.close()
+        process.wait()
+    finally:
+        monitor.stop()
+        if active_watchdogs is not None:
+            active_watchdogs.discard(watchdog)
+        unregister()
+    cancel_token.raise_if_cancelled()
+    watchdog.raise_if_expired()
+    if tail is not None and result_cache.store(program, args, process.returncode, tail):
+        output_signal.emit("💾 Hasil bersih disimpan; pemindaian berikutnya bisa memakai hasil ini selama tidak ada perubahan.")
+    return process.returncode
@@ -12,6 +12,7 @@
 # - [FITUR] Ditambahkan System Info Dashboard di bagian atas untuk menampilkan
 #           informasi OS, CPU, RAM, dan Uptime secara real-time.
 # - [DEPENDENSI] Menambahkan 'psutil' untuk mengambil data System Info.
+# - [PERFORMA] Clear Temp & Update Cache memakai mesin penghapusan paralel (macan_cleanup.py).
 #
 # Cara Menjalankan:
 # 1. Install PySide6 dan psutil: pip install pyside6 psutil
@@ -25,7 +26,6 @@ import sys
 import os
 import ctypes
 import subprocess
-import shutil
 import tempfile
 import re
 import platform
@@ -40,6 +40,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import QProcess, Qt, QThread, QObject, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon, QPixmap, QAction
 
+# [BARU] Mesin penghapusan paralel bersama (macan_cleanup.py)
+from macan_cleanup import DeletionEngine
+
 # --- [BARU] Worker Thread untuk Proses Latar Belakang ---
 class Worker(QObject):
     """
@@ -482,18 +485,9 @@ class MacanConquerApp(QMainWindow):
     def _clear_temp_action(self, **kwargs):
         output_signal = kwargs.get('output_signal')
         temp_dir = tempfile.gettempdir()
-        deleted_count, failed_count = 0, 0
         output_signal.emit(f"Membersihkan direktori: {temp_dir}")
-        for item in os.listdir(temp_dir):
-            path = os.path.join(temp_dir, item)
-            try:
-                if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                elif os.path.isdir(path): shutil.rmtree(path)
-                deleted_count += 1
-            except Exception as e:
-                output_signal.emit(f"Gagal menghapus {path}: {e}")
-                failed_count += 1
-        output_signal.emit(f"\nRingkasan: {deleted_count} item dihapus, {failed_count} item gagal.")
+        result = DeletionEngine().delete_contents(temp_dir, log=output_signal.emit)
+        output_signal.emit(f"\n{result.summary()}")
 
     def _clear_update_cache_action(self, **kwargs):
         output_signal = kwargs.get('output_signal')
@@ -504,22 +498,12 @@ class MacanConquerApp(QMainWindow):
         
         cache_dir = r"C:\Windows\SoftwareDistribution\Download"
         output_signal.emit(f"Menghapus isi dari {cache_dir}...")
-        deleted_count, failed_count = 0, 0
         try:
-            for item in os.listdir(cache_dir):
-                path = os.path.join(cache_dir, item)
-                try:
-                    if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                    elif os.path.isdir(path): shutil.rmtree(path)
-                    deleted_count += 1
-                except Exception as e:
-                    output_signal.emit(f"Gagal menghapus {path}: {e}")
-                    failed_count += 1
+            result = DeletionEngine().delete_contents(cache_dir, log=output_signal.emit)
+            output_signal.emit(result.summary())
         except Exception as e:
             output_signal.emit(f"Error mengakses {cache_dir}: {e}")
 
-        output_signal.emit(f"Ringkasan: {deleted_count} item dihapus, {failed_count} gagal.")
-
         commands = [("net", "start", "wuauserv"), ("net", "start", "bits")]
         for cmd in commands:
             output_signal.emit(f"Menjalankan: {' '.join(cmd)}")
@@ -10,55 +10,191 @@
 # - [FITUR] Ditambahkan fungsi 'Save Log...' di menu File.
 # - [FITUR] Ditambahkan System Info Dashboard (OS, CPU, RAM, Uptime).
 # - [DEPENDENSI] Menambahkan 'psutil' untuk mengambil data System Info.
+# - [PERFORMA] Clear Temp & Update Cache memakai mesin penghapusan paralel (macan_cleanup.py).
+# - [FITUR] Tombol 'Preview Pembersihan' (dry-run) dengan inventaris file SQLite (macan_inventory.py).
+# - [FITUR] Progress bar pembersihan berbasis byte & item, lengkap dengan MB/s dan ETA.
+# - [PERFORMA] Kegagalan pembersihan diringkas per errno & folder dalam satu laporan akhir.
+# - [FITUR] Pembersihan Instan: folder di-rename ke tombstone dan di-purge di latar belakang,
+#           sehingga service Windows Update hanya mati beberapa detik.
+#           (opsional di menu File, nonaktif secara default; purge memakai opsi pembersihan
+#           dan daftar kegagalan yang sama dengan mode normal).
+# - [FITUR] 'Opsi Pembersihan...': batas file/s & MB/s dan mode latar belakang per run.
+# - [FITUR] Tombol 'Batal' untuk semua tugas; perintah sfc/DISM/chkdsk dihentikan beserta
+#           process tree-nya (psutil) sehingga aplikasi tidak terkunci sampai proses selesai.
+# - [FITUR] Pipeline pembersihan deklaratif (macan_pipeline.py) dan tombol 'Bersihkan Semua':
+#           target di volume berbeda berjalan paralel dengan progress per target.
+# - [PERFORMA] Progress sfc/DISM/chkdsk/defrag dibaca oleh parser stateful yang dikompilasi
+#           sekali (macan_progress.py); progress bar hanya diperbarui saat nilainya berubah.
+# - [PERFORMA] Output worker digabung per 50 ms / 256 baris menjadi satu sinyal berisi list,
+#           sehingga DISM/chkdsk yang cerewet tidak membanjiri event loop GUI.
+# - [PERBAIKAN] Output perintah dibaca per chunk dan dipecah pada '\r' maupun '\n'
+#           (macan_stream.py): frame progress sfc/DISM langsung sampai ke progress bar.
+# - [PERBAIKAN] Output perintah dibaca sebagai byte ke buffer yang dipakai ulang dan di-decode
+#           incremental; encoding ditebak sekali (UTF-16LE sfc, codepage OEM, atau UTF-8).
+# - [FITUR] Eksekutor perintah asyncio (macan_executor.py) dengan batas jumlah proses bersamaan;
+#           'Diagnosa Read-only Semua Volume' menjalankan chkdsk di semua volume sekaligus.
+# - [FITUR] Penjadwal tugas DAG (macan_scheduler.py) menggantikan kunci global 'is_running':
+#           tugas dengan resource berbeda berjalan bersamaan, status live di panel tugas, dan
+#           'Perawatan Lengkap' selesai dalam waktu critical path-nya.
+# - [FITUR] chkdsk & defrag multi-volume dengan dialog pilihan volume (macan_volumes.py): volume
+#           di disk fisik berbeda berjalan bersamaan, satu disk berurutan; progress bar per tugas.
+# - [FITUR] Monitor resource per tugas (macan_monitor.py): CPU, RAM, I/O, dan thread process tree
+#           sfc/DISM/chkdsk/defrag, dengan periode sampling adaptif (maks. 1% overhead).
+# - [FITUR] Watchdog per perintah (macan_watchdog.py): batas waktu dan deteksi stall (tanpa output
+#           dan tanpa CPU/I-O) dengan aksi peringatan, tangguhkan, atau hentikan process tree.
+# - [PERFORMA] Output disimpan di ring memori + file spool per blok (macan_spool.py); console
+#           dibatasi CONSOLE_MAX_BLOCKS baris, 'Save Log...' dan output per tugas dibaca dari spool.
+# - [PERFORMA] Hasil bersih sfc/DISM di-cache (macan_results.py) dengan fingerprint build OS dan
+#           file servicing; hasil yang masih berlaku ditampilkan langsung, opsi 'Jalankan Ulang'.
+# - [FITUR] Mode headless '--headless' (macan_cli.py): aksi perawatan tanpa PySide6 dengan output
+#           NDJSON, untuk eksekusi terskrip di banyak mesin.
+# - [PERFORMA] Cold start lebih cepat: hak Administrator dicek (dan UAC diminta) sebelum PySide6
+#           di-import; asyncio, sqlite3, psutil, dan modul perintah/volume di-import saat pertama
+#           dipakai. Anggaran waktu import dicek oleh macan_importtime.py.
+# - [FITUR] Profiler fase startup (macan_startup.py): waktu import, QApplication, stylesheet,
+#           setiap create_*_group, dashboard, dan paint pertama (Help > Profil Startup).
+# - [PERFORMA] Dialog Help dan About dibuat saat pertama dibuka lalu dipakai ulang.
 # - [PERBAIKAN] Layout System Information diringkas menjadi 2x2 dan warna font diubah.
 #
 # Cara Menjalankan:
 # 1. Install PySide6 dan psutil: pip install pyside6 psutil
 # 2. Pastikan file "toolbox.ico" dan file .exe lainnya ada di folder yang sama.
 # 3. Jalankan script ini dengan hak Administrator.
+# 4. Tanpa GUI: python macan_conquer7.py --headless sfc clean-temp (lihat macan_cli.py --list)
+# 5. Profil startup: menu Help > Profil Startup, atau set MACAN_STARTUP_PROFILE=profil.json
 
+import time
+_STARTUP_T0 = time.perf_counter()  # [BARU] Titik nol profiler startup, sebelum import lainnya
 import sys
 import os
 import ctypes
-import subprocess
-import shutil
-import tempfile
-import re
-import platform
-import psutil
 from datetime import datetime
+# [DIUBAH] subprocess, platform, psutil, asyncio (macan_executor), sqlite3 (macan_inventory),
+# dan modul perintah/volume di-import saat pertama dipakai, bukan saat startup.
+# Batas waktu import dicek oleh macan_importtime.py.
+
+def is_admin():
+    try: return ctypes.windll.shell32.IsUserAnAdmin()
+    except: return False
+
+def relaunch_as_admin():
+    """[BARU] Meminta hak Administrator lewat UAC tanpa memuat Qt (MessageBox Win32 via ctypes)."""
+    msg = "Aplikasi ini memerlukan hak Administrator untuk berfungsi dengan benar.\n\nKlik 'OK', lalu klik 'Yes' pada jendela UAC yang muncul."
+    ctypes.windll.user32.MessageBoxW(None, msg, "Memerlukan Hak Admin", 0x40)  # MB_ICONINFORMATION
+    # ShellExecuteW mengembalikan nilai <= 32 jika gagal (misalnya UAC ditolak)
+    result = ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
+    if result <= 32:
+        ctypes.windll.user32.MessageBoxW(None, f"Gagal meminta hak Administrator (kode {result}).",
+                                         "Gagal Mendapatkan Hak Admin", 0x10)  # MB_ICONERROR
+    sys.exit(0)
+
+# [BARU] Mode headless dijalankan sebelum PySide6 di-import sama sekali
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    from macan_cli import main as headless_main
+    sys.exit(headless_main([arg for arg in sys.argv[1:] if arg != "--headless"]))
+
+# [BARU] Tanpa hak Administrator, aplikasi langsung dijalankan ulang lewat UAC sebelum PySide6
+# dan modul lain di-import, sehingga hanya proses yang ter-elevasi yang membayar biaya import
+if __name__ == "__main__" and os.name == "nt" and not is_admin():
+    relaunch_as_admin()
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget,
     QTextEdit, QMessageBox, QHBoxLayout, QLabel, QGridLayout, QGroupBox,
-    QDialog, QScrollArea, QProgressBar, QFileDialog
+    QDialog, QScrollArea, QProgressBar, QFileDialog,
+    QFormLayout, QSpinBox, QDoubleSpinBox, QCheckBox, QDialogButtonBox, QInputDialog,
+    QTreeWidget, QTreeWidgetItem, QComboBox, QPlainTextEdit, QTextBrowser
 )
-from PySide6.QtCore import QProcess, Qt, QThread, QObject, Signal, QTimer
+from PySide6.QtCore import QProcess, Qt, QObject, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon, QPixmap, QAction
 
-# --- Worker Thread untuk Proses Latar Belakang ---
-class Worker(QObject):
-    finished = Signal()
-    output_ready = Signal(str)
-    progress_updated = Signal(int)
+# [BARU] Mesin penghapusan paralel bersama (macan_cleanup.py)
+from macan_cleanup import (
+    DeletionEngine, default_failure_log_path, format_bytes, start_background_purge, pending_tombstones
+)
+from macan_progress import create_parser
+from macan_stream import LINE
+from macan_pipeline import (
+    DEFAULT_TARGETS, TEMP_FILES, UPDATE_CACHE, ICON_CACHE, START_UPDATE_SERVICES, STOP_UPDATE_SERVICES,
+    PipelineProgress, run_pipeline
+)
+from macan_spool import OutputSpool, purge_stale_spools
+from macan_scheduler import (
+    Task, Scheduler, PENDING, RUNNING, DONE, FAILED, SKIPPED, CANCELLED
+)
+from macan_tasks import OutputBatcher, TaskCancelled
+from macan_watchdog import ACTIONS, DEFAULT_LIMITS, KILL, WatchdogLimits
+from macan_startup import StartupProfiler
+
+# [BARU] Profiler fase startup (macan_startup.py); fase 'import' berakhir di sini
+STARTUP = StartupProfiler(_STARTUP_T0)
+STARTUP.mark("import")
 
-    def __init__(self, function, *args, **kwargs):
-        super().__init__()
-        self.function = function
-        self.args = args
-        self.kwargs = kwargs
+# [BARU] Ikon status tugas di panel tugas
+STATE_ICONS = {PENDING: "⏳", RUNNING: "▶️", DONE: "✅", FAILED: "❌", SKIPPED: "⏭️", CANCELLED: "⏹️"}
+# [BARU] Baris maksimum di console; log lengkap tersimpan di OutputSpool
+CONSOLE_MAX_BLOCKS = 5000
+OUTPUT_VIEW_LINES = 2000  # Baris per halaman di jendela output tugas
 
-    def run(self):
-        try:
-            self.function(
-                *self.args, **self.kwargs,
-                progress_signal=self.progress_updated,
-                output_signal=self.output_ready
-            )
-        except Exception as e:
-            self.output_ready.emit(f"❌ Terjadi kesalahan fatal di worker thread: {e}")
-        finally:
-            self.finished.emit()
+# [BARU] Isi dialog Help dan About; dialognya sendiri baru dibuat saat pertama dibuka
+HELP_HTML = """
+<h2>Macan Conquer - Bantuan</h2>
+<p>Semua fungsi memerlukan hak Administrator. Setiap tombol menjalankan tugas di panel tugas;
+tugas yang tidak memakai resource yang sama berjalan bersamaan. Klik dua kali sebuah tugas
+untuk melihat output lengkapnya, dan tekan <b>Batal</b> untuk menghentikan tugas yang berjalan.</p>
+<h3>System Repair &amp; Integrity</h3>
+<ul>
+<li><b>System File Checker</b> - menjalankan <code>sfc /scannow</code>. Jika tidak ada perubahan sejak
+pemindaian bersih terakhir, hasil sebelumnya ditawarkan tanpa memindai ulang.</li>
+<li><b>DISM RestoreHealth</b> - memperbaiki component store Windows. Hasil DISM membuat hasil sfc
+tersimpan kedaluwarsa.</li>
+<li><b>Scan Disk</b> dan <b>Defrag / Optimize</b> - pilih volume; volume di disk fisik berbeda
+diproses bersamaan, volume di disk yang sama berurutan.</li>
+<li><b>Perawatan Lengkap</b> - DISM, sfc, pembersihan, dan defrag C: dalam satu graf tugas.</li>
+</ul>
+<h3>System Cleanup</h3>
+<ul>
+<li><b>Clear Temporary Files</b>, <b>Clear Windows Update Cache</b>, <b>Reset Icon Cache</b> - dengan
+<i>Pembersihan Instan</i> diaktifkan di menu File, folder diganti nama dulu lalu dihapus di latar
+belakang (tanpa progress bar; hasil purge muncul di log setelah selesai).</li>
+<li><b>Preview Pembersihan</b> - menghitung jumlah dan ukuran file tanpa menghapus apa pun.</li>
+<li><b>File &gt; Opsi Pembersihan</b> - batas file/detik dan MB/detik, serta prioritas latar belakang.</li>
+</ul>
+<h3>Perintah Eksternal</h3>
+<ul>
+<li><b>File &gt; Opsi Watchdog</b> - batas waktu dan deteksi stall per jenis perintah, dengan aksi
+peringatan, tangguhkan, atau hentikan. Secara default batas waktu hanya memberi peringatan;
+pilih 'hentikan' untuk sfc/DISM hanya jika perlu, karena bisa membuat component store tidak konsisten.</li>
+<li><b>File &gt; Lanjutkan Proses yang Ditangguhkan</b> - melanjutkan proses yang ditangguhkan watchdog.</li>
+<li><b>File &gt; Hapus Cache Hasil Pemindaian</b> - pemindaian sfc/DISM berikutnya dijalankan penuh.</li>
+</ul>
+<h3>Advanced Boot Options</h3>
+<p><b>Boot to Safe Mode</b> dan <b>Disable Safe Mode Boot</b> mengubah konfigurasi boot dengan
+<code>bcdedit</code>; perubahan berlaku setelah restart.</p>
+<h3>Tanpa GUI</h3>
+<p><code>python macan_conquer7.py --headless sfc clean-temp</code> menjalankan aksi yang sama dengan
+output NDJSON. Lihat <code>python macan_cli.py --list</code>.</p>
+"""
+ABOUT_HTML = """
+<h3>Macan Conquer</h3>
+<p>Professional Windows Toolkit untuk perawatan, diagnosa, dan perbaikan Windows 10/11.</p>
+<p>&copy; 2025 Danx Exodus &mdash; bagian dari ekosistem Macan Angkasa.<br>
+Lisensi: MIT &amp; Independent Software License (Macan Angkasa Ecosystem).</p>
+"""
+
+# --- [DIUBAH] Tugas latar belakang dijalankan oleh Scheduler (macan_scheduler.py), bukan QThread tunggal ---
+class SchedulerBridge(QObject):
+    task_changed = Signal(object)  # Task yang status/progress-nya berubah
+    output_batch = Signal(list)    # Baris output dikirim per batch (lihat OutputBatcher)
+
+class TaskEmitter:
+    """[BARU] Pengganti Signal dengan emit() untuk fungsi tugas yang dijalankan Scheduler."""
+    def __init__(self, callback):
+        self.emit = callback
+
+# --- [BARU] Jembatan log thread-safe untuk thread latar belakang di luar Worker ---
+class LogBridge(QObject):
+    message = Signal(str)
 
 class MacanConquerApp(QMainWindow):
     def __init__(self):
@@ -68,14 +204,64 @@ class MacanConquerApp(QMainWindow):
         self.setGeometry(100, 100, 850, 600)
         self.setWindowIcon(self.get_icon())
 
-        self.thread = None
-        self.worker = None
-        self.is_running = False
+        self.log_bridge = LogBridge()
+        # [BARU] Penjadwal DAG: tugas hanya menunggu dependensi dan resource yang dipakainya
+        self.scheduler_bridge = SchedulerBridge()
+        self.scheduler = Scheduler(on_change=self.scheduler_bridge.task_changed.emit)
+        self.active_graphs = []
+        self.task_items = {}   # task.id -> QTreeWidgetItem
+        self.graph_items = {}  # id(graph) -> item induk untuk graf dengan lebih dari satu tugas
+        # [BARU] Opsi per run untuk mesin pembersihan (0 = tanpa batas)
+        self.cleanup_options = {"max_files_per_sec": 0, "max_mb_per_sec": 0.0, "background": False}
+        # [DIUBAH] Event loop asyncio (macan_executor.py) dan cache hasil dibuat saat pertama dipakai
+        self._command_executor = None
+        self._result_cache = None
+        # [BARU] Dialog Help/About dibuat saat pertama dibuka
+        self._help_dialog = None
+        self._about_dialog = None
+        # [BARU] Batas watchdog per jenis perintah dan watchdog yang sedang aktif
+        self.watchdog_limits = {key: WatchdogLimits(**vars(limits)) for key, limits in DEFAULT_LIMITS.items()}
+        self.active_watchdogs = set()
+        # [BARU] Log sesi dan output per tugas dengan memori terbatas
+        self.log_spool = OutputSpool("session")
+        self.task_spools = {}  # task.id -> OutputSpool
 
         self.init_ui()
+        self.log_bridge.message.connect(self.add_log)
+        self.scheduler_bridge.task_changed.connect(self._on_task_changed)
+        self.scheduler_bridge.output_batch.connect(self.add_log_batch)
+        # [BARU] Kolom durasi tugas yang sedang berjalan diperbarui setiap detik
+        self.task_timer = QTimer(self)
+        self.task_timer.timeout.connect(self._refresh_task_panel)
         self.add_log("Selamat datang di Macan Conquer! Aplikasi siap digunakan.")
         self.add_log("Pastikan Anda menjalankan sebagai Administrator untuk fungsionalitas penuh.")
+        self._purge_leftover_tombstones()
+        # [DIUBAH] Pembersihan spool lama (butuh psutil) setelah window tampil
+        QTimer.singleShot(0, self._purge_stale_spools)
+
+    def _purge_stale_spools(self):
+        try:
+            purge_stale_spools()
+        except Exception:
+            pass
 
+    @property
+    def command_executor(self):
+        """[BARU] Satu event loop asyncio untuk perintah yang berjalan bersamaan, dibuat saat pertama dipakai."""
+        if self._command_executor is None:
+            from macan_executor import CommandExecutor, DEFAULT_CONCURRENCY
+            self._command_executor = CommandExecutor(DEFAULT_CONCURRENCY)
+        return self._command_executor
+
+    @property
+    def result_cache(self):
+        """[BARU] Hasil pemindaian integritas yang bersih, dipakai ulang selama inputnya tidak berubah."""
+        if self._result_cache is None:
+            from macan_results import ResultCache
+            self._result_cache = ResultCache()
+        return self._result_cache
+
+    @STARTUP.timed
     def init_ui(self):
         """Membangun semua elemen antarmuka pengguna."""
         self._create_menu_bar()
@@ -114,7 +300,27 @@ class MacanConquerApp(QMainWindow):
         self.progress_bar.setVisible(False)
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setRange(0, 100)
-        self.main_layout.addWidget(self.progress_bar)
+        # [BARU] Tombol Batal di samping progress bar (tidak ikut dinonaktifkan saat tugas berjalan)
+        self.cancel_button = QPushButton("Batal")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_task)
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        self.main_layout.addLayout(progress_layout)
+
+        # --- [BARU] Panel tugas: status live setiap tugas di Scheduler ---
+        self.task_tree = QTreeWidget()
+        self.task_tree.setHeaderLabels(["Tugas", "Status", "Progress", "Durasi", "Resource"])
+        self.task_tree.setColumnWidth(0, 220)
+        self.task_tree.setColumnWidth(1, 120)
+        self.task_tree.setColumnWidth(2, 200)
+        self.task_tree.setColumnWidth(3, 90)
+        self.task_tree.setMaximumHeight(150)
+        self.task_tree.setVisible(False)
+        self.task_tree.setToolTip("Klik dua kali untuk melihat output lengkap tugas.")
+        self.task_tree.itemDoubleClicked.connect(self._show_task_output)
+        self.main_layout.addWidget(self.task_tree)
 
         # --- [REFACTOR] Membuat layout 2 kolom untuk grup tombol ---
         self.button_widgets = []
@@ -145,15 +351,46 @@ class MacanConquerApp(QMainWindow):
         self.output_console = QTextEdit()
         self.output_console.setReadOnly(True)
         self.output_console.setObjectName("OutputConsole")
+        # [BARU] Baris terlama dibuang dari dokumen; semuanya tetap ada di self.log_spool
+        self.output_console.document().setMaximumBlockCount(CONSOLE_MAX_BLOCKS)
         self.main_layout.addWidget(self.output_console)
         # --- AKHIR REFACTOR LAYOUT ---
 
+    @STARTUP.timed
     def _create_menu_bar(self):
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("&File")
         save_log_action = QAction("Save Log...", self)
         save_log_action.triggered.connect(self._save_log_to_file)
         file_menu.addAction(save_log_action)
+        # [BARU] Opsi untuk menulis daftar lengkap item yang gagal dihapus ke file terpisah
+        self.save_failures_action = QAction("Simpan Daftar Kegagalan Pembersihan", self)
+        self.save_failures_action.setCheckable(True)
+        file_menu.addAction(self.save_failures_action)
+        # [BARU] Pembersihan instan: rename folder ke tombstone, purge di latar belakang
+        self.instant_cleanup_action = QAction("Pembersihan Instan (Purge Latar Belakang)", self)
+        self.instant_cleanup_action.setCheckable(True)
+        self.instant_cleanup_action.setChecked(False)  # Opt-in: mode normal punya progress & ringkasan kegagalan
+        file_menu.addAction(self.instant_cleanup_action)
+        self.compress_spool_action = QAction("Kompres Spool Output", self)
+        self.compress_spool_action.setCheckable(True)
+        self.compress_spool_action.setChecked(True)
+        file_menu.addAction(self.compress_spool_action)
+        cleanup_options_action = QAction("Opsi Pembersihan...", self)
+        cleanup_options_action.triggered.connect(self._show_cleanup_options)
+        file_menu.addAction(cleanup_options_action)
+        watchdog_action = QAction("Opsi Watchdog...", self)
+        watchdog_action.triggered.connect(self._show_watchdog_options)
+        file_menu.addAction(watchdog_action)
+        resume_action = QAction("Lanjutkan Proses yang Ditangguhkan", self)
+        resume_action.triggered.connect(self._resume_suspended_processes)
+        file_menu.addAction(resume_action)
+        clear_results_action = QAction("Hapus Cache Hasil Pemindaian", self)
+        clear_results_action.triggered.connect(self._clear_result_cache)
+        file_menu.addAction(clear_results_action)
+        concurrency_action = QAction("Batas Perintah Bersamaan...", self)
+        concurrency_action.triggered.connect(self._set_command_concurrency)
+        file_menu.addAction(concurrency_action)
         file_menu.addSeparator()
         restart_action = QAction("Restart Windows", self)
         restart_action.triggered.connect(self._restart_windows)
@@ -172,7 +409,11 @@ class MacanConquerApp(QMainWindow):
         about_action = QAction("About", self)
         about_action.triggered.connect(self._show_about_dialog)
         help_menu.addAction(about_action)
+        startup_action = QAction("Profil Startup", self)
+        startup_action.triggered.connect(self._show_startup_profile)
+        help_menu.addAction(startup_action)
 
+    @STARTUP.timed
     def create_system_info_dashboard(self):
         group_box = QGroupBox("System Information")
         # --- [DIUBAH] Memberi nama objek unik untuk styling khusus ---
@@ -195,11 +436,18 @@ class MacanConquerApp(QMainWindow):
         self.info_timer = QTimer(self)
         self.info_timer.timeout.connect(self.update_system_info)
         self.info_timer.start(2000)
-        self.update_system_info()
+        # [DIUBAH] Pengisian pertama (import psutil) setelah window tampil
+        QTimer.singleShot(0, self._first_system_info)
         return group_box
 
+    def _first_system_info(self):
+        with STARTUP.phase("dashboard: data pertama"):
+            self.update_system_info()
+
     def update_system_info(self):
         # --- [DIUBAH] Logika diubah untuk mengisi label yang sudah digabung ---
+        import platform
+        import psutil
         # Info OS statis, hanya perlu di-set sekali
         if "Loading..." in self.os_label.text():
              self.os_label.setText(f"<b>OS:</b> {platform.system()} {platform.release()}")
@@ -226,17 +474,21 @@ class MacanConquerApp(QMainWindow):
         return button
 
     # --- [REFACTOR] Fungsi grup sekarang me-return QGroupBox ---
+    @STARTUP.timed
     def create_system_repair_group(self):
         group_box = QGroupBox("Perbaikan Sistem & Integritas")
         group_box.setObjectName("FunctionGroup")
         layout = QGridLayout()
         layout.addWidget(self.create_button("System File Checker (sfc /scannow)", self.run_sfc), 0, 0)
         layout.addWidget(self.create_button("DISM Restore Health", self.run_dism), 0, 1)
-        layout.addWidget(self.create_button("Scan Disk (chkdsk C:)", self.run_chkdsk), 1, 0)
-        layout.addWidget(self.create_button("Defrag / Optimize Drive (C:)", self.run_defrag), 1, 1)
+        layout.addWidget(self.create_button("Scan Disk (chkdsk)...", self.run_chkdsk), 1, 0)
+        layout.addWidget(self.create_button("Defrag / Optimize Drive...", self.run_defrag), 1, 1)
+        layout.addWidget(self.create_button("Diagnosa Read-only Semua Volume", self.run_volume_diagnostics), 2, 0, 1, 2)
+        layout.addWidget(self.create_button("Perawatan Lengkap", self.run_full_maintenance), 3, 0, 1, 2)
         group_box.setLayout(layout)
         return group_box
 
+    @STARTUP.timed
     def create_cleanup_group(self):
         group_box = QGroupBox("Pembersihan Sistem")
         group_box.setObjectName("FunctionGroup")
@@ -244,9 +496,12 @@ class MacanConquerApp(QMainWindow):
         layout.addWidget(self.create_button("Clear Temporary Files", self.clear_temp_files), 0, 0)
         layout.addWidget(self.create_button("Clear Windows Update Cache", self.clear_update_cache), 0, 1)
         layout.addWidget(self.create_button("Reset Icon Cache", self.reset_icon_cache), 1, 0)
+        layout.addWidget(self.create_button("Preview Pembersihan", self.preview_cleanup), 1, 1)
+        layout.addWidget(self.create_button("Bersihkan Semua", self.clean_all), 2, 0, 1, 2)
         group_box.setLayout(layout)
         return group_box
 
+    @STARTUP.timed
     def create_external_tools_group(self):
         group_box = QGroupBox("Aplikasi Tambahan")
         group_box.setObjectName("FunctionGroup")
@@ -257,6 +512,7 @@ class MacanConquerApp(QMainWindow):
         group_box.setLayout(layout)
         return group_box
 
+    @STARTUP.timed
     def create_advanced_boot_group(self):
         group_box = QGroupBox("Opsi Boot Lanjutan")
         group_box.setObjectName("FunctionGroup")
@@ -268,17 +524,18 @@ class MacanConquerApp(QMainWindow):
 
     # --- Sisa kode tidak berubah (fungsi log, task, worker, dll.) ---
 
-    def _save_log_to_file(self):
-        log_content = self.output_console.toPlainText()
-        if not log_content.strip():
+    def _save_log_to_file(self, spool=None, title="Log"):
+        # [DIUBAH] Ditulis dari spool per blok, bukan salinan penuh toPlainText()
+        spool = spool or self.log_spool
+        if not len(spool):
             QMessageBox.information(self, "Log Kosong", "Tidak ada aktivitas untuk disimpan.")
             return
         filename, _ = QFileDialog.getSaveFileName(self, "Simpan Log ke File",
-            f"MacanConquer_Log_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
+            f"MacanConquer_{title}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
             "Text Files (*.txt);;All Files (*)")
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f: f.write(log_content)
+                spool.export(filename)
                 self.add_log(f"\n📝 Log berhasil disimpan ke: {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Gagal menyimpan log: {e}")
@@ -286,13 +543,44 @@ class MacanConquerApp(QMainWindow):
     def _confirm_and_shutdown(self, command, message):
         reply = QMessageBox.question(self, "Konfirmasi", message, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
+            import subprocess
             try: subprocess.run(["shutdown", command, "/t", "0"], check=True)
             except Exception as e: QMessageBox.critical(self, "Error", f"Gagal menjalankan perintah: {e}")
 
     def _restart_windows(self): self._confirm_and_shutdown("/r", "Apakah Anda yakin ingin me-restart komputer sekarang?")
     def _shutdown_windows(self): self._confirm_and_shutdown("/s", "Apakah Anda yakin ingin mematikan komputer sekarang?")
-    def _show_about_dialog(self): QMessageBox.about(self, "About Macan Conquer", "...")
-    def _show_help_content(self): QMessageBox.information(self, "Help Content", "...")
+
+    def _show_about_dialog(self):
+        # [DIUBAH] Dialog dibuat sekali saat pertama dibuka, lalu dipakai ulang
+        if self._about_dialog is None:
+            self._about_dialog = QMessageBox(QMessageBox.Information, "About Macan Conquer", ABOUT_HTML,
+                                             QMessageBox.Ok, self)
+            self._about_dialog.setIconPixmap(QPixmap(self.get_icon_path()).scaled(
+                64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self._about_dialog.exec()
+
+    def _show_help_content(self):
+        # [DIUBAH] Dialog dibuat sekali saat pertama dibuka, lalu dipakai ulang (non-modal)
+        if self._help_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Help Content")
+            dialog.resize(640, 560)
+            layout = QVBoxLayout(dialog)
+            browser = QTextBrowser()
+            browser.setHtml(HELP_HTML)
+            layout.addWidget(browser)
+            buttons = QDialogButtonBox(QDialogButtonBox.Close)
+            buttons.rejected.connect(dialog.close)
+            layout.addWidget(buttons)
+            self._help_dialog = dialog
+        self._help_dialog.show()
+        self._help_dialog.raise_()
+        self._help_dialog.activateWindow()
+
+    def _show_startup_profile(self):
+        """[BARU] Waktu setiap fase startup (macan_startup.py) ditulis ke log."""
+        self.add_log("⏱️ Profil startup:")
+        self.add_log_batch(STARTUP.report())
 
     def get_executable_path(self, exe_name):
         base_path = sys._MEIPASS if hasattr(sys, '_MEIPASS') else os.path.abspath(".")
@@ -301,14 +589,12 @@ class MacanConquerApp(QMainWindow):
         return path
 
     def launch_external_app(self, exe_name, app_friendly_name):
-        if self.is_running:
-            QMessageBox.warning(self, "Proses Berjalan", "Satu proses sudah berjalan, harap tunggu hingga selesai.")
-            return
         exe_path = self.get_executable_path(exe_name)
         if not os.path.exists(exe_path):
             QMessageBox.critical(self, "Error: File Tidak Ditemukan", f"...")
             return
         try:
+            import subprocess
             self.add_log(f"🚀 Meluncurkan {app_friendly_name}...")
             subprocess.Popen([exe_path])
         except Exception as e:
@@ -323,217 +609,687 @@ class MacanConquerApp(QMainWindow):
 
     def get_icon(self): return QIcon(self.get_icon_path())
 
-    def set_controls_enabled(self, enabled):
-        self.is_running = not enabled
-        for button in self.button_widgets: button.setEnabled(enabled)
-
     def add_log(self, message):
+        self.log_spool.append(message)
         self.output_console.append(message)
         self.output_console.verticalScrollBar().setValue(self.output_console.verticalScrollBar().maximum())
 
-    def start_task(self, function, *args, **kwargs):
-        if self.is_running:
-            QMessageBox.warning(self, "Proses Berjalan", "Satu proses sudah berjalan, harap tunggu hingga selesai.")
-            return
-        self.set_controls_enabled(False)
-        self.progress_bar.setValue(0)
+    def add_log_batch(self, messages):
+        """[BARU] Satu append dan satu update scrollbar untuk seluruh batch dari worker."""
+        self.add_log("\n".join(messages))
+
+    def make_task(self, name, function, *args, deps=(), resources=(), always=False, prefix=False, **kwargs):
+        """
+        [BARU] Membungkus fungsi tugas (output_signal, progress_signal, ..., cancel_token)
+        menjadi Task untuk Scheduler. `prefix=True` menandai setiap baris log dengan nama
+        tugas, untuk graf yang beberapa tugasnya berjalan bersamaan.
+        """
+        notify = self.scheduler_bridge.task_changed.emit
+        task = None
+        # [BARU] Output lengkap tugas ini, bisa dilihat/diekspor dari panel tugas
+        spool = OutputSpool(name, compress=self.compress_spool_action.isChecked())
+
+        def deliver(batch):
+            spool.extend(batch)
+            self.scheduler_bridge.output_batch.emit(batch)
+
+        def set_progress(value):
+            task.progress = value
+            notify(task)
+
+        def set_progress_text(text):
+            task.progress_text = text
+            notify(task)
+
+        def set_usage(sample):
+            task.usage = sample
+            notify(task)
+
+        def run(cancel_token):
+            # Baris digabung per 50 ms / 256 baris agar tool yang cerewet tidak membanjiri GUI
+            output = OutputBatcher(deliver)
+            output_signal = TaskEmitter(lambda line: output.emit(f"[{name}] {line}")) if prefix else output
+            try:
+                function(
+                    *args, **kwargs,
+                    progress_signal=TaskEmitter(set_progress),
+                    progress_text_signal=TaskEmitter(set_progress_text),
+                    usage_signal=TaskEmitter(set_usage),
+                    output_signal=output_signal,
+                    cancel_token=cancel_token
+                )
+            except TaskCancelled:
+                output_signal.emit("⏹️ Tugas dibatalkan oleh pengguna.")
+                raise
+            except Exception as e:
+                output_signal.emit(f"❌ Terjadi kesalahan fatal di tugas latar belakang: {e}")
+                raise
+            finally:
+                output.close()
+
+        task = Task(name, run, deps=deps, resources=resources, always=always)
+        self.task_spools[task.id] = spool
+        return task
+
+    def start_task(self, function, *args, task_name=None, resources=(), **kwargs):
+        """[DIUBAH] Tidak lagi ditolak saat tugas lain berjalan; hanya menunggu resource yang sama."""
+        name = task_name or function.__name__.strip("_")
+        return self.run_tasks([self.make_task(name, function, *args, resources=resources, **kwargs)])
+
+    def run_tasks(self, tasks, name=None):
+        """[BARU] Mengirim graf tugas ke Scheduler dan menampilkannya di panel tugas."""
+        if not self.active_graphs:
+            # Panel hanya menampilkan graf dari sesi kerja terakhir
+            self.task_tree.clear()
+            self.task_items.clear()
+            self.graph_items.clear()
+            current = {task.id for task in tasks}
+            for task_id in [task_id for task_id in self.task_spools if task_id not in current]:
+                self.task_spools.pop(task_id).close()
+        graph = self.scheduler.submit(tasks, name)
+        if len(tasks) > 1:
+            self.add_log(f"🚀 Menjadwalkan {graph.name}: {len(tasks)} tugas.")
+        self.active_graphs.append(graph)
+        self.task_tree.setVisible(True)
         self.progress_bar.setVisible(True)
-        self.thread = QThread()
-        self.worker = Worker(function, *args, **kwargs)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.task_finished)
-        self.worker.output_ready.connect(self.add_log)
-        self.worker.progress_updated.connect(self.update_progress)
-        self.thread.start()
-
-    def task_finished(self):
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        self.task_timer.start(1000)
+        # Status awal sudah masuk panel lewat on_change di dalam submit()
+        self._finish_graph_if_done(graph)
+        self._update_progress_bar()
+        return graph
+
+    def _task_item(self, task):
+        item = self.task_items.get(task.id)
+        if item is None:
+            graph = task.graph
+            if graph is not None and len(graph.tasks) > 1:
+                parent = self.graph_items.get(id(graph))
+                if parent is None:
+                    parent = QTreeWidgetItem(self.task_tree, [graph.name])
+                    parent.setExpanded(True)
+                    self.graph_items[id(graph)] = parent
+                item = QTreeWidgetItem(parent, [task.name])
+            else:
+                item = QTreeWidgetItem(self.task_tree, [task.name])
+            # [BARU] Progress bar sendiri untuk setiap tugas (misalnya chkdsk per volume)
+            bar = QProgressBar()
+            bar.setRange(0, 100)
+            bar.setTextVisible(True)
+            bar.setFormat("")
+            self.task_tree.setItemWidget(item, 2, bar)
+            item.setData(0, Qt.UserRole, task.id)
+            self.task_items[task.id] = item
+        return item
+
+    def _update_task_item(self, task):
+        item = self._task_item(task)
+        item.setText(1, f"{STATE_ICONS[task.state]} {task.state}")
+        bar = self.task_tree.itemWidget(item, 2)
+        if task.state == RUNNING or task.progress:
+            bar.setValue(task.progress)
+            bar.setFormat(task.progress_text or f"{task.progress}%")
+        item.setText(3, f"{task.duration:.1f} detik" if task.started_at is not None else "")
+        if task.usage is not None:
+            # [BARU] Sampel terakhir process tree; tooltip berisi total baca/tulis dan biaya sampling
+            item.setText(4, task.usage.format() if task.state == RUNNING else f"{task.usage.processes} proses (selesai)")
+            item.setToolTip(4, task.usage.details())
+
+    def _on_task_changed(self, task):
+        """[BARU] Dipanggil di GUI thread setiap kali status atau progress tugas berubah."""
+        self._update_task_item(task)
+        if task.state == SKIPPED:
+            self.add_log(f"⏭️ {task.name} dilewati karena tugas sebelumnya tidak selesai.")
+        self._finish_graph_if_done(task.graph)
+        self._update_progress_bar()
+
+    def _finish_graph_if_done(self, graph):
+        if graph not in self.active_graphs or not graph.done:
+            return
+        self.active_graphs.remove(graph)
+        if len(graph.tasks) > 1:
+            self.graph_items[id(graph)].setText(3, f"{graph.elapsed():.1f} detik")
+            self.add_log(f"\n📊 {graph.summary()}")
         self.add_log("\n✅ === PROSES SELESAI === ✅\n")
-        self.set_controls_enabled(True)
-        self.progress_bar.setVisible(False)
-        self.thread.quit()
-        self.thread.wait()
-        self.thread = None
-        self.worker = None
 
-    def update_progress(self, value):
+    def _refresh_task_panel(self):
+        for graph in self.active_graphs:
+            for task in graph.tasks:
+                if task.state == RUNNING:
+                    self._update_task_item(task)
+        if not self.active_graphs:
+            self.task_timer.stop()
+
+    def _update_progress_bar(self):
+        """[BARU] Progress gabungan semua tugas aktif; teks detail jika hanya satu yang berjalan."""
+        tasks = [task for graph in self.active_graphs for task in graph.tasks]
+        if not tasks:
+            self.progress_bar.setVisible(False)
+            self.cancel_button.setVisible(False)
+            return
+        value = sum(100 if task.finished else task.progress for task in tasks) // len(tasks)
+        running = [task for task in tasks if task.state == RUNNING]
         self.progress_bar.setValue(value)
-        self.progress_bar.setFormat(f"Proses berjalan... {value}%")
+        if len(running) == 1 and running[0].progress_text:
+            self.progress_bar.setFormat(running[0].progress_text)
+        else:
+            self.progress_bar.setFormat(f"{len(running)} tugas berjalan... {value}%")
+
+    def cancel_task(self):
+        """[DIUBAH] Membatalkan semua tugas; langkah pemulihan (always=True) tetap dijalankan."""
+        if self.scheduler.busy:
+            self.add_log("⏹️ Membatalkan tugas...")
+            self.cancel_button.setEnabled(False)
+            self.scheduler.cancel_all()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # [BARU] Paint pertama adalah fase terakhir profiler startup
+        if not STARTUP.finished:
+            STARTUP.finish()
+
+    def closeEvent(self, event):
+        """[BARU] Tugas yang masih berjalan dibatalkan (process tree dimatikan) sebelum keluar."""
+        if self.scheduler.busy:
+            reply = QMessageBox.question(self, "Tugas Berjalan", "Masih ada tugas yang berjalan. Batalkan semua tugas dan keluar?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+        # Tunggu langkah pemulihan (always=True, misalnya 'net start wuauserv') selesai
+        # selagi spool dan sinyal GUI masih hidup.
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.scheduler.shutdown(wait=True)
+            # [BARU] Loop asyncio dan proses chkdsk yang masih dijalankannya ikut dihentikan
+            if self._command_executor is not None:
+                self._command_executor.shutdown()
+        finally:
+            QApplication.restoreOverrideCursor()
+        for spool in self.task_spools.values():
+            spool.close()
+        self.log_spool.close()
+        event.accept()
 
-    def run_sfc(self): self.start_task(self._run_command_with_progress, "sfc", ["/scannow"], "sfc")
-    def run_dism(self): self.start_task(self._run_command_with_progress, "DISM.exe", ["/Online", "/Cleanup-image", "/Restorehealth"], "dism")
+    def _show_task_output(self, item):
+        """[BARU] Output lengkap satu tugas, dibaca dari spool per halaman OUTPUT_VIEW_LINES baris."""
+        spool = self.task_spools.get(item.data(0, Qt.UserRole))
+        if spool is None:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Output: {spool.name}")
+        dialog.resize(800, 500)
+        layout = QVBoxLayout(dialog)
+        viewer = QPlainTextEdit()
+        viewer.setReadOnly(True)
+        viewer.setObjectName("OutputConsole")
+        start_spin = QSpinBox()
+        start_spin.setPrefix("Mulai baris ")
+        start_spin.setSingleStep(OUTPUT_VIEW_LINES)
+
+        def show_page():
+            total = len(spool)
+            start_spin.setRange(1, max(total, 1))
+            start = start_spin.value() - 1
+            viewer.setPlainText("\n".join(spool.lines(start, start + OUTPUT_VIEW_LINES)))
+            info.setText(f"Baris {min(start + 1, total)}-{min(start + OUTPUT_VIEW_LINES, total)} dari {total}")
+
+        def show_last_page():
+            start_spin.setRange(1, max(len(spool), 1))
+            start_spin.setValue(max(len(spool) - OUTPUT_VIEW_LINES, 0) + 1)
+            show_page()
+
+        info = QLabel()
+        refresh_button = QPushButton("Halaman Terakhir")
+        refresh_button.clicked.connect(show_last_page)
+        export_button = QPushButton("Export...")
+        export_button.clicked.connect(lambda: self._save_log_to_file(spool, "Output"))
+        start_spin.editingFinished.connect(show_page)
+        controls = QHBoxLayout()
+        controls.addWidget(start_spin)
+        controls.addWidget(info)
+        controls.addStretch()
+        controls.addWidget(refresh_button)
+        controls.addWidget(export_button)
+        layout.addLayout(controls)
+        layout.addWidget(viewer)
+        show_last_page()
+        dialog.exec()
+
+    # [DIUBAH] Setiap tugas mendeklarasikan resource eksklusifnya; tugas lain tetap bisa berjalan
+    def run_sfc(self): self._run_memoized("sfc /scannow", "sfc", ["/scannow"], "sfc", resources={"servicing"})
+    def run_dism(self): self._run_memoized("DISM RestoreHealth", "DISM.exe", ["/Online", "/Cleanup-image", "/Restorehealth"], "dism", resources={"servicing"})
+
+    def _run_memoized(self, task_name, program, args, progress_type, resources=()):
+        """[BARU] Hasil tersimpan yang masih berlaku ditampilkan langsung, dengan opsi menjalankan ulang."""
+        cached = self.result_cache.lookup(program, args)
+        if cached is not None:
+            box = QMessageBox(self)
+            box.setWindowTitle("Hasil Tersimpan")
+            box.setIcon(QMessageBox.Information)
+            box.setText(f"Tidak ada perubahan sejak pemindaian bersih terakhir:\n{cached.describe()}")
+            box.setDetailedText("\n".join(cached.summary))
+            show_button = box.addButton("Tampilkan Hasil", QMessageBox.AcceptRole)
+            rerun_button = box.addButton("Jalankan Ulang", QMessageBox.DestructiveRole)
+            box.addButton(QMessageBox.Cancel)
+            box.exec()
+            if box.clickedButton() == show_button:
+                self.add_log(f"💾 Hasil tersimpan: {cached.describe()}")
+                self.add_log_batch(cached.summary)
+                return
+            if box.clickedButton() != rerun_button:
+                return
+        self.start_task(self._run_command_with_progress, program, args, progress_type,
+                        task_name=task_name, resources=resources)
     def run_chkdsk(self):
         QMessageBox.information(self, "Info Scan Disk", "...")
-        self.start_task(self._run_command_with_progress, "chkdsk", ["C:"])
-    def run_defrag(self): self.start_task(self._run_command_with_progress, "defrag", ["C:", "/O"])
-    def clear_temp_files(self): self.start_task(self._clear_temp_action)
+        self._run_on_volumes("Scan Disk", "chkdsk", lambda volume: [volume.letter])
+    def run_defrag(self): self._run_on_volumes("Defrag / Optimize Drive", "defrag", lambda volume: [volume.letter, "/O"])
+    def run_volume_diagnostics(self):
+        from macan_volumes import fixed_volumes
+        self.start_task(self._volume_diagnostics_action, task_name="Diagnosa semua volume",
+                        resources={f"volume:{volume.letter}" for volume in fixed_volumes()})
+
+    def _run_on_volumes(self, title, program, make_args):
+        """
+        [BARU] Satu tugas per volume yang dipilih. Resource 'disk:N' membuat volume di disk
+        fisik yang sama berjalan berurutan, sedangkan disk berbeda berjalan bersamaan.
+        """
+        from macan_volumes import group_by_disk
+        volumes = self._pick_volumes(title)
+        if not volumes:
+            return
+        tasks = [self.make_task(f"{program} {volume.letter}", self._run_command_with_progress, program, make_args(volume),
+                                resources=volume.resources, prefix=len(volumes) > 1)
+                 for volume in volumes]
+        if len(volumes) > 1:
+            plan = "; ".join(" -> ".join(volume.letter for volume in group) for group in group_by_disk(volumes))
+            self.add_log(f"🗂️ {title}: {plan} (antar disk fisik bersamaan, satu disk berurutan)")
+        self.run_tasks(tasks, f"{title}: {', '.join(volume.letter for volume in volumes)}")
+
+    def _pick_volumes(self, title):
+        """[BARU] Dialog pilihan volume lokal; mengembalikan list Volume atau None jika dibatalkan."""
+        from macan_volumes import fixed_volumes
+        volumes = fixed_volumes()
+        if not volumes:
+            QMessageBox.information(self, title, "Tidak ada volume lokal yang ditemukan.")
+            return None
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Pilih volume yang akan diproses:"))
+        checks = []
+        for volume in volumes:
+            check = QCheckBox(volume.describe())
+            check.setChecked(volume.letter.upper() == "C:")
+            layout.addWidget(check)
+            checks.append(check)
+        all_check = QCheckBox("Semua volume")
+        all_check.toggled.connect(lambda checked: [check.setChecked(checked) for check in checks])
+        layout.addWidget(all_check)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        if dialog.exec() != QDialog.Accepted:
+            return None
+        return [volume for volume, check in zip(volumes, checks) if check.isChecked()]
+    def clear_temp_files(self): self.start_task(self._clear_temp_action, task_name="Clear Temp", resources={"temp"})
+    def preview_cleanup(self): self.start_task(self._preview_cleanup_action, task_name="Preview Pembersihan")
 
     def clear_update_cache(self):
         if QMessageBox.question(self, "Konfirmasi", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
-            self.start_task(self._clear_update_cache_action)
+            self.start_task(self._clear_update_cache_action, task_name="Clear Update Cache", resources={"wuauserv"})
 
     def reset_icon_cache(self):
         if QMessageBox.warning(self, "Konfirmasi Penting", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
-            self.start_task(self._reset_icon_cache_action)
+            self.start_task(self._reset_icon_cache_action, task_name="Reset Icon Cache", resources={"explorer"})
+
+    def clean_all(self):
+        # [BARU] Temp, cache Windows Update, dan cache ikon sekaligus; volume berbeda berjalan paralel
+        if QMessageBox.warning(self, "Konfirmasi Penting", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
+            self.start_task(self._clean_all_action, task_name="Bersihkan Semua", resources={"temp", "wuauserv", "explorer"})
+
+    def run_full_maintenance(self):
+        """
+        [BARU] Graf perawatan lengkap. DISM -> sfc, stop service -> hapus cache -> start
+        service, dan Temp/cache ikon berjalan bersamaan; defrag menunggu pembersihan selesai.
+        """
+        if QMessageBox.warning(self, "Konfirmasi Penting", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+            return
+        from macan_volumes import volume_resources
+        command = self._run_command_with_progress
+        dism = self.make_task("DISM RestoreHealth", command, "DISM.exe", ["/Online", "/Cleanup-image", "/Restorehealth"], "dism",
+                              resources={"servicing"}, prefix=True)
+        sfc = self.make_task("sfc /scannow", command, "sfc", ["/scannow"], "sfc", deps=[dism], resources={"servicing"}, prefix=True)
+        temp = self.make_task("Clear Temp", self._clear_temp_action, resources={"temp"}, prefix=True)
+        stop_update = self.make_task("Stop Windows Update", self._run_hooks_action, [STOP_UPDATE_SERVICES],
+                                     resources={"wuauserv"}, prefix=True)
+        update_cache = self.make_task("Hapus Update Cache", self._run_cleanup_targets, [UPDATE_CACHE.without_hooks()],
+                                      deps=[stop_update], resources={"wuauserv"}, prefix=True)
+        # Service dinyalakan kembali walaupun penghapusan gagal atau dibatalkan
+        start_update = self.make_task("Start Windows Update", self._run_hooks_action, [START_UPDATE_SERVICES],
+                                      deps=[update_cache], resources={"wuauserv"}, always=True, prefix=True)
+        icons = self.make_task("Reset Icon Cache", self._reset_icon_cache_action, resources={"explorer"}, prefix=True)
+        defrag = self.make_task("defrag C:", command, "defrag", ["C:", "/O"], deps=[temp, update_cache],
+                                resources=volume_resources("C:"), prefix=True)
+        self.run_tasks([dism, sfc, temp, stop_update, update_cache, start_update, icons, defrag], "Perawatan Lengkap")
 
     def boot_to_safe_mode(self):
         if QMessageBox.warning(self, "Reboot ke Safe Mode", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
-            self.start_task(self._run_command_with_progress, "bcdedit", ["/set", "{current}", "safeboot", "minimal"])
+            self.start_task(self._run_command_with_progress, "bcdedit", ["/set", "{current}", "safeboot", "minimal"],
+                            task_name="bcdedit safeboot", resources={"bcd"})
             QMessageBox.information(self, "Sukses", "Konfigurasi Safe Mode berhasil. Silakan restart komputer Anda.")
 
     def disable_safe_mode(self):
         if QMessageBox.question(self, "Nonaktifkan Safe Mode", "...", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
-            self.start_task(self._run_command_with_progress, "bcdedit", ["/deletevalue", "{current}", "safeboot"])
+            self.start_task(self._run_command_with_progress, "bcdedit", ["/deletevalue", "{current}", "safeboot"],
+                            task_name="bcdedit safeboot", resources={"bcd"})
             QMessageBox.information(self, "Sukses", "Pengaturan Safe Mode telah dihapus. Komputer akan boot normal saat restart berikutnya.")
 
     def _run_command_with_progress(self, program, args, progress_type=None, **kwargs):
+        # [DIUBAH] Logika dipindah ke macan_commands.py agar dipakai juga oleh mode headless (macan_cli.py).
+        # Tetap berbasis thread (bukan QProcessExecutor): perintah adalah tugas Scheduler dengan
+        # dependensi dan resource eksklusif, memakai watchdog dan cache hasil, dan jalurnya dipakai
+        # bersama CLI yang tidak memuat PySide6. Flush output dan monitor resource memakai satu
+        # thread bersama untuk semua perintah, sehingga per perintah hanya ada thread pembaca pipe.
+        from macan_commands import run_command_with_progress
+        run_command_with_progress(program, args, progress_type, watchdog_limits=self.watchdog_limits,
+                                  result_cache=self.result_cache, active_watchdogs=self.active_watchdogs, **kwargs)
+
+    def _volume_diagnostics_action(self, **kwargs):
+        """[BARU] chkdsk read-only di semua volume lokal sekaligus lewat CommandExecutor."""
         output_signal = kwargs.get('output_signal')
         progress_signal = kwargs.get('progress_signal')
-        output_signal.emit(f"🚀 Memulai: {program} {' '.join(args)}")
-        process = subprocess.Popen([program] + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
-                                   encoding='utf-8', errors='replace', creationflags=subprocess.CREATE_NO_WINDOW)
-        for line in iter(process.stdout.readline, ''):
-            clean_line = line.strip()
-            if clean_line:
-                output_signal.emit(clean_line)
-                if progress_type == 'sfc':
-                    match = re.search(r'Verification (\d+)% complete.', clean_line)
-                    if match: progress_signal.emit(int(match.group(1)))
-                elif progress_type == 'dism':
-                    match = re.search(r'\[=+>\s*\] (\d+\.\d+)%', clean_line)
-                    if match: progress_signal.emit(int(float(match.group(1))))
-        process.stdout.close()
-        process.wait()
+        cancel_token = kwargs.get('cancel_token')
+        from macan_volumes import fixed_volumes
+        volumes = [volume.letter for volume in fixed_volumes()]
+        if not volumes:
+            output_signal.emit("Tidak ada volume lokal yang ditemukan.")
+            return
+        output_signal.emit(f"🚀 chkdsk read-only untuk {', '.join(volumes)} "
+                           f"(maks. {self.command_executor.max_concurrent} bersamaan)")
+        percents = dict.fromkeys(volumes, 0)
 
-    def _clear_temp_action(self, **kwargs):
-        output_signal = kwargs.get('output_signal')
-        temp_dir = tempfile.gettempdir()
-        deleted_count, failed_count = 0, 0
-        output_signal.emit(f"Membersihkan direktori: {temp_dir}")
-        for item in os.listdir(temp_dir):
-            path = os.path.join(temp_dir, item)
+        def on_event(volume, parser):
+            def handle(kind, text):
+                text = text.strip()
+                if not text:
+                    return
+                if kind == LINE:
+                    output_signal.emit(f"[{volume}] {text}")
+                value = parser.feed(text)
+                if value is not None:
+                    percents[volume] = value
+                    progress_signal.emit(sum(percents.values()) // len(percents))
+            return handle
+
+        futures = [(volume, self.command_executor.submit("chkdsk", [volume], on_event(volume, create_parser("chkdsk")),
+                                                         cancel=cancel_token))
+                   for volume in volumes]
+        # Semua hasil dikumpulkan dulu; volume yang gagal tidak menghentikan laporan volume lain
+        failed = []
+        for volume, future in futures:
             try:
-                if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                elif os.path.isdir(path): shutil.rmtree(path)
-                deleted_count += 1
+                output_signal.emit(f"[{volume}] {future.result().summary()}")
             except Exception as e:
-                output_signal.emit(f"Gagal menghapus {path}: {e}")
-                failed_count += 1
-        output_signal.emit(f"\nRingkasan: {deleted_count} item dihapus, {failed_count} item gagal.")
+                failed.append(volume)
+                output_signal.emit(f"[{volume}] gagal: {e}")
+        cancel_token.raise_if_cancelled()
+        if failed:
+            raise RuntimeError(f"chkdsk gagal dijalankan di {', '.join(failed)}")
 
-    def _clear_update_cache_action(self, **kwargs):
-        output_signal = kwargs.get('output_signal')
-        for cmd in [("net", "stop", "wuauserv"), ("net", "stop", "bits")]:
-            output_signal.emit(f"Menjalankan: {' '.join(cmd)}")
-            subprocess.run(cmd, shell=True, capture_output=True)
-        cache_dir = r"C:\Windows\SoftwareDistribution\Download"
-        output_signal.emit(f"Menghapus isi dari {cache_dir}...")
-        deleted_count, failed_count = 0, 0
+    def _show_watchdog_options(self):
+        """[BARU] Dialog batas waktu dan stall per jenis perintah (0 = nonaktif)."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Opsi Watchdog")
+        layout = QGridLayout(dialog)
+        for column, title in enumerate(["Perintah", "Batas waktu", "Aksi", "Stall tanpa aktivitas", "Aksi"]):
+            layout.addWidget(QLabel(title), 0, column)
+
+        def minutes_spin(seconds, off_text):
+            spin = QSpinBox()
+            spin.setRange(0, 24 * 60)
+            spin.setSpecialValueText(off_text)
+            spin.setSuffix(" menit")
+            spin.setValue(seconds // 60)
+            return spin
+
+        def action_combo(action):
+            combo = QComboBox()
+            combo.addItems(ACTIONS)
+            combo.setCurrentText(action)
+            return combo
+
+        rows = {}
+        for row, (key, limits) in enumerate(self.watchdog_limits.items(), start=1):
+            widgets = (minutes_spin(limits.time_limit, "Tanpa batas"), action_combo(limits.time_action),
+                       minutes_spin(limits.stall_seconds, "Nonaktif"), action_combo(limits.stall_action))
+            layout.addWidget(QLabel("Lainnya" if key == "default" else key), row, 0)
+            for column, widget in enumerate(widgets, start=1):
+                layout.addWidget(widget, row, column)
+            rows[key] = widgets
+
+        note = QLabel(f"⚠️ Aksi '{KILL}' pada sfc/DISM menghentikan operasi servicing di tengah jalan "
+                      "dan bisa membuat component store tidak konsisten.")
+        note.setWordWrap(True)
+        layout.addWidget(note, len(rows) + 1, 0, 1, 5)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons, len(rows) + 2, 0, 1, 5)
+
+        if dialog.exec() == QDialog.Accepted:
+            for key, (time_spin, time_combo, stall_spin, stall_combo) in rows.items():
+                self.watchdog_limits[key] = WatchdogLimits(time_spin.value() * 60, time_combo.currentText(),
+                                                           stall_spin.value() * 60, stall_combo.currentText())
+            self.add_log("⚙️ Watchdog diperbarui: " + "; ".join(
+                f"{key}: {limits.describe()}" for key, limits in self.watchdog_limits.items()))
+
+    def _resume_suspended_processes(self):
+        """[BARU] Melanjutkan semua process tree yang ditangguhkan watchdog."""
+        suspended = [watchdog for watchdog in list(self.active_watchdogs) if watchdog.suspended]
+        if not suspended:
+            self.add_log("Tidak ada proses yang sedang ditangguhkan.")
+        for watchdog in suspended:
+            watchdog.resume()
+
+    def _clear_result_cache(self):
+        """[BARU] Semua pemindaian berikutnya dijalankan penuh."""
         try:
-            for item in os.listdir(cache_dir):
-                path = os.path.join(cache_dir, item)
-                try:
-                    if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                    elif os.path.isdir(path): shutil.rmtree(path)
-                    deleted_count += 1
-                except Exception as e:
-                    output_signal.emit(f"Gagal menghapus {path}: {e}")
-                    failed_count += 1
-        except Exception as e: output_signal.emit(f"Error mengakses {cache_dir}: {e}")
-        output_signal.emit(f"Ringkasan: {deleted_count} item dihapus, {failed_count} gagal.")
-        for cmd in [("net", "start", "wuauserv"), ("net", "start", "bits")]:
-            output_signal.emit(f"Menjalankan: {' '.join(cmd)}")
-            subprocess.run(cmd, shell=True, capture_output=True)
+            self.result_cache.invalidate()
+            self.add_log("🗑️ Cache hasil pemindaian dihapus.")
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Gagal menghapus cache hasil: {e}")
 
-    def _reset_icon_cache_action(self, **kwargs):
+    def _set_command_concurrency(self):
+        """[BARU] Jumlah maksimum perintah eksternal yang dijalankan CommandExecutor bersamaan."""
+        value, ok = QInputDialog.getInt(self, "Batas Perintah Bersamaan", "Maksimum perintah bersamaan:",
+                                        self.command_executor.max_concurrent, 1, 16)
+        if ok:
+            self.command_executor.set_concurrency(value)
+            self.add_log(f"⚙️ Maksimum perintah bersamaan: {value}")
+
+    def _preview_cleanup_action(self, **kwargs):
+        # [BARU] Dry-run: hanya menghitung, tidak ada yang dihapus
         output_signal = kwargs.get('output_signal')
-        db_path = os.path.join(os.path.expanduser("~"), "AppData", "Local", "IconCache.db")
-        output_signal.emit("Mematikan Windows Explorer...")
-        subprocess.run(["taskkill", "/f", "/im", "explorer.exe"], capture_output=True, shell=True)
+        output_signal.emit("🔎 Preview pembersihan (tidak ada file yang dihapus):")
+        cancel_token = kwargs.get('cancel_token')
+        from macan_inventory import FileInventory
+        with FileInventory() as inventory:
+            for target in DEFAULT_TARGETS:
+                paths = target.resolve()
+                if not paths:
+                    output_signal.emit(f"- {target.name}: {', '.join(target.expanded_patterns())} tidak ditemukan.")
+                for path in paths:
+                    cancel_token.raise_if_cancelled()
+                    if os.path.isdir(path):
+                        output_signal.emit(f"- {target.name} ({path}): {inventory.refresh(path).summary()}")
+                    else:
+                        output_signal.emit(f"- {target.name} ({path}): {format_bytes(os.path.getsize(path))}")
+
+    def _show_cleanup_options(self):
+        """[BARU] Dialog batas laju (file/s, MB/s) dan mode latar belakang untuk run berikutnya."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Opsi Pembersihan")
+        layout = QFormLayout(dialog)
+
+        files_spin = QSpinBox()
+        files_spin.setRange(0, 1000000)
+        files_spin.setSpecialValueText("Tanpa batas")
+        files_spin.setSuffix(" file/s")
+        files_spin.setValue(self.cleanup_options["max_files_per_sec"])
+
+        mb_spin = QDoubleSpinBox()
+        mb_spin.setRange(0, 100000)
+        mb_spin.setSpecialValueText("Tanpa batas")
+        mb_spin.setSuffix(" MB/s")
+        mb_spin.setValue(self.cleanup_options["max_mb_per_sec"])
+
+        background_check = QCheckBox("Turunkan prioritas CPU && I/O worker")
+        background_check.setChecked(self.cleanup_options["background"])
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+
+        layout.addRow("Batas file per detik:", files_spin)
+        layout.addRow("Batas MB per detik:", mb_spin)
+        layout.addRow("Mode latar belakang:", background_check)
+        layout.addRow(buttons)
+
+        if dialog.exec() == QDialog.Accepted:
+            self.cleanup_options = {
+                "max_files_per_sec": files_spin.value(),
+                "max_mb_per_sec": mb_spin.value(),
+                "background": background_check.isChecked(),
+            }
+            self.add_log(f"⚙️ Opsi pembersihan diperbarui: {self._make_engine().describe_limits() or 'tanpa batas'}")
+
+    def _make_engine(self):
+        """[BARU] Membuat DeletionEngine sesuai opsi pembersihan saat ini."""
+        return DeletionEngine(**self.cleanup_options)
+
+    def _failure_log_path(self, target_name):
+        """[BARU] Path daftar kegagalan lengkap, hanya jika opsinya diaktifkan di menu File."""
+        return default_failure_log_path(target_name) if self.save_failures_action.isChecked() else None
+
+    def _purge_leftover_tombstones(self):
+        """[BARU] Melanjutkan purge tombstone yang tertinggal dari sesi sebelumnya (misalnya crash)."""
         try:
-            if os.path.exists(db_path):
-                os.remove(db_path)
-                output_signal.emit(f"Berhasil menghapus: {db_path}")
-            else: output_signal.emit("File IconCache.db tidak ditemukan (mungkin sudah bersih).")
-        except Exception as e: output_signal.emit(f"Gagal menghapus IconCache.db: {e}")
-        output_signal.emit("Menjalankan kembali Windows Explorer...")
-        subprocess.Popen("explorer.exe", shell=True)
+            tombstones = pending_tombstones()
+        except Exception as e:
+            self.add_log(f"❌ Gagal membaca daftar tombstone: {e}")
+            return
+        if tombstones:
+            self.add_log(f"🧹 Melanjutkan purge {len(tombstones)} tombstone dari sesi sebelumnya di latar belakang...")
+            start_background_purge(tombstones, log=self.log_bridge.message.emit)
 
-def is_admin():
-    try: return ctypes.windll.shell32.IsUserAnAdmin()
-    except: return False
+    def _run_cleanup_targets(self, targets, **kwargs):
+        """[BARU] Menjalankan target pembersihan lewat pipeline deklaratif (macan_pipeline.py)."""
+        progress_signal = kwargs.get('progress_signal')
+        progress_text_signal = kwargs.get('progress_text_signal')
+        def report(progress):
+            progress_signal.emit(progress.percent())
+            progress_text_signal.emit(progress.format())
+        run_pipeline(targets, log=kwargs.get('output_signal').emit,
+                     progress=PipelineProgress(targets, report),
+                     cancel=kwargs.get('cancel_token'),
+                     engine_factory=self._make_engine,
+                     failure_log_factory=lambda target: self._failure_log_path(target.log_name),
+                     instant=self.instant_cleanup_action.isChecked(),
+                     purge_log=self.log_bridge.message.emit)
+        # Pipeline berhenti lebih awal saat dibatalkan; tugasnya harus berakhir 'dibatalkan', bukan 'selesai'
+        kwargs.get('cancel_token').raise_if_cancelled()
+
+    def _run_hooks_action(self, hooks, **kwargs):
+        """[BARU] Menjalankan hook pipeline (misalnya stop/start service) sebagai langkah graf tersendiri."""
+        log = kwargs.get('output_signal').emit
+        for hook in hooks:
+            hook(log)
+
+    def _clear_temp_action(self, **kwargs):
+        self._run_cleanup_targets([TEMP_FILES], **kwargs)
+
+    def _clear_update_cache_action(self, **kwargs):
+        self._run_cleanup_targets([UPDATE_CACHE], **kwargs)
+
+    def _reset_icon_cache_action(self, **kwargs):
+        self._run_cleanup_targets([ICON_CACHE], **kwargs)
+
+    def _clean_all_action(self, **kwargs):
+        self._run_cleanup_targets(list(DEFAULT_TARGETS), **kwargs)
 
 def main():
-    app_instance = QApplication.instance() or QApplication(sys.argv)
-    if is_admin():
-        app_instance.setStyleSheet("""
-            QWidget { font-family: "Segoe UI", sans-serif; font-size: 10pt; }
-            QMainWindow { background-color: #21252b; }
-            QMenuBar { background-color: #282c34; color: #e6e6e6; }
-            QMenuBar::item:selected { background-color: #4b5263; }
-            QMenu { background-color: #282c34; color: #e6e6e6; border: 1px solid #3a4049; }
-            QMenu::item:selected { background-color: #4b5263; }
-            #TitleLabel { font-size: 20pt; font-weight: bold; color: #e6e6e6; }
-            #SubtitleLabel { font-size: 11pt; color: #9da5b4; }
-            
-            /* --- [DIUBAH] Style ditambahkan khusus untuk dashboard info sistem --- */
-            QGroupBox#SystemInfoDashboard {
-                background-color: #282c34; border: 1px solid #3a4049;
-                border-radius: 8px; margin-top: 1ex; padding: 10px;
-            }
-            QGroupBox#SystemInfoDashboard::title {
-                subcontrol-origin: margin; subcontrol-position: top left;
-                padding: 2px 10px; background-color: #3a4049;
-                border-radius: 4px; color: #61afef; font-weight: bold;
-            }
-            /* Ini bagian yang mengubah warna font di dalam box menjadi putih */
-            QGroupBox#SystemInfoDashboard QLabel {
-                color: #e6e6e6; 
-            }
-            
-            QGroupBox#FunctionGroup {
-                background-color: #282c34; border: 1px solid #3a4049;
-                border-radius: 8px; margin-top: 1ex; padding: 10px;
-            }
-            QGroupBox#FunctionGroup::title {
-                subcontrol-origin: margin; subcontrol-position: top left;
-                padding: 2px 10px; background-color: #3a4049;
-                border-radius: 4px; color: #61afef; font-weight: bold;
-            }
-            #GroupTitle { color: #9da5b4; font-weight: bold; padding-left: 5px; }
-            QPushButton {
-                background-color: #4b5263; color: #e6e6e6; border: none;
-                padding: 8px; border-radius: 6px; font-weight: bold;
-            }
-            QPushButton:hover { background-color: #565f74; }
-            QPushButton:pressed { background-color: #424855; }
-            QPushButton:disabled { background-color: #3a4049; color: #787878; }
-            #OutputConsole {
-                background-color: #1c1f24; color: #abb2bf; font-family: "Consolas", monospace;
-                border: 1px solid #3a4049; border-radius: 6px; font-size: 9pt;
-            }
-            QProgressBar {
-                border: 1px solid #3a4049; border-radius: 5px; text-align: center;
-                color: #e6e6e6; background-color: #282c34;
-            }
-            QProgressBar::chunk { background-color: #61afef; border-radius: 4px; }
-            QScrollBar:vertical {
-                border: none; background: #282c34; width: 10px; margin: 0;
-            }
-            QScrollBar::handle:vertical { background: #4b5263; min-height: 20px; border-radius: 5px; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-        """)
+    # [DIUBAH] Hak Administrator diminta lewat relaunch_as_admin(); cabang QMessageBox lama dihapus
+    if os.name == "nt" and not is_admin():
+        relaunch_as_admin()
+    with STARTUP.phase("QApplication"):
+        app_instance = QApplication.instance() or QApplication(sys.argv)
+    app_instance.setStyleSheet("""
+        QWidget { font-family: "Segoe UI", sans-serif; font-size: 10pt; }
+        QMainWindow { background-color: #21252b; }
+        QMenuBar { background-color: #282c34; color: #e6e6e6; }
+        QMenuBar::item:selected { background-color: #4b5263; }
+        QMenu { background-color: #282c34; color: #e6e6e6; border: 1px solid #3a4049; }
+        QMenu::item:selected { background-color: #4b5263; }
+        #TitleLabel { font-size: 20pt; font-weight: bold; color: #e6e6e6; }
+        #SubtitleLabel { font-size: 11pt; color: #9da5b4; }
+        
+        /* --- [DIUBAH] Style ditambahkan khusus untuk dashboard info sistem --- */
+        QGroupBox#SystemInfoDashboard {
+            background-color: #282c34; border: 1px solid #3a4049;
+            border-radius: 8px; margin-top: 1ex; padding: 10px;
+        }
+        QGroupBox#SystemInfoDashboard::title {
+            subcontrol-origin: margin; subcontrol-position: top left;
+            padding: 2px 10px; background-color: #3a4049;
+            border-radius: 4px; color: #61afef; font-weight: bold;
+        }
+        /* Ini bagian yang mengubah warna font di dalam box menjadi putih */
+        QGroupBox#SystemInfoDashboard QLabel {
+            color: #e6e6e6; 
+        }
+        
+        QGroupBox#FunctionGroup {
+            background-color: #282c34; border: 1px solid #3a4049;
+            border-radius: 8px; margin-top: 1ex; padding: 10px;
+        }
+        QGroupBox#FunctionGroup::title {
+            subcontrol-origin: margin; subcontrol-position: top left;
+            padding: 2px 10px; background-color: #3a4049;
+            border-radius: 4px; color: #61afef; font-weight: bold;
+        }
+        #GroupTitle { color: #9da5b4; font-weight: bold; padding-left: 5px; }
+        QPushButton {
+            background-color: #4b5263; color: #e6e6e6; border: none;
+            padding: 8px; border-radius: 6px; font-weight: bold;
+        }
+        QPushButton:hover { background-color: #565f74; }
+        QPushButton:pressed { background-color: #424855; }
+        QPushButton:disabled { background-color: #3a4049; color: #787878; }
+        #OutputConsole {
+            background-color: #1c1f24; color: #abb2bf; font-family: "Consolas", monospace;
+            border: 1px solid #3a4049; border-radius: 6px; font-size: 9pt;
+        }
+        QProgressBar {
+            border: 1px solid #3a4049; border-radius: 5px; text-align: center;
+            color: #e6e6e6; background-color: #282c34;
+        }
+        QProgressBar::chunk { background-color: #61afef; border-radius: 4px; }
+        QScrollBar:vertical {
+            border: none; background: #282c34; width: 10px; margin: 0;
+        }
+        QScrollBar::handle:vertical { background: #4b5263; min-height: 20px; border-radius: 5px; }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+    """)
+    STARTUP.mark("stylesheet")
+    with STARTUP.phase("MacanConquerApp()"):
         window = MacanConquerApp()
+    with STARTUP.phase("show()"):
         window.show()
-        sys.exit(app_instance.exec())
-    else:
-        msg = "Aplikasi ini memerlukan hak Administrator untuk berfungsi dengan benar.\n\nKlik 'OK', lalu klik 'Yes' pada jendela UAC yang muncul."
-        QMessageBox.information(None, "Memerlukan Hak Admin", msg)
-        try:
-            ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
-        except Exception as e:
-            QMessageBox.critical(None, "Gagal Mendapatkan Hak Admin", f"...")
-        sys.exit(0)
+    sys.exit(app_instance.exec())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
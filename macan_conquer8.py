@@ -5,6 +5,13 @@
 # Changelog (Modifikasi):
 # - [FITUR] Ditambahkan System Info Dashboard untuk menampilkan OS, CPU, RAM, dan Uptime.
 # - [DEPENDENSI] Menambahkan 'psutil' untuk mengambil data System Info.
+# - [PERFORMA] Clear Temp & Update Cache memakai mesin penghapusan paralel (macan_cleanup.py).
+# - [PERBAIKAN] Output QProcess di-decode secara incremental per channel dengan encoding yang
+#           ditebak sekali (UTF-16LE/OEM/UTF-8), sehingga karakter tidak rusak di batas chunk.
+# - [PERFORMA] Perintah dijalankan oleh QProcessExecutor (macan_qprocess.py): berbasis sinyal tanpa
+#           thread tambahan, stdout/stderr digabung, output selalu per baris utuh, exit code dicatat,
+#           progress di status bar. Perintah berjalan satu per satu (sfc/DISM sama-sama memakai
+#           component store); klik berikutnya diantrekan, bukan ditolak.
 #
 # Cara Menjalankan:
 # 1. Install PySide6 dan psutil: pip install pyside6 psutil
@@ -18,7 +25,6 @@ import sys
 import os
 import ctypes
 import subprocess
-import shutil
 import tempfile
 # [BARU] Import yang diperlukan untuk System Info
 import platform
@@ -28,12 +34,16 @@ from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget,
     QTextEdit, QMessageBox, QHBoxLayout, QLabel, QGridLayout, QGroupBox,
-    QDialog, QScrollArea
+    QDialog, QScrollArea, QProgressBar
 )
 # [BARU] Import QTimer untuk update info secara real-time
-from PySide6.QtCore import QProcess, Qt, QTimer
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QIcon, QPixmap, QAction
 
+# [BARU] Mesin penghapusan paralel bersama (macan_cleanup.py)
+from macan_cleanup import DeletionEngine
+from macan_qprocess import QProcessExecutor
+
 class MacanConquerApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -42,10 +52,18 @@ class MacanConquerApp(QMainWindow):
         self.setGeometry(100, 100, 550, 600)
         self.setWindowIcon(self.get_icon())
 
-        self.process = None
         self.is_running = False
+        # [BARU] Satu eksekutor QProcess untuk semua perintah; tidak ada thread per perintah.
+        # Satu perintah sekaligus, sisanya antre: sfc/DISM tidak boleh berjalan bersamaan.
+        self.executor = QProcessExecutor(max_concurrent=1, parent=self)
+        self.command_progress = {}  # job.id -> persen terakhir
 
         self.init_ui()
+        self.executor.started.connect(self._on_command_started)
+        self.executor.line.connect(self._on_command_line)
+        self.executor.frame.connect(self._on_command_frame)
+        self.executor.progress.connect(self._on_command_progress)
+        self.executor.finished.connect(self._on_command_finished)
         self.add_log("Selamat datang di Macan Conquer! Aplikasi siap digunakan.")
         self.add_log("Pastikan Anda menjalankan sebagai Administrator untuk fungsionalitas penuh.")
 
@@ -100,6 +118,17 @@ class MacanConquerApp(QMainWindow):
         self.output_console.setObjectName("OutputConsole")
         self.main_layout.addWidget(self.output_console)
 
+        # --- [BARU] Progress perintah dan tombol Batal di status bar ---
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setVisible(False)
+        self.cancel_button = QPushButton("Batal")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_commands)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+
     # --- [FUNGSI BARU] Diambil dari macan_conquer5.py ---
     def create_system_info_dashboard(self):
         group_box = QGroupBox("System Information")
@@ -360,7 +389,7 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
         return path
 
     def launch_external_app(self, exe_name, app_friendly_name):
-        if self.is_running:
+        if self.is_busy():
             QMessageBox.warning(self, "Proses Berjalan", "Satu proses sudah berjalan, harap tunggu hingga selesai.")
             return
 
@@ -399,6 +428,10 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
     def get_icon(self):
         return QIcon(self.get_icon_path())
 
+    def is_busy(self):
+        """[BARU] Tugas Python atau perintah (berjalan maupun antre) sedang aktif."""
+        return self.is_running or self.executor.busy
+
     def set_controls_enabled(self, enabled):
         self.is_running = not enabled
         for button in self.button_widgets:
@@ -410,32 +443,65 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
             self.output_console.verticalScrollBar().maximum()
         )
 
-    def process_finished(self):
-        self.add_log("\n✅ === PROSES SELESAI === ✅\n")
-        self.set_controls_enabled(True)
-        self.process = None
-
-    def handle_stdout(self):
-        data = self.process.readAllStandardOutput().data().decode(errors='ignore')
-        self.add_log(data.strip())
-
-    def handle_stderr(self):
-        data = self.process.readAllStandardError().data().decode(errors='ignore')
-        self.add_log(f"ERROR: {data.strip()}")
-
-    def run_command(self, program, args):
-        if self.is_running:
-            QMessageBox.warning(self, "Proses Berjalan", "Satu proses sudah berjalan, harap tunggu hingga selesai.")
+    def run_command(self, program, args, progress_type=None):
+        # [DIUBAH] Tidak lagi ditolak saat perintah lain berjalan; QProcessExecutor mengantrekannya
+        # dan menjalankannya setelah perintah sebelumnya selesai
+        job = self.executor.submit(program, args, progress_type)
+        self.progress_bar.setVisible(True)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        return job
+
+    def cancel_commands(self):
+        """[BARU] Menghentikan semua perintah beserta process tree-nya."""
+        if self.executor.busy:
+            self.add_log("⏹️ Membatalkan perintah...")
+            self.cancel_button.setEnabled(False)
+            self.executor.cancel_all()
+
+    def _job_prefix(self, job):
+        # Penanda perintah hanya dipakai jika beberapa perintah berjalan bersamaan
+        return f"[{job.program}] " if len(self.executor.running_jobs()) > 1 else ""
+
+    def _on_command_started(self, job):
+        self.command_progress[job.id] = 0
+        self.add_log(f"🚀 Memulai: {job.command_line}")
+
+    def _on_command_line(self, job, text):
+        self.add_log(f"{self._job_prefix(job)}{text}")
+
+    def _on_command_frame(self, job, text):
+        # Frame progress ('\r') hanya ditampilkan di status bar
+        self.statusBar().showMessage(f"{self._job_prefix(job)}{text}")
+
+    def _on_command_progress(self, job, value):
+        self.command_progress[job.id] = value
+        self._update_progress_bar()
+
+    def _on_command_finished(self, job):
+        self.command_progress.pop(job.id, None)
+        self.add_log(f"\n✅ === PROSES SELESAI === ✅ {job.summary()}\n")
+        self._update_progress_bar()
+
+    def _update_progress_bar(self):
+        if not self.executor.busy:
+            self.progress_bar.setVisible(False)
+            self.cancel_button.setVisible(False)
+            self.statusBar().clearMessage()
             return
-
-        self.add_log(f"🚀 Memulai: {program} {' '.join(args)}")
-        self.set_controls_enabled(False)
-
-        self.process = QProcess()
-        self.process.readyReadStandardOutput.connect(self.handle_stdout)
-        self.process.readyReadStandardError.connect(self.handle_stderr)
-        self.process.finished.connect(self.process_finished)
-        self.process.start(program, args)
+        if self.command_progress:
+            self.progress_bar.setValue(sum(self.command_progress.values()) // len(self.command_progress))
+
+    def closeEvent(self, event):
+        """[BARU] Perintah yang masih berjalan dihentikan sebelum aplikasi ditutup."""
+        if self.executor.busy:
+            reply = QMessageBox.question(self, "Proses Berjalan", "Masih ada perintah yang berjalan. Hentikan dan keluar?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+            self.executor.cancel_all()
+        event.accept()
 
     def run_defrag(self):
         self.run_command("defrag", ["C:", "/O"])
@@ -454,7 +520,8 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
         self.run_command("DISM.exe", ["/Online", "/Cleanup-image", "/Restorehealth"])
 
     def execute_python_task(self, task_function, task_name):
-        if self.is_running:
+        # [DIUBAH] Juga menunggu perintah QProcess, agar misalnya wuauserv tidak dihentikan saat DISM berjalan
+        if self.is_busy():
             QMessageBox.warning(self, "Proses Berjalan", "Harap tunggu proses lain selesai.")
             return
 
@@ -473,17 +540,8 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
 
     def _clear_temp_action(self):
         temp_dir = tempfile.gettempdir()
-        deleted_count, failed_count = 0, 0
-        for item in os.listdir(temp_dir):
-            path = os.path.join(temp_dir, item)
-            try:
-                if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                elif os.path.isdir(path): shutil.rmtree(path)
-                deleted_count += 1
-            except Exception as e:
-                self.add_log(f"Gagal menghapus {path}: {e}")
-                failed_count += 1
-        self.add_log(f"\nRingkasan: {deleted_count} item dihapus, {failed_count} item gagal.")
+        result = DeletionEngine().delete_contents(temp_dir, log=self.add_log)
+        self.add_log(f"\n{result.summary()}")
 
     def clear_update_cache(self):
         reply = QMessageBox.question(self, "Konfirmasi",
@@ -500,17 +558,8 @@ Fungsi ini digunakan untuk mengatur konfigurasi boot sistem secara permanen (hin
 
         cache_dir = r"C:\Windows\SoftwareDistribution\Download"
         self.add_log(f"Menghapus isi dari {cache_dir}...")
-        deleted_count, failed_count = 0, 0
-        for item in os.listdir(cache_dir):
-            path = os.path.join(cache_dir, item)
-            try:
-                if os.path.isfile(path) or os.path.islink(path): os.unlink(path)
-                elif os.path.isdir(path): shutil.rmtree(path)
-                deleted_count += 1
-            except Exception as e:
-                self.add_log(f"Gagal menghapus {path}: {e}")
-                failed_count += 1
-        self.add_log(f"Ringkasan: {deleted_count} item dihapus, {failed_count} gagal.")
+        result = DeletionEngine().delete_contents(cache_dir, log=self.add_log)
+        self.add_log(result.summary())
 
         commands = [("net", "start", "wuauserv"), ("net", "start", "bits")]
         for cmd in commands:
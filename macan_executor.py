@@ -0,0 +1,162 @@
+# Nama File: macan_executor.py
+# Deskripsi: Eksekutor perintah eksternal berbasis asyncio untuk Macan Conquer. Satu event
+#            loop di thread latar belakang menjalankan banyak proses sekaligus dengan
+#            asyncio.create_subprocess_exec, men-stream output-nya (macan_stream.py), dan
+#            membatasi jumlah proses yang berjalan bersamaan (counter + asyncio.Condition,
+#            sehingga batasnya bisa diubah saat ada perintah yang berjalan).
+#
+# Integrasi dengan Qt:
+# - Loop asyncio berjalan di thread sendiri (ProactorEventLoop di Windows, yang mendukung
+#   subprocess), bukan di event loop Qt, sehingga tidak butuh dependensi tambahan.
+# - Callback on_event dipanggil dari thread loop; kirim ke GUI lewat Signal.emit() atau
+#   OutputBatcher, yang aman dipanggil dari thread mana pun.
+# - submit() mengembalikan concurrent.futures.Future yang bisa ditunggu dari Worker
+#   thread maupun dipasangi add_done_callback.
+#
+# Modul ini tidak meng-import PySide6.
+
+import asyncio
+import os
+import subprocess
+import threading
+import time
+
+from macan_stream import CHUNK_SIZE, OutputDecoder
+from macan_tasks import kill_process_tree
+
+DEFAULT_CONCURRENCY = 3
+
+
+class CommandResult:
+    """Hasil satu perintah yang dijalankan oleh CommandExecutor."""
+
+    def __init__(self, program, args):
+        self.program = program
+        self.args = list(args)
+        self.returncode = None
+        self.elapsed = 0.0
+        self.cancelled = False
+
+    @property
+    def command_line(self):
+        return " ".join([self.program] + self.args)
+
+    def summary(self):
+        if self.cancelled:
+            status = "dibatalkan"
+        elif self.returncode is None:
+            status = "tidak dijalankan"
+        else:
+            status = f"exit code {self.returncode}"
+        return f"{self.command_line}: {status} ({self.elapsed:.1f} detik)"
+
+
+class CommandExecutor:
+    """Menjalankan perintah eksternal secara bersamaan, paling banyak `max_concurrent` sekaligus."""
+
+    def __init__(self, max_concurrent=DEFAULT_CONCURRENCY):
+        self.max_concurrent = max(1, max_concurrent)
+        self._loop = asyncio.new_event_loop()
+        self._slots = None  # asyncio.Condition; dibuat di thread loop
+        self._active = 0    # Perintah yang sedang memegang slot
+        self._pids = set()  # Proses yang sedang berjalan, dihentikan oleh shutdown()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="MacanCommandLoop", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._slots = asyncio.Condition()
+        self._ready.set()
+        self._loop.run_forever()
+
+    def set_concurrency(self, max_concurrent):
+        """
+        Mengubah batas untuk semua perintah yang menunggu giliran. Perintah yang sedang berjalan
+        tidak dihentikan; jika batas diturunkan, perintah baru menunggu sampai jumlahnya di bawah batas.
+        """
+        async def apply():
+            async with self._slots:
+                self.max_concurrent = max(1, max_concurrent)
+                self._slots.notify_all()
+        asyncio.run_coroutine_threadsafe(apply(), self._loop)
+
+    async def _acquire(self):
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._active < self.max_concurrent)
+            self._active += 1
+
+    async def _release(self):
+        async with self._slots:
+            self._active -= 1
+            self._slots.notify_all()
+
+    def submit(self, program, args, on_event=None, cancel=None, encoding=None):
+        """
+        Menjadwalkan satu perintah dari thread mana pun; mengembalikan Future[CommandResult].
+
+        `on_event(kind, text)` menerima event LINE/FRAME dari stdout+stderr. Jika `cancel`
+        (CancelToken) dibatalkan, perintah yang belum mulai dilewati dan yang sedang
+        berjalan dihentikan beserta process tree-nya.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.run(program, args, on_event, cancel, encoding), self._loop)
+
+    async def run(self, program, args, on_event=None, cancel=None, encoding=None):
+        result = CommandResult(program, args)
+        await self._acquire()
+        try:
+            if cancel is not None and cancel.cancelled:
+                result.cancelled = True
+                return result
+            start = time.monotonic()
+            kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {}
+            process = await asyncio.create_subprocess_exec(
+                program, *args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs)
+            self._pids.add(process.pid)
+            unregister = cancel.on_cancel(lambda: kill_process_tree(process.pid)) if cancel else None
+            output = OutputDecoder(encoding)
+            try:
+                while True:
+                    chunk = await process.stdout.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    self._dispatch(on_event, output.feed(chunk))
+                self._dispatch(on_event, output.close())
+                result.returncode = await process.wait()
+            finally:
+                self._pids.discard(process.pid)
+                if unregister:
+                    unregister()
+            result.elapsed = time.monotonic() - start
+            result.cancelled = cancel is not None and cancel.cancelled
+        finally:
+            await self._release()
+        return result
+
+    @staticmethod
+    def _dispatch(on_event, events):
+        if on_event:
+            for kind, text in events:
+                on_event(kind, text)
+
+    def shutdown(self):
+        """
+        Dipanggil saat aplikasi ditutup: process tree yang masih berjalan dihentikan, perintah
+        yang tersisa dibatalkan, lalu event loop dan thread-nya berhenti.
+        """
+        for pid in list(self._pids):
+            kill_process_tree(pid)
+
+        async def stop():
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._loop.stop()
+
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(stop(), self._loop)
+            self._thread.join()
+        self._loop.close()
@@ -0,0 +1,140 @@
+# Nama File: macan_importtime.py
+# Deskripsi: Cek regresi cold start Macan Conquer. Mengukur waktu import modul utama dengan
+#            `python -X importtime` di interpreter baru, lalu gagal jika melewati anggaran
+#            waktu atau jika modul berat yang seharusnya ditunda ikut ter-import saat startup.
+#
+# Cara Menjalankan (Windows maupun Linux CI):
+#   python macan_importtime.py                          # semua target, hasil JSON ke stdout
+#   python macan_importtime.py macan_cli --repeat 10
+#   python macan_importtime.py --budget macan_conquer7=400
+#
+# Catatan:
+# - Setiap target di-import `--repeat` kali, masing-masing di proses baru; yang dipakai
+#   adalah nilai terkecil (paling sedikit gangguan dari proses lain). Percobaan pertama
+#   menulis .pyc, sehingga yang diukur adalah biaya import, bukan kompilasi.
+# - "forbidden": modul yang hanya boleh di-import saat pertama dipakai (lazy import di
+#   dalam fungsi), bukan saat startup.
+# - Target yang dependensi pihak ketiganya tidak terpasang (misalnya PySide6 di Linux CI)
+#   dilewati, bukan dianggap gagal.
+# - Exit code 1 jika ada target yang melewati anggaran atau meng-import modul terlarang.
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Anggaran dalam milidetik untuk import modul (tanpa startup interpreter itu sendiri).
+# tempfile dan shutil tidak dilarang untuk macan_conquer7 karena PySide6 sendiri (signature
+# loader shiboken6) sudah meng-import keduanya.
+TARGETS = {
+    "macan_cli": {
+        "budget_ms": 150,
+        "forbidden": ["PySide6", "psutil", "asyncio", "sqlite3", "subprocess", "tempfile", "shutil"],
+    },
+    "macan_conquer7": {
+        "budget_ms": 600,
+        "forbidden": ["asyncio", "sqlite3", "psutil", "subprocess", "macan_commands", "macan_volumes",
+                      "macan_executor"],
+    },
+}
+
+_LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+_MISSING_PATTERN = re.compile(r"No module named '([^']+)'")
+
+
+def measure(module):
+    """
+    Satu import `module` di interpreter baru. Mengembalikan dict dengan total (mikrodetik),
+    daftar modul yang ter-import, dan import langsung terbesar; atau {"missing": nama}
+    jika ada dependensi yang tidak terpasang.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        missing = _MISSING_PATTERN.search(result.stderr)
+        if missing:
+            return {"missing": missing.group(1)}
+        raise RuntimeError(f"import {module} gagal:\n{result.stderr.strip()}")
+    total, imported, direct = None, [], []
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        imported.append(name)
+        if name == module and indent == 0:
+            total = cumulative
+        elif indent == 2:
+            direct.append((cumulative, name))
+    return {"total": total or 0, "imported": imported, "direct": sorted(direct, reverse=True)}
+
+
+def check(module, budget_ms, forbidden, repeat):
+    runs = [measure(module) for _ in range(repeat)]
+    if "missing" in runs[0]:
+        missing = runs[0]["missing"]
+        if missing.startswith("macan_"):
+            raise RuntimeError(f"import {module} gagal: modul {missing} tidak ditemukan")
+        return {"module": module, "status": "dilewati", "missing": missing}
+    best = min(runs, key=lambda run: run["total"])
+    found = sorted({prefix for run in runs for name in run["imported"]
+                    for prefix in forbidden if name == prefix or name.startswith(prefix + ".")})
+    millis = best["total"] / 1000
+    return {
+        "module": module,
+        "status": "ok" if millis <= budget_ms and not found else "gagal",
+        "ms": round(millis, 1),
+        "budget_ms": budget_ms,
+        "runs_ms": [round(run["total"] / 1000, 1) for run in runs],
+        "forbidden_imported": found,
+        "slowest_imports": [{"module": name, "ms": round(cumulative / 1000, 1)}
+                            for cumulative, name in best["direct"][:8]],
+    }
+
+
+def _parse_budget(text):
+    module, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError(f"format MODUL=MS, bukan {text!r}")
+    return module, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek anggaran waktu import (cold start).")
+    parser.add_argument("modules", nargs="*", metavar="MODUL", help=f"Target (default: {', '.join(TARGETS)}).")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah pengukuran per target.")
+    parser.add_argument("--budget", type=_parse_budget, action="append", default=[], metavar="MODUL=MS",
+                        help="Ganti anggaran satu target, misalnya macan_cli=100.")
+    args = parser.parse_args(argv)
+
+    budgets = {module: target["budget_ms"] for module, target in TARGETS.items()}
+    budgets.update(args.budget)
+    report, failed = [], []
+    for module in args.modules or list(TARGETS):
+        forbidden = TARGETS.get(module, {}).get("forbidden", [])
+        entry = check(module, budgets.get(module, float("inf")), forbidden, max(1, args.repeat))
+        report.append(entry)
+        if entry["status"] == "dilewati":
+            print(f"-   {module:<16} dilewati ({entry['missing']} tidak terpasang)", file=sys.stderr)
+            continue
+        if entry["status"] != "ok":
+            failed.append(module)
+        slowest = ", ".join(f"{item['module']} {item['ms']:.0f} ms" for item in entry["slowest_imports"][:3])
+        print(f"{'OK ' if entry['status'] == 'ok' else 'GAGAL'} {module:<16} {entry['ms']:>7.1f} ms "
+              f"(anggaran {entry['budget_ms']:.0f} ms) terbesar: {slowest}"
+              + (f" | terlarang: {', '.join(entry['forbidden_imported'])}" if entry["forbidden_imported"] else ""),
+              file=sys.stderr)
+
+    print(json.dumps(report, indent=2))
+    if failed:
+        print(f"❌ Cold start melewati anggaran: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
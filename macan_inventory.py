@@ -0,0 +1,157 @@
+# Nama File: macan_inventory.py
+# Deskripsi: Inventaris file persisten (SQLite) untuk target pembersihan Macan Conquer.
+#            Dipakai oleh mode "Preview" untuk melaporkan ukuran dan jumlah file yang
+#            bisa dibersihkan tanpa harus menelusuri seluruh folder setiap kali diklik.
+#
+# Cara Kerja:
+# - Setiap folder disimpan bersama st_mtime_ns-nya. Di Windows (NTFS) mtime folder
+#   berubah ketika ada file/subfolder yang dibuat, dihapus, atau di-rename di dalamnya.
+# - Saat refresh, folder yang mtime-nya tidak berubah tidak di-scandir ulang; daftar
+#   file dan subfolder-nya diambil dari database. Hanya subfolder yang tetap di-stat.
+# - Catatan: perubahan ukuran file yang sudah ada tidak mengubah mtime folder, jadi
+#   angka preview bisa sedikit meleset untuk file yang sedang ditulis.
+
+import os
+import sqlite3
+import time
+
+from macan_cleanup import iter_entries, is_plain_dir, format_bytes, app_data_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_root ON dirs(root);
+CREATE INDEX IF NOT EXISTS idx_files_root ON files(root);
+CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+"""
+
+
+def default_db_path():
+    """Lokasi database inventaris: %LOCALAPPDATA%\\MacanConquer\\inventory.sqlite3."""
+    return os.path.join(app_data_dir(), "inventory.sqlite3")
+
+
+class InventoryStats:
+    """Hasil preview untuk satu target."""
+
+    def __init__(self, root, file_count=0, total_bytes=0, dir_count=0,
+                 rescanned_dirs=0, reused_dirs=0, elapsed=0.0):
+        self.root = root
+        self.file_count = file_count
+        self.total_bytes = total_bytes
+        self.dir_count = dir_count
+        self.rescanned_dirs = rescanned_dirs
+        self.reused_dirs = reused_dirs
+        self.elapsed = elapsed
+
+    def summary(self):
+        return (f"{self.file_count} file dalam {self.dir_count} folder, "
+                f"{format_bytes(self.total_bytes)} dapat dibersihkan "
+                f"(scan {self.elapsed * 1000:.0f} ms: {self.rescanned_dirs} folder dipindai ulang, "
+                f"{self.reused_dirs} dari cache)")
+
+
+class FileInventory:
+    """
+    Index path/size/mtime di SQLite dengan rescan inkremental berbasis mtime folder.
+
+    Koneksi SQLite terikat pada thread pembuatnya, jadi buat instance di thread yang
+    sama dengan pemanggil refresh() (misalnya di dalam fungsi Worker).
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or default_db_path()
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def refresh(self, root):
+        """Memperbarui index untuk `root` dan mengembalikan InventoryStats-nya."""
+        start = time.perf_counter()
+        root = os.path.abspath(root)
+        stats = InventoryStats(root)
+
+        # Muat struktur folder yang sudah dikenal sekali saja ke memori.
+        known_mtime, known_children = {}, {}
+        for path, parent, mtime_ns in self.conn.execute(
+                "SELECT path, parent, mtime_ns FROM dirs WHERE root = ?", (root,)):
+            known_mtime[path] = mtime_ns
+            known_children.setdefault(parent, []).append(path)
+
+        seen = set()
+        stack = [root]
+        with self.conn:
+            while stack:
+                path = stack.pop()
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(path)
+                if known_mtime.get(path) == mtime_ns:
+                    stats.reused_dirs += 1
+                    stack.extend(known_children.get(path, ()))
+                    continue
+                stats.rescanned_dirs += 1
+                stack.extend(self._rescan_dir(root, path, mtime_ns))
+
+            # Folder yang tidak ditemukan lagi (sudah dihapus) dibuang dari index.
+            stale = [(p,) for p in known_mtime if p not in seen]
+            self.conn.executemany("DELETE FROM files WHERE dir = ?", stale)
+            self.conn.executemany("DELETE FROM dirs WHERE path = ?", stale)
+
+        file_count, total_bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files WHERE root = ?", (root,)).fetchone()
+        stats.file_count = file_count
+        stats.total_bytes = total_bytes
+        stats.dir_count = max(len(seen) - 1, 0)  # Folder root sendiri tidak dihitung
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def _rescan_dir(self, root, path, mtime_ns):
+        """
+        Scandir satu folder, ganti baris file-nya, dan kembalikan daftar subfolder.
+        Junction/symlink dicatat sebagai satu item (seperti saat dihapus), tidak dimasuki.
+        """
+        files, subdirs = [], []
+        try:
+            for entry in iter_entries(path):
+                try:
+                    if is_plain_dir(entry):
+                        subdirs.append(entry.path)
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                files.append((entry.path, root, path, st.st_size, st.st_mtime_ns))
+        except OSError:
+            pass
+        self.conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO files (path, root, dir, size, mtime_ns) VALUES (?, ?, ?, ?, ?)", files)
+        parent = os.path.dirname(path) if path != root else None
+        self.conn.execute(
+            "INSERT OR REPLACE INTO dirs (path, root, parent, mtime_ns) VALUES (?, ?, ?, ?)",
+            (path, root, parent, mtime_ns))
+        return subdirs
@@ -0,0 +1,226 @@
+# Nama File: macan_monitor.py
+# Deskripsi: Monitor resource untuk process tree perintah eksternal (sfc, DISM, chkdsk,
+#            defrag). Menunjukkan apakah proses yang lama sedang sibuk I/O, sibuk CPU,
+#            atau diam (kemungkinan hang).
+#
+# Cara Kerja:
+# - Setiap sampel membaca proses utama dan semua turunannya
+#   (psutil.Process.children(recursive=True)); atribut per proses dibaca dalam satu
+#   oneshot() agar psutil memakai satu panggilan sistem untuk beberapa nilai.
+# - CPU% dan laju I/O dihitung dari selisih counter kumulatif antar sampel, per pid,
+#   sehingga proses anak yang baru muncul atau sudah keluar tidak merusak angka total.
+# - Periode sampling adaptif: biaya satu sampel diukur, lalu interval diatur agar total
+#   waktu sampling paling banyak `budget` (default 1%) dari waktu berjalan, dibatasi
+#   antara MIN_INTERVAL dan MAX_INTERVAL.
+# - Semua monitor yang aktif diambil sampelnya oleh satu thread bersama (_SharedSampler),
+#   masing-masing pada jadwalnya sendiri, bukan satu thread per perintah.
+#
+# Modul ini tidak meng-import PySide6. psutil di-import saat sampling pertama saja, sehingga
+# modul ini bisa di-import (misalnya oleh macan_watchdog.py) tanpa memuat psutil.
+
+import heapq
+import itertools
+import threading
+import time
+
+from macan_cleanup import format_bytes
+
+DEFAULT_BUDGET = 0.01  # Fraksi waktu yang boleh dipakai untuk sampling
+MIN_INTERVAL = 0.5
+MAX_INTERVAL = 5.0
+CPU_BUSY_PERCENT = 25.0        # Di atas ini (persen satu core) dianggap sibuk CPU
+IO_BUSY_BYTES = 1024 * 1024    # Di atas ini (byte/detik) dianggap sibuk I/O
+
+ACTIVITY_CPU = "sibuk CPU"
+ACTIVITY_IO = "sibuk I/O"
+ACTIVITY_IDLE = "diam"
+
+
+class ProcessSample:
+    """Satu sampel total process tree."""
+
+    def __init__(self):
+        self.timestamp = time.monotonic()
+        self.processes = 0
+        self.threads = 0
+        self.cpu_percent = 0.0
+        self.cpu_time = 0.0   # Detik CPU kumulatif, termasuk proses yang sudah keluar
+        self.rss = 0
+        self.read_bytes = 0
+        self.write_bytes = 0
+        self.read_rate = 0.0
+        self.write_rate = 0.0
+        self.cost = 0.0       # Detik yang dipakai untuk mengambil sampel ini
+        self.interval = 0.0   # Jeda sampai sampel berikutnya
+
+    @property
+    def io_rate(self):
+        return self.read_rate + self.write_rate
+
+    @property
+    def activity(self):
+        if self.io_rate >= IO_BUSY_BYTES:
+            return ACTIVITY_IO
+        if self.cpu_percent >= CPU_BUSY_PERCENT:
+            return ACTIVITY_CPU
+        return ACTIVITY_IDLE
+
+    def format(self):
+        return (f"CPU {self.cpu_percent:.0f}% | RAM {format_bytes(self.rss)} | "
+                f"I/O {format_bytes(self.io_rate)}/s | {self.threads} thread | {self.activity}")
+
+    def details(self):
+        return (f"{self.processes} proses, {self.threads} thread\n"
+                f"CPU {self.cpu_percent:.1f}% (100% = satu core)\n"
+                f"RAM (RSS) {format_bytes(self.rss)}\n"
+                f"Baca {format_bytes(self.read_bytes)} ({format_bytes(self.read_rate)}/s)\n"
+                f"Tulis {format_bytes(self.write_bytes)} ({format_bytes(self.write_rate)}/s)\n"
+                f"Biaya sampling {self.cost * 1000:.1f} ms, interval {self.interval:.1f} detik")
+
+
+class _SharedSampler:
+    """
+    Satu thread daemon untuk semua ProcessTreeMonitor. Antrean berisi waktu sampel
+    berikutnya per monitor; thread tidur sampai jadwal terdekat. Callback yang lambat
+    (misalnya watchdog yang mematikan process tree) menunda monitor lain sebentar saja.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._queue = []  # heap (waktu sampel berikutnya, urutan, monitor)
+        self._order = itertools.count()
+        self.thread = None
+
+    def schedule(self, monitor, due):
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._order), monitor))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="MacanMonitor", daemon=True)
+                self.thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    if self._queue and self._queue[0][0] <= now:
+                        _, _, monitor = heapq.heappop(self._queue)
+                        break
+                    self._condition.wait(self._queue[0][0] - now if self._queue else None)
+            interval = monitor._tick()
+            if interval is not None:
+                self.schedule(monitor, time.monotonic() + interval)
+
+
+_SAMPLER = _SharedSampler()
+
+
+class ProcessTreeMonitor:
+    """
+    Mengambil sampel process tree `pid` di thread sampler bersama dan memanggil
+    `callback(ProcessSample)` setiap sampel. Berhenti sendiri saat proses utama keluar.
+    """
+
+    def __init__(self, pid, callback, budget=DEFAULT_BUDGET,
+                 min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.pid = pid
+        self.callback = callback
+        self.budget = budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.last_sample = None
+        self._processes = {}  # pid -> psutil.Process, disimpan agar counter bisa diselisihkan
+        self._previous = {}   # pid -> (cpu detik, byte dibaca, byte ditulis)
+        self._previous_at = None
+        self._totals = [0, 0]  # Byte dibaca/ditulis kumulatif, termasuk proses yang sudah keluar
+        self._cpu_total = 0.0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()  # Dipegang selama satu sampel + callback
+
+    def start(self):
+        _SAMPLER.schedule(self, time.monotonic())
+        return self
+
+    def stop(self):
+        """Setelah kembali, callback tidak dipanggil lagi (kecuali stop() dari callback itu sendiri)."""
+        self._stop.set()
+        if threading.current_thread() is not _SAMPLER.thread:
+            with self._lock:
+                pass  # Menunggu sampel yang sedang diambil
+
+    def _tick(self):
+        """Satu sampel di thread sampler; mengembalikan jeda ke sampel berikutnya, atau None jika selesai."""
+        with self._lock:
+            if self._stop.is_set():
+                return None
+            sample = self.sample()
+            if sample is None:
+                return None
+            try:
+                self.callback(sample)
+            except Exception:
+                pass
+            return sample.interval
+
+    def _tree(self):
+        import psutil
+        root = self._processes.get(self.pid) or psutil.Process(self.pid)
+        tree = [root]
+        for child in root.children(recursive=True):
+            # Objek Process lama dipakai ulang agar cpu/io counter-nya konsisten
+            tree.append(self._processes.get(child.pid, child))
+        self._processes = {process.pid: process for process in tree}
+        return tree
+
+    def sample(self):
+        """Mengambil satu sampel; None jika proses utama sudah tidak ada."""
+        import psutil
+        start = time.perf_counter()
+        try:
+            tree = self._tree()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+        sample = ProcessSample()
+        current = {}
+        cpu_delta = read_delta = write_delta = 0.0
+        for process in tree:
+            try:
+                with process.oneshot():
+                    cpu = process.cpu_times()
+                    memory = process.memory_info()
+                    threads = process.num_threads()
+                    try:
+                        io = process.io_counters()
+                        read, write = io.read_bytes, io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        read = write = 0
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            cpu_total = cpu.user + cpu.system
+            previous = self._previous.get(process.pid, (0.0, 0, 0))
+            cpu_delta += cpu_total - previous[0]
+            read_delta += read - previous[1]
+            write_delta += write - previous[2]
+            current[process.pid] = (cpu_total, read, write)
+            sample.processes += 1
+            sample.threads += threads
+            sample.rss += memory.rss
+
+        self._totals[0] += read_delta
+        self._totals[1] += write_delta
+        self._cpu_total += cpu_delta
+        sample.read_bytes, sample.write_bytes = self._totals
+        sample.cpu_time = self._cpu_total
+        if self._previous_at is not None:
+            elapsed = max(sample.timestamp - self._previous_at, 1e-6)
+            sample.cpu_percent = cpu_delta / elapsed * 100
+            sample.read_rate = read_delta / elapsed
+            sample.write_rate = write_delta / elapsed
+        self._previous = current
+        self._previous_at = sample.timestamp
+
+        sample.cost = time.perf_counter() - start
+        sample.interval = min(max(sample.cost / self.budget, self.min_interval), self.max_interval)
+        self.last_sample = sample
+        return sample
@@ -0,0 +1,203 @@
+# Nama File: macan_parser_bench.py
+# Deskripsi: Uji regresi dan benchmark throughput parser progress (macan_progress.py)
+#            terhadap korpus output rekaman di corpus/progress, serta pembaca stream
+#            '\r'/'\n' (macan_stream.py) terhadap stream byte mentah di corpus/streams.
+#
+# Cara Menjalankan (tanpa PySide6):
+#   python macan_parser_bench.py                 # cek regresi + throughput, hasil JSON ke stdout
+#   python macan_parser_bench.py --update        # tulis ulang expected.json setelah perubahan yang disengaja
+#
+# Korpus:
+# - Nama file menentukan parser: 'chkdsk_legacy.txt' -> parser 'chkdsk'.
+# - expected.json berisi urutan nilai progress yang harus dihasilkan setiap file.
+# - Stream mentah (.bin) diputar ulang (termasuk output UTF-16LE seperti sfc saat di-redirect) dengan berbagai ukuran chunk; daftar LINE dan
+#   progress terakhir harus sama untuk setiap ukuran chunk dan sesuai expected.json.
+# - Exit code 1 jika ada file yang hasilnya berbeda dari expected.json.
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+
+from macan_progress import create_parser
+from macan_stream import LINE, iter_stream
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "progress")
+STREAM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "streams")
+EXPECTED_FILE = "expected.json"
+STREAM_CHUNK_SIZES = (1, 7, 64, 4096, 1 << 20)
+
+# Pola inline versi lama _run_command_with_progress, sebagai pembanding throughput.
+LEGACY_PATTERNS = {
+    "sfc": (r'Verification (\d+)% complete.', int),
+    "dism": (r'\[=+>\s*\] (\d+\.\d+)%', lambda v: int(float(v))),
+}
+
+
+def load_corpus(corpus_dir=CORPUS_DIR):
+    """{nama file: (perintah, list baris)} untuk semua file .txt di korpus."""
+    corpus = {}
+    for name in sorted(os.listdir(corpus_dir)):
+        if not name.endswith(".txt"):
+            continue
+        with open(os.path.join(corpus_dir, name), encoding="utf-8") as f:
+            lines = [line.strip() for line in f]
+        corpus[name] = (name[:-4].split("_")[0], lines)
+    return corpus
+
+
+def run_parser(command, lines):
+    parser = create_parser(command)
+    values = []
+    for line in lines:
+        value = parser.feed(line)
+        if value is not None:
+            values.append(value)
+    return values
+
+
+def run_legacy(command, lines):
+    pattern, convert = LEGACY_PATTERNS[command]
+    values = []
+    for line in lines:
+        match = re.search(pattern, line)
+        if match:
+            values.append(convert(match.group(1)))
+    return values
+
+
+def replay_stream(command, data, chunk_size):
+    """Memutar ulang stream mentah: (daftar LINE, jumlah frame, progress terakhir)."""
+    parser = create_parser(command)
+    lines, frames = [], 0
+    for kind, text in iter_stream(io.BytesIO(data), chunk_size=chunk_size):
+        text = text.strip()
+        if kind == LINE:
+            lines.append(text)
+        else:
+            frames += 1
+        if text:
+            parser.feed(text)
+    return lines, frames, parser.value
+
+
+def check_streams(stream_dir, update, min_seconds):
+    """Mengembalikan (laporan, file yang gagal); menulis expected.json jika `update`."""
+    names = sorted(name for name in os.listdir(stream_dir) if name.endswith(".bin"))
+    expected_path = os.path.join(stream_dir, EXPECTED_FILE)
+    blobs = {}
+    for name in names:
+        with open(os.path.join(stream_dir, name), "rb") as f:
+            blobs[name] = f.read()
+    if update:
+        expected = {}
+        for name in names:
+            lines, _, value = replay_stream(name[:-4].split("_")[0], blobs[name], 4096)
+            expected[name] = {"lines": lines, "final_progress": value}
+        with open(expected_path, "w", encoding="utf-8") as f:
+            json.dump(expected, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        return [], []
+
+    with open(expected_path, encoding="utf-8") as f:
+        expected = json.load(f)
+    report, failed = [], []
+    for name in names:
+        command, data = name[:-4].split("_")[0], blobs[name]
+        want = expected.get(name, {})
+        frames = {}
+        ok = True
+        for chunk_size in STREAM_CHUNK_SIZES:
+            lines, frame_count, value = replay_stream(command, data, chunk_size)
+            frames[chunk_size] = frame_count
+            ok = ok and lines == want.get("lines") and value == want.get("final_progress")
+        if not ok:
+            failed.append(name)
+        rounds, start = 0, time.perf_counter()
+        while time.perf_counter() - start < min_seconds:
+            replay_stream(command, data, 4096)
+            rounds += 1
+        elapsed = time.perf_counter() - start
+        entry = {
+            "file": name,
+            "bytes": len(data),
+            "matches_expected": ok,
+            "frames_by_chunk_size": frames,
+            "mb_per_sec": rounds * len(data) / elapsed / (1024 * 1024),
+        }
+        report.append(entry)
+        print(f"{'OK ' if ok else 'BEDA'} {name:<20} {len(data):>6} byte, frame per ukuran chunk "
+              f"{frames}, {entry['mb_per_sec']:.1f} MB/s", file=sys.stderr)
+    return report, failed
+
+
+def throughput(func, command, lines, min_seconds):
+    """Baris per detik; korpus diulang hingga minimal `min_seconds` detik."""
+    rounds, start = 0, time.perf_counter()
+    while True:
+        func(command, lines)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rounds * len(lines) / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji regresi & benchmark parser progress.")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="Folder korpus output rekaman.")
+    parser.add_argument("--streams", default=STREAM_DIR, help="Folder stream byte mentah.")
+    parser.add_argument("--update", action="store_true", help="Tulis ulang expected.json dari hasil saat ini.")
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="Durasi minimum pengukuran per file.")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus)
+    expected_path = os.path.join(args.corpus, EXPECTED_FILE)
+    results = {name: run_parser(command, lines) for name, (command, lines) in corpus.items()}
+
+    if args.update:
+        with open(expected_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+            f.write("\n")
+        check_streams(args.streams, True, args.min_seconds)
+        print(f"{expected_path} dan expected.json stream diperbarui ({len(results)} file).", file=sys.stderr)
+        return 0
+
+    with open(expected_path, encoding="utf-8") as f:
+        expected = json.load(f)
+
+    report, failed = [], []
+    for name, (command, lines) in corpus.items():
+        ok = results[name] == expected.get(name)
+        if not ok:
+            failed.append(name)
+        entry = {
+            "file": name,
+            "parser": command,
+            "lines": len(lines),
+            "emitted": len(results[name]),
+            "matches_expected": ok,
+            "lines_per_sec": throughput(run_parser, command, lines, args.min_seconds),
+        }
+        if command in LEGACY_PATTERNS:
+            entry["legacy_lines_per_sec"] = throughput(run_legacy, command, lines, args.min_seconds)
+            entry["legacy_emitted"] = len(run_legacy(command, lines))
+        report.append(entry)
+        print(f"{'OK ' if ok else 'BEDA'} {name:<20} {entry['lines']:>6} baris -> {entry['emitted']:>4} nilai, "
+              f"{entry['lines_per_sec']:>10.0f} baris/s"
+              + (f" (lama: {entry['legacy_lines_per_sec']:.0f} baris/s, {entry['legacy_emitted']} nilai)"
+                 if command in LEGACY_PATTERNS else ""), file=sys.stderr)
+
+    stream_report, stream_failed = check_streams(args.streams, False, args.min_seconds)
+    failed += stream_failed
+    print(json.dumps({"corpus": report, "streams": stream_report}, indent=2))
+    if failed:
+        print(f"❌ Hasil parser berbeda dari {EXPECTED_FILE}: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
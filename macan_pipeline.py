@@ -0,0 +1,284 @@
+# Nama File: macan_pipeline.py
+# Deskripsi: Pipeline pembersihan deklaratif Macan Conquer. Setiap target (Temp, cache
+#            Windows Update, cache ikon, ...) dideskripsikan sebagai data: pola path,
+#            hook sebelum/sesudah (stop/start service, restart Explorer) dan filter file.
+#
+# Cara Kerja:
+# - Target dikelompokkan per volume (huruf drive). Target di volume berbeda dijalankan
+#   bersamaan, target di volume yang sama berurutan agar tidak saling berebut disk.
+#   "Bersihkan Semua" selesai dalam waktu target paling lambat, bukan jumlah semuanya.
+# - Post hook selalu dijalankan jika pre hook sudah dijalankan, termasuk saat dibatalkan
+#   atau terjadi error, sehingga service dan Explorer tidak tertinggal dalam keadaan mati.
+# - Error sebuah target tidak menghentikan target lain; setelah semua selesai, error
+#   pertama diteruskan ke pemanggil agar tugasnya berakhir gagal (bukan selesai).
+# - Progress dilaporkan per target lewat PipelineProgress; persentase total adalah
+#   rata-rata persentase semua target.
+#
+# Modul ini tidak meng-import PySide6. subprocess di-import saat hook dijalankan saja.
+
+import glob
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from macan_cleanup import DeletionEngine, set_aside, start_background_purge, wait_for_purge
+
+
+# --- Hook ---
+
+def run_commands(*commands):
+    """Hook yang menjalankan perintah-perintah berurutan (misalnya 'net stop wuauserv')."""
+    def hook(log):
+        import subprocess
+        for cmd in commands:
+            log(f"Menjalankan: {' '.join(cmd)}")
+            subprocess.run(cmd, shell=True, capture_output=True)
+    return hook
+
+
+def kill_explorer(log):
+    import subprocess
+    log("Mematikan Windows Explorer...")
+    subprocess.run(["taskkill", "/f", "/im", "explorer.exe"], capture_output=True, shell=True)
+
+
+def start_explorer(log):
+    import subprocess
+    log("Menjalankan kembali Windows Explorer...")
+    subprocess.Popen("explorer.exe", shell=True)
+
+
+# --- Target ---
+
+class CleanupTarget:
+    """
+    Deskripsi satu target pembersihan.
+
+    `patterns` adalah pola path (boleh berisi %VAR% dan wildcard glob), atau callable tanpa
+    argumen yang mengembalikan path saat target dijalankan. Folder yang cocok dikosongkan isinya, file yang cocok dihapus. `pre_hooks`/`post_hooks` adalah callable
+    `hook(log)`. `entry_filter(DirEntry) -> bool` menentukan file mana yang boleh dihapus.
+    `allow_instant` mengizinkan mode rename-aside (set_aside) untuk folder target ini.
+    """
+
+    def __init__(self, name, patterns, pre_hooks=(), post_hooks=(), entry_filter=None,
+                 allow_instant=True, log_name=None):
+        self.name = name
+        self.patterns = list(patterns)
+        self.pre_hooks = list(pre_hooks)
+        self.post_hooks = list(post_hooks)
+        self.entry_filter = entry_filter
+        self.allow_instant = allow_instant and entry_filter is None
+        self.log_name = log_name or name.replace(" ", "")
+
+    def expanded_patterns(self):
+        """Pola dengan callable sudah dipanggil dan %VAR% sudah di-expand."""
+        return [os.path.expandvars(pattern() if callable(pattern) else pattern) for pattern in self.patterns]
+
+    def resolve(self):
+        """Path yang saat ini cocok dengan pola target (tanpa duplikat, urutan dijaga)."""
+        paths = []
+        for expanded in self.expanded_patterns():
+            matches = sorted(glob.glob(expanded)) if glob.has_magic(expanded) else [expanded]
+            for path in matches:
+                path = os.path.abspath(path)
+                if os.path.lexists(path) and path not in paths:
+                    paths.append(path)
+        return paths
+
+    def without_hooks(self):
+        """Salinan target tanpa hook, untuk graf tugas yang menjadikan hook langkah tersendiri."""
+        return CleanupTarget(self.name, self.patterns, entry_filter=self.entry_filter,
+                             allow_instant=self.allow_instant, log_name=self.log_name)
+
+    def volume(self):
+        """Huruf drive target; dipakai untuk menentukan target mana yang boleh paralel."""
+        if not self.patterns:
+            return ""
+        drive, _ = os.path.splitdrive(os.path.abspath(self.expanded_patterns()[0]))
+        return drive.upper()
+
+
+def _temp_dir():
+    # Dipanggil saat target dijalankan: tempfile (yang ikut memuat shutil) tidak di-import saat startup
+    import tempfile
+    return tempfile.gettempdir()
+
+
+TEMP_FILES = CleanupTarget("Temporary Files", [_temp_dir], log_name="Temp")
+
+STOP_UPDATE_SERVICES = run_commands(("net", "stop", "wuauserv"), ("net", "stop", "bits"))
+START_UPDATE_SERVICES = run_commands(("net", "start", "wuauserv"), ("net", "start", "bits"))
+
+UPDATE_CACHE = CleanupTarget(
+    "Windows Update Cache", [r"C:\Windows\SoftwareDistribution\Download"],
+    pre_hooks=[STOP_UPDATE_SERVICES], post_hooks=[START_UPDATE_SERVICES], log_name="UpdateCache")
+
+ICON_CACHE = CleanupTarget(
+    "Icon Cache", [r"%LOCALAPPDATA%\IconCache.db"],
+    pre_hooks=[kill_explorer], post_hooks=[start_explorer], log_name="IconCache")
+
+DEFAULT_TARGETS = (TEMP_FILES, UPDATE_CACHE, ICON_CACHE)
+
+
+# --- Progress & Hasil ---
+
+class PipelineProgress:
+    """Progress per target yang dilaporkan bersamaan dari beberapa thread."""
+
+    def __init__(self, targets, callback):
+        self.names = [target.name for target in targets]
+        self.percents = dict.fromkeys(self.names, 0)
+        self.callback = callback
+        self._lock = threading.Lock()
+
+    def update(self, name, percent):
+        with self._lock:
+            self.percents[name] = percent
+        if self.callback:
+            self.callback(self)
+
+    def percent(self):
+        with self._lock:
+            return int(sum(self.percents.values()) / len(self.percents)) if self.percents else 100
+
+    def format(self):
+        with self._lock:
+            parts = [f"{name} {self.percents[name]}%" for name in self.names]
+        return f"Membersihkan... {self.percent()}% | " + " | ".join(parts)
+
+
+class TargetResult:
+    """Hasil satu target: hasil DeletionEngine per folder, tombstone, dan durasi hook."""
+
+    def __init__(self, name):
+        self.name = name
+        self.results = []
+        self.removed_files = 0
+        self.tombstones = []
+        self.hook_window = None  # Detik antara pre hook selesai dan post hook selesai
+        self.elapsed = 0.0
+        self.error = None
+
+
+# --- Eksekusi ---
+
+def _run_target(result, target, log, progress, cancel, engine, failure_log, instant):
+    """Mengisi `result`; error dicatat di result.error lalu diteruskan setelah post hook."""
+    start = time.monotonic()
+    hooks_started = False
+    hooked_at = None
+    try:
+        if cancel is not None and cancel.cancelled:
+            log("⏹️ Dibatalkan, target dilewati.")
+            return result
+        hooks_started = True
+        for hook in target.pre_hooks:
+            hook(log)
+        hooked_at = time.monotonic()
+
+        paths = target.resolve()
+        if not paths:
+            log(f"Tidak ada yang cocok dengan {', '.join(target.expanded_patterns())} (mungkin sudah bersih).")
+        for index, path in enumerate(paths):
+            if cancel is not None and cancel.cancelled:
+                log("⏹️ Dibatalkan, sisa path dilewati.")
+                break
+            if not os.path.isdir(path) or os.path.islink(path):
+                try:
+                    os.remove(path)
+                    result.removed_files += 1
+                    log(f"Berhasil menghapus: {path}")
+                except OSError as e:
+                    log(f"Gagal menghapus {path}: {e}")
+            elif instant and target.allow_instant:
+                result.tombstones.append(set_aside(path, log=log))
+            else:
+                log(f"Menghapus isi dari {path}...")
+                base = index / len(paths)
+                report = None
+                if progress is not None:
+                    report = lambda tracker, base=base: progress.update(
+                        target.name, int((base + tracker.ratio() / len(paths)) * 100))
+                cleanup = engine.delete_contents(path, log=log, progress=report,
+                                                 failure_log=failure_log, cancel=cancel,
+                                                 entry_filter=target.entry_filter)
+                result.results.append(cleanup)
+                log(cleanup.summary())
+    except Exception as e:
+        result.error = e
+        log(f"Error saat membersihkan {target.name}: {e}")
+        raise
+    finally:
+        # Post hook tetap dijalankan agar service/Explorer tidak tertinggal dalam keadaan mati.
+        if hooks_started:
+            for hook in target.post_hooks:
+                try:
+                    hook(log)
+                except Exception as e:
+                    log(f"Post hook gagal: {e}")
+            if hooked_at is not None and target.pre_hooks:
+                result.hook_window = time.monotonic() - hooked_at
+                log(f"Jeda antara pre hook dan post hook: {result.hook_window:.1f} detik.")
+        if progress is not None:
+            progress.update(target.name, 100)
+        result.elapsed = time.monotonic() - start
+    return result
+
+
+def run_pipeline(targets, log=None, progress=None, cancel=None, engine_factory=DeletionEngine,
+                 failure_log_factory=None, instant=False, purge_log=None, wait_purge=False):
+    """
+    Menjalankan `targets`; target di volume berbeda berjalan bersamaan.
+
+    `progress` adalah PipelineProgress (atau None). `engine_factory()` membuat
+    DeletionEngine untuk setiap target, `failure_log_factory(target)` mengembalikan path
+    daftar kegagalan (atau None). Pada mode `instant`, tombstone di-purge di latar
+    belakang setelah post hook target tersebut selesai, dengan engine dari `engine_factory`
+    dan daftar kegagalan yang sama; dengan `wait_purge` (mode headless), run_pipeline
+    baru kembali setelah purge selesai atau dibatalkan. Mengembalikan list TargetResult
+    dengan urutan yang sama seperti `targets`; jika ada target yang error, error pertama
+    di-raise setelah semua target selesai.
+    """
+    log = log or (lambda message: None)
+    start = time.monotonic()
+
+    groups = {}
+    for target in targets:
+        groups.setdefault(target.volume(), []).append(target)
+
+    def run_group(group):
+        results = []
+        for target in group:
+            target_log = lambda message, name=target.name: log(f"[{name}] {message}")
+            failure_log = failure_log_factory(target) if failure_log_factory else None
+            result = TargetResult(target.name)
+            try:
+                _run_target(result, target, target_log, progress, cancel, engine_factory(),
+                            failure_log, instant)
+            except Exception as e:
+                result.error = e  # Dilaporkan setelah semua target selesai
+            if result.tombstones:
+                target_log("Isi lama akan dihapus di latar belakang.")
+                purge = start_background_purge(result.tombstones, log=purge_log or log,
+                                               engine_factory=engine_factory, failure_log=failure_log)
+                if wait_purge:
+                    wait_for_purge(purge, cancel, target_log)
+            results.append(result)
+        return results
+
+    if len(groups) > 1:
+        log(f"Menjalankan {len(targets)} target di {len(groups)} volume secara paralel.")
+    with ThreadPoolExecutor(max_workers=max(len(groups), 1), thread_name_prefix="MacanPipeline") as pool:
+        finished = [result for results in pool.map(run_group, groups.values()) for result in results]
+
+    by_name = {result.name: result for result in finished}
+    ordered = [by_name[target.name] for target in targets]
+    serial = sum(result.elapsed for result in ordered)
+    log(f"Pipeline selesai dalam {time.monotonic() - start:.1f} detik "
+        f"(total waktu per target {serial:.1f} detik).")
+    failed = [result for result in ordered if result.error is not None]
+    if failed:
+        log(f"❌ {len(failed)} target gagal: {', '.join(result.name for result in failed)}")
+        raise failed[0].error
+    return ordered
@@ -0,0 +1,163 @@
+# Nama File: macan_progress.py
+# Deskripsi: Registry parser progress untuk output perintah eksternal (sfc, DISM, chkdsk,
+#            defrag). Setiap parser adalah objek stateful dengan regex yang dikompilasi
+#            sekali saat import, dan hanya mengembalikan nilai jika persentasenya berubah,
+#            sehingga progress bar tidak dibanjiri nilai yang sama berulang-ulang.
+#
+# Cara Pakai:
+#   parser = create_parser("chkdsk")       # atau create_parser("C:\\...\\DISM.exe")
+#   for line in output:
+#       value = parser.feed(line)
+#       if value is not None: progress_signal.emit(value)
+#
+# Parser baru didaftarkan dengan register_parser("nama", Kelas). Korpus output rekaman
+# untuk uji regresi dan throughput ada di folder corpus/progress (lihat macan_parser_bench.py).
+#
+# Modul ini tidak meng-import PySide6.
+
+import os
+import re
+
+
+class ProgressParser:
+    """
+    Parser dasar. Subclass mengimplementasikan parse(line) -> persen (float) atau None.
+
+    feed() membulatkan ke int 0..100 dan hanya mengembalikan nilai yang berbeda dari
+    nilai terakhir. `label` berisi tahap yang sedang berjalan (jika tool-nya punya tahap).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.label = None
+
+    def parse(self, line):
+        raise NotImplementedError
+
+    def feed(self, line):
+        percent = self.parse(line)
+        if percent is None:
+            return None
+        value = max(0, min(100, int(percent)))
+        if value == self.value:
+            return None
+        self.value = value
+        return value
+
+
+class SfcParser(ProgressParser):
+    """'Verification 42% complete.'"""
+
+    PATTERN = re.compile(r'Verification (\d+)% complete')
+
+    def parse(self, line):
+        if '%' not in line:
+            return None
+        match = self.PATTERN.search(line)
+        return int(match.group(1)) if match else None
+
+
+class DismParser(ProgressParser):
+    """'[=====        10.0%        ]' (format DISM) atau '[===>   ] 10.0%'."""
+
+    PATTERN = re.compile(r'\[[=\s>]*(?:(\d+(?:\.\d+)?)%[=\s]*\]|\]\s*(\d+(?:\.\d+)?)%)')
+
+    def parse(self, line):
+        if '%' not in line:  # Jalur cepat: sebagian besar baris DISM bukan progress
+            return None
+        match = self.PATTERN.search(line)
+        if not match:
+            return None
+        return float(match.group(1) or match.group(2))
+
+
+class ChkdskParser(ProgressParser):
+    """
+    chkdsk Windows 10/11: 'Stage 2: ...' lalu 'Progress: x of y done; Stage: 40%; Total: 27%'.
+    chkdsk lama: 'CHKDSK is verifying files (stage 1 of 3)...' lalu '25 percent complete.'
+
+    Jika baris 'Total:' tersedia, nilainya dipakai langsung. Jika tidak, progress total
+    dihitung dari tahap saat ini: ((tahap - 1) + persen tahap / 100) / jumlah tahap.
+    """
+
+    DEFAULT_STAGES = 3
+    STAGE_OF = re.compile(r'stage (\d+) of (\d+)', re.IGNORECASE)
+    STAGE_HEADER = re.compile(r'^\s*Stage (\d+):\s*(.*?)\s*\.*\s*$')
+    TOTAL = re.compile(r'Total:\s*(\d+)%')
+    STAGE_PERCENT = re.compile(r'Stage:\s*(\d+)%|(\d+) percent complete', re.IGNORECASE)
+
+    def reset(self):
+        super().reset()
+        self.stage = 1
+        self.stages = self.DEFAULT_STAGES
+
+    def parse(self, line):
+        if 'tage' in line:
+            match = self.STAGE_OF.search(line)
+            if match:
+                self.stage, self.stages = int(match.group(1)), int(match.group(2))
+                self.label = f"Tahap {self.stage}/{self.stages}"
+            else:
+                match = self.STAGE_HEADER.match(line)
+                if match:
+                    self.stage = int(match.group(1))
+                    self.stages = max(self.stages, self.stage)
+                    self.label = f"Tahap {self.stage}/{self.stages}"
+        if '%' not in line and 'percent' not in line:
+            return None
+        match = self.TOTAL.search(line)
+        if match:
+            return int(match.group(1))
+        match = self.STAGE_PERCENT.search(line)
+        if not match:
+            return None
+        stage_percent = int(match.group(1) or match.group(2))
+        return ((self.stage - 1) + stage_percent / 100) * 100 / self.stages
+
+
+class DefragParser(ProgressParser):
+    """
+    '\tDefragmentation:  45% complete...', 'Retrim:  100% complete.', dst.
+
+    Setiap pass (Analysis, Retrim, Pre-Optimization, Defragmentation, ...) berjalan dari
+    0 sampai 100%; nama pass disimpan di `label` dan progress di-reset saat pass berganti.
+    """
+
+    PATTERN = re.compile(r'^\s*([A-Za-z][A-Za-z \-]*?):\s*(\d+)% complete')
+
+    def parse(self, line):
+        match = self.PATTERN.match(line)
+        if not match:
+            return None
+        if match.group(1) != self.label:
+            self.label = match.group(1)
+            self.value = None
+        return int(match.group(2))
+
+
+PARSERS = {
+    "sfc": SfcParser,
+    "dism": DismParser,
+    "chkdsk": ChkdskParser,
+    "defrag": DefragParser,
+}
+
+
+def register_parser(name, factory):
+    """Mendaftarkan parser untuk perintah `name` (tanpa path dan tanpa .exe, huruf kecil)."""
+    PARSERS[name.lower()] = factory
+
+
+def command_key(program):
+    """'C:\\Windows\\System32\\DISM.exe' -> 'dism'."""
+    name = os.path.basename(program).lower()
+    return name[:-4] if name.endswith(".exe") else name
+
+
+def create_parser(program):
+    """Instance parser baru untuk `program` (nama atau path), atau None jika tidak dikenal."""
+    factory = PARSERS.get(command_key(program))
+    return factory() if factory else None
@@ -0,0 +1,169 @@
+# Nama File: macan_qprocess.py
+# Deskripsi: Eksekutor perintah eksternal berbasis sinyal QProcess untuk Macan Conquer.
+#            Semua perintah berjalan di event loop Qt tanpa QThread atau thread OS
+#            tambahan per perintah; output selalu sampai sebagai baris utuh.
+#
+# Cara Kerja:
+# - stdout dan stderr digabung (QProcess.MergedChannels) lalu di-decode secara
+#   incremental dan dirakit menjadi baris oleh OutputDecoder (macan_stream.py), sehingga
+#   chunk dari readyReadStandardOutput tidak lagi memotong baris.
+# - Frame progress yang digambar ulang dengan '\r' dikirim lewat sinyal `frame`, nilai
+#   progress dari parser macan_progress.py lewat sinyal `progress` (hanya saat berubah).
+# - Exit code dan status crash dicatat di CommandJob; perintah yang gagal dijalankan
+#   (FailedToStart) juga diakhiri dengan sinyal `finished`.
+# - Paling banyak `max_concurrent` proses berjalan bersamaan; sisanya antre.
+#
+# Butuh PySide6 (QObject/QProcess); dipakai oleh macan_conquer8.py.
+
+import collections
+import time
+
+from PySide6.QtCore import QObject, QProcess, Signal
+
+from macan_executor import DEFAULT_CONCURRENCY
+from macan_progress import create_parser
+from macan_stream import LINE, OutputDecoder
+
+
+class CommandJob:
+    """Satu perintah di QProcessExecutor."""
+
+    def __init__(self, job_id, program, args, progress_type=None):
+        self.id = job_id
+        self.program = program
+        self.args = list(args)
+        self.process = None
+        self.decoder = None
+        self.parser = create_parser(progress_type or program)
+        self.returncode = None
+        self.crashed = False
+        self.cancelled = False
+        self.error = None
+        self.started_at = None
+        self.elapsed = 0.0
+        self.lines = 0
+
+    @property
+    def command_line(self):
+        return " ".join([self.program] + self.args)
+
+    def summary(self):
+        if self.cancelled:
+            status = "dibatalkan"
+        elif self.error:
+            status = self.error
+        elif self.crashed:
+            status = f"berhenti tidak normal (exit code {self.returncode})"
+        else:
+            status = f"exit code {self.returncode}"
+        return f"{self.command_line}: {status} ({self.elapsed:.1f} detik, {self.lines} baris)"
+
+
+class QProcessExecutor(QObject):
+    """Menjalankan perintah eksternal lewat sinyal QProcess; semua sinyal dikirim di GUI thread."""
+
+    started = Signal(object)         # CommandJob
+    line = Signal(object, str)       # CommandJob, baris lengkap
+    frame = Signal(object, str)      # CommandJob, frame progress yang digambar ulang dengan '\r'
+    progress = Signal(object, int)   # CommandJob, persen
+    finished = Signal(object)        # CommandJob (returncode, crashed, cancelled, error)
+
+    def __init__(self, max_concurrent=DEFAULT_CONCURRENCY, parent=None):
+        super().__init__(parent)
+        self.max_concurrent = max(1, max_concurrent)
+        self._next_id = 1
+        self._pending = collections.deque()
+        self._running = {}
+
+    @property
+    def busy(self):
+        return bool(self._running or self._pending)
+
+    def running_jobs(self):
+        return list(self._running.values())
+
+    def submit(self, program, args, progress_type=None):
+        """Menjadwalkan perintah; mengembalikan CommandJob (langsung jalan atau antre)."""
+        job = CommandJob(self._next_id, program, args, progress_type)
+        self._next_id += 1
+        self._pending.append(job)
+        self._start_pending()
+        return job
+
+    def cancel_all(self):
+        """Perintah yang antre dibuang; yang berjalan dihentikan beserta process tree-nya."""
+        while self._pending:
+            job = self._pending.popleft()
+            job.cancelled = True
+            self.finished.emit(job)
+        for job in list(self._running.values()):
+            job.cancelled = True
+            self._kill_tree(job.process)
+
+    @staticmethod
+    def _kill_tree(process):
+        # Tanpa menunggu (tidak memblokir GUI thread): anak-anak (misalnya DismHost.exe) di-kill
+        # lebih dulu, lalu prosesnya sendiri. finished() datang lewat sinyal QProcess.
+        try:
+            import psutil
+            for child in psutil.Process(process.processId()).children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.NoSuchProcess:
+                    pass
+        except Exception:
+            pass
+        process.kill()
+
+    def _start_pending(self):
+        while self._pending and len(self._running) < self.max_concurrent:
+            self._start(self._pending.popleft())
+
+    def _start(self, job):
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.MergedChannels)
+        job.process = process
+        job.decoder = OutputDecoder()
+        job.started_at = time.monotonic()
+        self._running[job.id] = job
+        process.readyReadStandardOutput.connect(lambda: self._read(job))
+        process.finished.connect(lambda code, status: self._finish(job, code, status == QProcess.CrashExit))
+        process.errorOccurred.connect(lambda error: self._error(job, error))
+        self.started.emit(job)
+        process.start(job.program, job.args)
+
+    def _read(self, job):
+        self._dispatch(job, job.decoder.feed(job.process.readAllStandardOutput().data()))
+
+    def _dispatch(self, job, events):
+        for kind, text in events:
+            text = text.strip()
+            if not text:
+                continue
+            if kind == LINE:
+                job.lines += 1
+                self.line.emit(job, text)
+            else:
+                self.frame.emit(job, text)
+            value = job.parser.feed(text) if job.parser else None
+            if value is not None:
+                self.progress.emit(job, value)
+
+    def _error(self, job, error):
+        # Hanya FailedToStart yang tidak diikuti finished(); error lain ditangani di _finish.
+        if error == QProcess.FailedToStart and job.id in self._running:
+            job.error = f"gagal dijalankan ({job.process.errorString()})"
+            self._finish(job, None, False)
+
+    def _finish(self, job, code, crashed):
+        if self._running.pop(job.id, None) is None:
+            return
+        self._read(job)  # Sisa data yang belum dibaca sebelum finished()
+        self._dispatch(job, job.decoder.close())
+        job.returncode = code
+        job.crashed = crashed and not job.cancelled
+        job.elapsed = time.monotonic() - job.started_at
+        job.process.deleteLater()
+        job.process = None
+        self.finished.emit(job)
+        self._start_pending()
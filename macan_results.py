@@ -0,0 +1,187 @@
+# Nama File: macan_results.py
+# Deskripsi: Cache hasil pemindaian integritas (sfc, DISM) untuk Macan Conquer. Jika tidak
+#            ada yang berubah sejak pemindaian bersih terakhir, hasilnya ditampilkan
+#            langsung tanpa menjalankan pemindaian penuh lagi.
+#
+# Cara Kerja:
+# - Setiap hasil disimpan bersama fingerprint murah dari input-nya: perintah dan
+#   argumen, build OS (platform.version()), serta ukuran & mtime sekumpulan file/folder
+#   yang diawasi (misalnya folder servicing\Packages yang berubah saat update terpasang).
+# - Hasil dianggap masih berlaku jika umurnya belum melewati TTL perintah tersebut dan
+#   fingerprint-nya sama.
+# - Aturan per perintah (CachePolicy): TTL, file yang diawasi, pola output yang menandakan
+#   hasil bersih, pola yang menandakan kerusakan/perbaikan (hasil seperti itu tidak pernah
+#   di-cache walaupun pola bersih juga muncul), dan perintah lain
+#   yang hasilnya ikut kedaluwarsa (DISM RestoreHealth mengubah component store yang
+#   dipakai sfc).
+# - Disimpan sebagai JSON di %LOCALAPPDATA%\MacanConquer\results.json.
+#
+# Modul ini tidak meng-import PySide6.
+
+import hashlib
+import json
+import os
+import platform
+import re
+import threading
+import time
+
+from macan_cleanup import app_data_dir, format_duration
+from macan_progress import command_key
+
+SUMMARY_LINES = 20  # Baris output terakhir yang disimpan sebagai ringkasan
+
+_SERVICING_FILES = [
+    r"%WINDIR%\servicing\Packages",
+    r"%WINDIR%\WinSxS",
+    r"%WINDIR%\WinSxS\pending.xml",
+    r"%WINDIR%\System32\ntoskrnl.exe",
+    r"%WINDIR%\SoftwareDistribution\ReportingEvents.log",
+]
+
+
+class CachePolicy:
+    """Aturan cache untuk satu perintah."""
+
+    def __init__(self, ttl, watched=(), clean_patterns=(), dirty_patterns=(), invalidates=()):
+        self.ttl = ttl
+        self.watched = list(watched)
+        self.clean_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in clean_patterns]
+        self.dirty_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in dirty_patterns]
+        self.invalidates = tuple(invalidates)
+
+    def is_clean(self, returncode, lines):
+        """Hanya hasil tanpa error dan tanpa kerusakan/perbaikan yang boleh di-cache."""
+        if returncode != 0:
+            return False
+        if any(pattern.search(line) for pattern in self.dirty_patterns for line in lines):
+            return False
+        if not self.clean_patterns:
+            return True
+        return any(pattern.search(line) for pattern in self.clean_patterns for line in lines)
+
+
+POLICIES = {
+    "sfc": CachePolicy(
+        ttl=24 * 3600, watched=_SERVICING_FILES,
+        clean_patterns=[r"did not find any integrity violations"],
+        dirty_patterns=[r"found corrupt files", r"\brepaired\b"]),
+    "dism": CachePolicy(
+        ttl=7 * 24 * 3600, watched=_SERVICING_FILES,
+        clean_patterns=[r"No component store corruption detected",
+                        r"The restore operation completed successfully"],
+        # RestoreHealth yang memperbaiki store juga diakhiri "restore operation completed successfully"
+        dirty_patterns=[r"\brepaired\b", r"\brepairable\b", r"source files could not be found"],
+        invalidates=("sfc",)),
+}
+
+
+def _stat_fingerprint(path):
+    try:
+        st = os.stat(os.path.expandvars(path))
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def fingerprint(program, args, policy):
+    """Hash dari perintah, argumen, build OS, dan stat file yang diawasi."""
+    data = [command_key(program), list(args), platform.version(),
+            [(path, _stat_fingerprint(path)) for path in policy.watched]]
+    return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+class CachedResult:
+    def __init__(self, command_line, finished_at, returncode, summary):
+        self.command_line = command_line
+        self.finished_at = finished_at
+        self.returncode = returncode
+        self.summary = summary
+
+    @property
+    def age(self):
+        return time.time() - self.finished_at
+
+    def describe(self):
+        finished = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.finished_at))
+        return f"{self.command_line} selesai {finished} ({format_duration(self.age)} yang lalu)"
+
+
+class ResultCache:
+    """Cache hasil per perintah + argumen; aman dipakai dari beberapa thread."""
+
+    def __init__(self, path=None, policies=None):
+        self.path = path or os.path.join(app_data_dir(), "results.json")
+        self.policies = POLICIES if policies is None else policies
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(program, args):
+        return " ".join([command_key(program)] + list(args)).lower()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=1, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def policy(self, program):
+        return self.policies.get(command_key(program))
+
+    def lookup(self, program, args):
+        """CachedResult yang masih berlaku, atau None (tanpa policy, kedaluwarsa, atau input berubah)."""
+        policy = self.policy(program)
+        if policy is None:
+            return None
+        with self._lock:
+            entry = self._read().get(self._key(program, args))
+        if not entry or time.time() - entry["finished_at"] > policy.ttl:
+            return None
+        if entry["fingerprint"] != fingerprint(program, args, policy):
+            return None
+        return CachedResult(entry["command_line"], entry["finished_at"], entry["returncode"], entry["summary"])
+
+    def store(self, program, args, returncode, lines):
+        """
+        Menyimpan hasil jika bersih menurut policy-nya; hasil perintah yang di-`invalidates`
+        dihapus. Mengembalikan True jika hasil disimpan.
+        """
+        policy = self.policy(program)
+        if policy is None:
+            return False
+        lines = list(lines)
+        with self._lock:
+            entries = self._read()
+            key = self._key(program, args)
+            stale = [k for k in entries if k == key or k.split(" ", 1)[0] in policy.invalidates]
+            for k in stale:
+                del entries[k]
+            clean = policy.is_clean(returncode, lines)
+            if clean:
+                entries[key] = {
+                    "command_line": " ".join([program] + list(args)),
+                    "finished_at": time.time(),
+                    "returncode": returncode,
+                    "fingerprint": fingerprint(program, args, policy),
+                    "summary": lines[-SUMMARY_LINES:],
+                }
+            if clean or stale:
+                self._write(entries)
+        return clean
+
+    def invalidate(self, program=None):
+        """Menghapus hasil satu perintah, atau semua hasil jika `program` None."""
+        with self._lock:
+            entries = self._read()
+            if program is not None:
+                entries = {k: v for k, v in entries.items() if k.split(" ", 1)[0] != command_key(program)}
+            else:
+                entries = {}
+            self._write(entries)
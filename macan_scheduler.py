@@ -0,0 +1,264 @@
+# Nama File: macan_scheduler.py
+# Deskripsi: Penjadwal tugas berbasis DAG untuk Macan Conquer. Menggantikan kunci global
+#            `is_running`: setiap tugas mendeklarasikan dependensi (misalnya DISM
+#            RestoreHealth sebelum sfc) dan resource yang dipakainya secara eksklusif
+#            (misalnya 'servicing' untuk sfc/DISM, 'volume:C:' untuk chkdsk/defrag).
+#
+# Aturan:
+# - Tugas mulai berjalan jika semua dependensinya selesai dan resource-nya bebas.
+#   Cabang yang saling independen berjalan bersamaan, sehingga satu graf selesai dalam
+#   waktu critical path-nya, bukan jumlah semua langkah.
+# - Jika dependensi gagal/dilewati/dibatalkan, tugas ikut dilewati, kecuali tugas
+#   `always=True` (misalnya menyalakan kembali service) yang tetap dijalankan.
+# - Tugas dari klik tombol lain yang memakai resource yang sama menunggu giliran,
+#   bukan ditolak.
+# - Setelah shutdown(), tugas `always=True` yang masih menunggu dijalankan langsung di
+#   thread yang menyelesaikan dependensinya, karena thread pool sudah ditutup.
+#
+# Modul ini tidak meng-import PySide6. on_change dipanggil dari thread mana pun.
+
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from macan_tasks import CancelToken, TaskCancelled
+
+PENDING = "menunggu"
+RUNNING = "berjalan"
+DONE = "selesai"
+FAILED = "gagal"
+SKIPPED = "dilewati"
+CANCELLED = "dibatalkan"
+FINISHED_STATES = (DONE, FAILED, SKIPPED, CANCELLED)
+
+DEFAULT_MAX_TASKS = 8
+_task_ids = itertools.count(1)
+
+
+class Task:
+    """
+    Satu langkah dalam graf. `function(cancel_token)` dijalankan di thread pool;
+    kembali normal berarti selesai, TaskCancelled berarti dibatalkan, exception lain
+    berarti gagal.
+    """
+
+    def __init__(self, name, function, deps=(), resources=(), always=False):
+        self.id = next(_task_ids)
+        self.name = name
+        self.function = function
+        self.deps = list(deps)
+        self.resources = frozenset(resources)
+        self.always = always
+        self.graph = None
+        self.state = PENDING
+        self.progress = 0
+        self.progress_text = ""
+        self.usage = None  # Sampel resource terakhir process tree-nya (macan_monitor.py), jika ada
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_token = CancelToken()
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    @property
+    def duration(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+class TaskGraph:
+    """Sekumpulan tugas yang dikirim bersama; dipakai untuk ringkasan critical path."""
+
+    def __init__(self, name, tasks):
+        self.name = name
+        self.tasks = list(tasks)
+        self.created_at = time.monotonic()
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return all(task.finished for task in self.tasks)
+
+    def elapsed(self):
+        return (self.finished_at or time.monotonic()) - self.created_at
+
+    def serial_time(self):
+        """Total durasi semua langkah jika dijalankan satu per satu."""
+        return sum(task.duration for task in self.tasks)
+
+    def critical_path(self):
+        """(durasi, [tugas]) jalur dependensi terpanjang berdasarkan durasi sebenarnya."""
+        best = {}
+        for task in _topological(self.tasks):
+            previous = max((best[dep.id] for dep in task.deps if dep.id in best),
+                           key=lambda entry: entry[0], default=(0.0, []))
+            best[task.id] = (previous[0] + task.duration, previous[1] + [task])
+        return max(best.values(), key=lambda entry: entry[0], default=(0.0, []))
+
+    def summary(self):
+        length, path = self.critical_path()
+        counts = {}
+        for task in self.tasks:
+            counts[task.state] = counts.get(task.state, 0) + 1
+        states = ", ".join(f"{count} {state}" for state, count in counts.items())
+        return (f"{self.name}: {states}. Selesai dalam {self.elapsed():.1f} detik "
+                f"(critical path {length:.1f} detik: {' -> '.join(t.name for t in path) or '-'}; "
+                f"jumlah semua langkah {self.serial_time():.1f} detik).")
+
+
+def _topological(tasks):
+    """Urutan topologis (Kahn); ValueError jika ada siklus."""
+    ids = {task.id for task in tasks}
+    indegree = {task.id: sum(1 for dep in task.deps if dep.id in ids) for task in tasks}
+    dependents = {task.id: [] for task in tasks}
+    for task in tasks:
+        for dep in task.deps:
+            if dep.id in ids:
+                dependents[dep.id].append(task)
+    queue = [task for task in tasks if indegree[task.id] == 0]
+    ordered = []
+    while queue:
+        task = queue.pop(0)
+        ordered.append(task)
+        for child in dependents[task.id]:
+            indegree[child.id] -= 1
+            if indegree[child.id] == 0:
+                queue.append(child)
+    if len(ordered) != len(tasks):
+        raise ValueError("Graf tugas memiliki dependensi melingkar.")
+    return ordered
+
+
+class Scheduler:
+    """Menjalankan graf tugas dengan dependensi dan resource eksklusif."""
+
+    def __init__(self, max_tasks=DEFAULT_MAX_TASKS, on_change=None):
+        self.on_change = on_change
+        self._pool = ThreadPoolExecutor(max_workers=max_tasks, thread_name_prefix="MacanTask")
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)  # Diberi tahu setiap ada tugas selesai
+        self._closed = False
+        self._pending = []  # Urutan kirim dijaga agar tugas lama didahulukan
+        self._held = set()
+        self._running = []
+
+    def submit(self, tasks, name=None):
+        """Mengirim graf baru; dependensi harus ada di `tasks` atau sudah dikirim sebelumnya."""
+        graph = TaskGraph(name or tasks[0].name, tasks)
+        _topological(graph.tasks)
+        for task in graph.tasks:
+            task.graph = graph
+        with self._lock:
+            self._pending.extend(graph.tasks)
+        for task in graph.tasks:
+            self._notify(task)
+        self._dispatch()
+        return graph
+
+    def active_tasks(self):
+        with self._lock:
+            return self._running + self._pending
+
+    @property
+    def busy(self):
+        with self._lock:
+            return bool(self._running or self._pending)
+
+    def cancel_all(self):
+        """
+        Tugas yang menunggu dibatalkan; tugas yang berjalan diminta berhenti. Tugas
+        `always=True` tetap menunggu dan dijalankan setelah dependensinya selesai, agar
+        langkah pemulihan (misalnya 'net start wuauserv') tidak ikut hilang.
+        """
+        with self._lock:
+            pending = [task for task in self._pending if not task.always]
+            self._pending = [task for task in self._pending if task.always]
+            running = list(self._running)
+        for task in pending:
+            self._finish(task, CANCELLED)
+        for task in running:
+            task.cancel_token.cancel()
+
+    def shutdown(self, wait=False):
+        """
+        Membatalkan semua tugas dan menutup thread pool. Tugas `always=True` yang masih
+        menunggu tetap dijalankan (di luar pool) setelah dependensinya selesai; dengan
+        wait=True, shutdown() baru kembali setelah semua tugas itu selesai.
+        """
+        with self._lock:
+            self._closed = True
+        self.cancel_all()
+        self._pool.shutdown(wait=False)
+        if wait:
+            with self._changed:
+                self._changed.wait_for(lambda: not (self._running or self._pending))
+
+    def _dispatch(self):
+        started, resolved = [], []
+        with self._lock:
+            closed = self._closed
+            for task in list(self._pending):
+                if any(not dep.finished for dep in task.deps):
+                    continue
+                if not task.always and any(dep.state != DONE for dep in task.deps):
+                    self._pending.remove(task)
+                    resolved.append(task)
+                    continue
+                if task.resources & self._held:
+                    continue
+                self._pending.remove(task)
+                self._held |= task.resources
+                self._running.append(task)
+                task.state = RUNNING
+                task.started_at = time.monotonic()
+                started.append(task)
+        for task in resolved:
+            self._finish(task, SKIPPED)
+        for task in started:
+            self._notify(task)
+            if closed:
+                self._run(task)
+            else:
+                self._pool.submit(self._run, task)
+
+    def _run(self, task):
+        try:
+            task.function(task.cancel_token)
+            # Fungsi yang kembali normal berarti langkahnya selesai, walaupun token dibatalkan
+            # setelahnya (misalnya 'net stop' yang sudah berhasil); hanya TaskCancelled = dibatalkan.
+            state = DONE
+        except TaskCancelled:
+            state = CANCELLED
+        except Exception as e:
+            task.error = e
+            state = FAILED
+        with self._lock:
+            self._running.remove(task)
+            self._held -= task.resources
+        self._finish(task, state)
+
+    def _finish(self, task, state):
+        task.state = state
+        if state == DONE:
+            task.progress = 100
+        task.finished_at = time.monotonic()
+        with self._changed:
+            self._changed.notify_all()
+        graph = task.graph
+        if graph is not None and graph.finished_at is None and graph.done:
+            graph.finished_at = time.monotonic()
+        self._notify(task)
+        # Tugas yang selesai bisa membuka dependensi atau resource tugas lain.
+        self._dispatch()
+
+    def _notify(self, task):
+        if self.on_change:
+            try:
+                self.on_change(task)
+            except Exception:
+                pass
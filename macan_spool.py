@@ -0,0 +1,158 @@
+# Nama File: macan_spool.py
+# Deskripsi: Penampung output dengan memori terbatas untuk Macan Conquer. Baris terbaru
+#            disimpan di ring di memori; saat ring penuh, baris terlama ditulis ke file
+#            spool append-only, sehingga pemakaian memori tetap datar sepanjang sesi.
+#
+# Cara Kerja:
+# - Baris ditulis ke spool per blok SPOOL_BLOCK_LINES baris. Setiap blok bisa
+#   dikompres sendiri-sendiri (zlib), sehingga baris ke-n tetap bisa dibaca tanpa
+#   men-decompress seluruh file: cukup satu blok yang berisi baris tersebut.
+# - Index hanya menyimpan (offset, panjang) per blok, bukan per baris.
+# - File spool berada di %LOCALAPPDATA%\MacanConquer\spool dan dihapus saat close().
+#   Spool milik proses yang sudah tidak berjalan (misalnya setelah crash) dibersihkan
+#   oleh purge_stale_spools().
+#
+# Modul ini tidak meng-import PySide6. Semua method aman dipanggil dari thread mana pun.
+
+import collections
+import os
+import threading
+import zlib
+
+from macan_cleanup import app_data_dir
+
+RING_LINES = 4096         # Baris maksimum di memori per spool
+SPOOL_BLOCK_LINES = 1024  # Baris per blok di file spool
+SPOOL_SUFFIX = ".spool"
+
+
+class OutputSpool:
+    """
+    Menyimpan semua baris output; baris ke-n (mulai 0) bisa dibaca lewat line(n)/lines().
+
+    Paling banyak `ring_lines` baris di memori, ditambah satu blok hasil decode yang
+    di-cache untuk pembacaan berurutan dari spool.
+    """
+
+    def __init__(self, name, compress=True, ring_lines=RING_LINES, block_lines=SPOOL_BLOCK_LINES):
+        self.name = name
+        self.compress = compress
+        self.block_lines = block_lines
+        self.ring_lines = max(ring_lines, block_lines)
+        self._ring = collections.deque()
+        self._spilled = 0       # Jumlah baris yang sudah ada di file spool
+        self._blocks = []       # (offset, panjang byte) per blok
+        self._file = None
+        self.path = None
+        self._cache = (None, None)  # (nomor blok, list baris)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return self._spilled + len(self._ring)
+
+    @property
+    def spooled_bytes(self):
+        with self._lock:
+            return sum(length for _, length in self._blocks)
+
+    def append(self, line):
+        self.extend((line,))
+
+    def extend(self, lines):
+        with self._lock:
+            for line in lines:
+                self._ring.extend(line.split("\n"))
+            while len(self._ring) > self.ring_lines:
+                self._spill()
+
+    def _spill(self):
+        block = [self._ring.popleft() for _ in range(self.block_lines)]
+        data = "\n".join(block).encode("utf-8")
+        if self.compress:
+            data = zlib.compress(data, 1)
+        if self._file is None:
+            safe_name = "".join(c if c.isalnum() else "_" for c in self.name)[:40]
+            self.path = os.path.join(app_data_dir("spool"), f"{os.getpid()}_{id(self):x}_{safe_name}{SPOOL_SUFFIX}")
+            self._file = open(self.path, "w+b")
+        self._file.seek(0, os.SEEK_END)
+        self._blocks.append((self._file.tell(), len(data)))
+        self._file.write(data)
+        self._spilled += len(block)
+
+    def _read_block(self, index):
+        if self._cache[0] == index:
+            return self._cache[1]
+        offset, length = self._blocks[index]
+        self._file.seek(offset)
+        data = self._file.read(length)
+        if self.compress:
+            data = zlib.decompress(data)
+        block = data.decode("utf-8").split("\n")
+        self._cache = (index, block)
+        return block
+
+    def line(self, number):
+        with self._lock:
+            if number < 0 or number >= self._spilled + len(self._ring):
+                raise IndexError(number)
+            if number >= self._spilled:
+                return self._ring[number - self._spilled]
+            return self._read_block(number // self.block_lines)[number % self.block_lines]
+
+    def lines(self, start=0, stop=None):
+        """Baris [start, stop) sebagai generator; dibaca per blok, aman untuk sesi yang sangat panjang."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        number = max(start, 0)
+        while number < stop:
+            with self._lock:
+                if number < self._spilled:
+                    index = number // self.block_lines
+                    first = index * self.block_lines
+                    chunk = self._read_block(index)[number - first:stop - first]
+                else:
+                    ring = list(self._ring)
+                    chunk = ring[number - self._spilled:stop - self._spilled]
+            if not chunk:
+                return
+            yield from chunk
+            number += len(chunk)
+
+    def export(self, path):
+        """Menulis semua baris ke file teks tanpa memuat seluruhnya ke memori."""
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.lines():
+                f.write(line)
+                f.write("\n")
+
+    def close(self):
+        """Menghapus file spool; isi spool tidak bisa dibaca lagi."""
+        with self._lock:
+            self._ring.clear()
+            self._blocks.clear()
+            self._spilled = 0
+            self._cache = (None, None)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+
+
+def purge_stale_spools():
+    """Menghapus file spool milik proses yang sudah tidak berjalan. Mengembalikan jumlahnya."""
+    import psutil
+    folder = app_data_dir("spool")
+    removed = 0
+    for name in os.listdir(folder):
+        pid = name.split("_", 1)[0]
+        if not name.endswith(SPOOL_SUFFIX) or not pid.isdigit() or psutil.pid_exists(int(pid)):
+            continue
+        try:
+            os.remove(os.path.join(folder, name))
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,115 @@
+# Nama File: macan_startup.py
+# Deskripsi: Profiler fase startup Macan Conquer. Mencatat waktu wall-clock setiap fase
+#            (import, QApplication, stylesheet, setiap create_*_group, dashboard, paint
+#            pertama) agar jelas bagian mana yang membuat window lambat tampil.
+#
+# Cara Kerja:
+# - Titik nol adalah time.perf_counter() yang diambil di baris paling awal script,
+#   sebelum modul lain di-import.
+# - phase(name) adalah context manager dan timed adalah decorator; fase boleh bersarang
+#   (misalnya setiap grup tombol di dalam MacanConquerApp.__init__).
+# - mark(name) mencatat fase yang dimulai di akhir fase tingkat atas sebelumnya dan
+#   berakhir sekarang, untuk fase yang tidak bisa dibungkus `with` (import, paint pertama).
+# - Laporan ditampilkan lewat menu Help > Profil Startup, atau ditulis sebagai JSON ke
+#   path di environment variable MACAN_STARTUP_PROFILE setelah paint pertama.
+#
+# Modul ini tidak meng-import PySide6.
+
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "MACAN_STARTUP_PROFILE"
+
+
+class Phase:
+    """Satu fase startup; waktu dalam detik relatif terhadap titik nol profiler."""
+
+    def __init__(self, name, start, duration, depth):
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.depth = depth
+
+    @property
+    def end(self):
+        return self.start + self.duration
+
+
+class StartupProfiler:
+    def __init__(self, origin=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases = []
+        self.finished = False
+        self._depth = 0
+        self._last = self.origin  # Akhir fase tingkat atas terakhir
+
+    def _record(self, name, start, end, depth):
+        self.phases.append(Phase(name, start - self.origin, end - start, depth))
+        if depth == 0:
+            self._last = end
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self._record(name, start, time.perf_counter(), depth)
+
+    def timed(self, function):
+        """Decorator: setiap pemanggilan `function` dicatat sebagai fase bernama sama."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.phase(function.__name__):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def mark(self, name):
+        self._record(name, self._last, time.perf_counter(), 0)
+
+    def finish(self, name="paint pertama"):
+        """Mencatat fase terakhir; laporan JSON ditulis jika MACAN_STARTUP_PROFILE diisi."""
+        if self.finished:
+            return
+        self.mark(name)
+        self.finished = True
+        path = os.environ.get(PROFILE_ENV)
+        if path:
+            try:
+                self.dump(path)
+            except OSError:
+                pass
+
+    @property
+    def total(self):
+        return max((phase.end for phase in self.phases), default=0.0)
+
+    def sorted_phases(self):
+        # Fase induk dimulai sebelum anaknya; pada waktu mulai yang sama, depth lebih kecil dulu
+        return sorted(self.phases, key=lambda phase: (phase.start, phase.depth))
+
+    def report(self):
+        """Baris teks per fase, dengan indentasi untuk fase bersarang."""
+        lines = []
+        for phase in self.sorted_phases():
+            name = "  " * phase.depth + phase.name
+            lines.append(f"{name:<40} {phase.duration * 1000:8.1f} ms  (mulai +{phase.start * 1000:.0f} ms)")
+        lines.append(f"{'Total sampai fase terakhir':<40} {self.total * 1000:8.1f} ms")
+        return lines
+
+    def to_dict(self):
+        return {
+            "total_ms": round(self.total * 1000, 2),
+            "phases": [{"name": phase.name, "depth": phase.depth, "start_ms": round(phase.start * 1000, 2),
+                        "duration_ms": round(phase.duration * 1000, 2)} for phase in self.sorted_phases()],
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
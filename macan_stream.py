@@ -0,0 +1,195 @@
+# Nama File: macan_stream.py
+# Deskripsi: Pembaca output perintah eksternal yang memahami carriage return. DISM, sfc,
+#            dan chkdsk menggambar ulang progress di tempat dengan '\r'; membaca per
+#            readline() membuat frame progress tertahan sampai '\n' berikutnya muncul.
+#
+# Cara Kerja:
+# - Pipe dibaca per chunk (apa pun yang sudah tersedia, tanpa menunggu '\n'), lalu
+#   dipecah pada '\r\n', '\n', dan '\r'.
+# - Teks yang diakhiri '\n' menjadi event LINE (masuk log). Teks yang diakhiri '\r' atau
+#   teks yang sedang digambar ulang setelah '\r' menjadi event FRAME (hanya untuk progress).
+# - Dalam satu chunk hanya frame terakhir yang dikirim; frame perantara yang langsung
+#   tertimpa tidak pernah terlihat, jadi dibuang.
+# - Byte mentah di-decode secara incremental. Encoding ditebak sekali dari byte pertama
+#   (BOM, pola UTF-16LE, UTF-8 valid, atau codepage OEM console), sehingga karakter
+#   multi-byte yang terpotong di batas chunk tidak rusak. Dipakai oleh jalur Popen
+#   (iter_stream) maupun QProcess (OutputDecoder).
+#
+# Modul ini tidak meng-import PySide6.
+
+import codecs
+import locale
+import os
+import re
+
+LINE = "line"
+FRAME = "frame"
+CHUNK_SIZE = 4096
+SNIFF_BYTES = 64  # Encoding ditebak paling lambat setelah byte sebanyak ini (lihat can_sniff)
+
+_SEPARATOR = re.compile(r'\r\n|\n|\r')
+
+
+class LineAssembler:
+    """
+    Merakit chunk teks menjadi event (LINE, teks) dan (FRAME, teks).
+
+    '\r' di ujung chunk bisa jadi awal '\r\n' yang terpotong. Teksnya tetap langsung
+    dikirim sebagai FRAME, dan jika chunk berikutnya diawali '\n', teks yang sama
+    dikirim lagi sebagai LINE.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._after_cr = False  # Teks di buffer sedang digambar ulang di tempat
+        self._cr_text = None    # Teks yang diakhiri '\r' tepat di ujung chunk sebelumnya
+
+    def feed(self, text):
+        if not text:
+            return []  # Misalnya setengah karakter UTF-16 yang belum lengkap
+        events = []
+        if self._cr_text is not None:
+            pending, self._cr_text = self._cr_text, None
+            if text.startswith("\n"):
+                events.append((LINE, pending))
+                text = text[1:]
+                self._after_cr = False
+        if not text:
+            return events
+
+        data = self._buffer + text
+        start = 0
+        frame = None
+        for match in _SEPARATOR.finditer(data):
+            segment = data[start:match.start()]
+            start = match.end()
+            if match.group() != "\r":
+                if frame is not None:
+                    events.append((FRAME, frame))
+                    frame = None
+                events.append((LINE, segment))
+                self._after_cr = False
+                continue
+            self._after_cr = True
+            if start == len(data):
+                self._cr_text = segment
+            if segment:
+                frame = segment  # Frame sebelumnya di chunk ini tertimpa dan dibuang
+
+        self._buffer = data[start:]
+        if self._buffer and self._after_cr:
+            frame = self._buffer  # Frame yang sedang digambar dikirim tanpa menunggu '\r'
+        if frame is not None:
+            events.append((FRAME, frame))
+        return events
+
+    def close(self):
+        """Sisa teks saat EOF dikirim sebagai LINE terakhir."""
+        rest = self._buffer or self._cr_text
+        self._buffer, self._cr_text = "", None
+        return [(LINE, rest)] if rest else []
+
+
+# --- Decoding ---
+
+def oem_encoding():
+    """Codepage OEM console Windows (misalnya 'cp437' atau 'cp850'); di luar Windows encoding locale."""
+    if os.name == "nt":
+        import ctypes
+        return f"cp{ctypes.windll.kernel32.GetOEMCP()}"
+    return locale.getpreferredencoding(False)
+
+
+def can_sniff(sample):
+    """
+    True jika `sample` sudah cukup untuk menebak encoding: ada BOM, pola NUL UTF-16LE,
+    satu baris/frame lengkap ('\n' atau '\r'), atau sudah SNIFF_BYTES byte. Baris pertama
+    yang pendek (banner DISM, frame progress) tidak tertahan menunggu output berikutnya.
+    """
+    if len(sample) >= SNIFF_BYTES:
+        return True
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF8)):
+        return True
+    if len(sample) >= 4 and not any(sample[1::2]):
+        return True  # 'x\0y\0': UTF-16LE tanpa BOM
+    return b"\n" in sample or b"\r" in sample
+
+
+def sniff_encoding(sample):
+    """Menebak encoding output perintah dari byte-byte pertamanya."""
+    if sample.startswith(codecs.BOM_UTF16_LE):
+        return "utf-16"  # Decoder 'utf-16' membuang BOM-nya
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    # UTF-16LE tanpa BOM (sfc saat di-redirect): teks ASCII menjadi 'x\0y\0...'
+    odd = sample[1::2]
+    if odd and odd.count(0) >= len(odd) * 0.4 and sample[0::2].count(0) < len(odd) * 0.1:
+        return "utf-16-le"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample)
+    except UnicodeDecodeError:
+        return oem_encoding()
+    # ASCII murni tidak bisa dibedakan; tool console Windows menulis dalam codepage OEM.
+    return "utf-8" if any(byte >= 0x80 for byte in sample) else oem_encoding()
+
+
+class StreamDecoder:
+    """Decoder incremental yang menebak encoding sekali dari data pertama."""
+
+    def __init__(self, encoding=None, errors="replace"):
+        self.encoding = encoding
+        self.errors = errors
+        self._decoder = None
+        self._pending = bytearray()
+        if encoding:
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+
+    def decode(self, data, final=False):
+        if self._decoder is None:
+            self._pending += data
+            if not final and not can_sniff(self._pending):
+                return ""
+            self.encoding = sniff_encoding(bytes(self._pending))
+            self._decoder = codecs.getincrementaldecoder(self.encoding)(errors=self.errors)
+            data = self._pending
+        text = self._decoder.decode(data, final)
+        if self._pending:
+            self._pending = bytearray()
+        return text
+
+
+class OutputDecoder:
+    """
+    Byte mentah -> event (LINE/FRAME, teks) untuk satu channel output.
+
+    Untuk sumber yang mendorong chunk (QProcess.readyReadStandardOutput): panggil
+    feed(bytes) setiap ada data, lalu close() saat proses selesai.
+    """
+
+    def __init__(self, encoding=None):
+        self.decoder = StreamDecoder(encoding)
+        self.assembler = LineAssembler()
+
+    def feed(self, data):
+        return self.assembler.feed(self.decoder.decode(data))
+
+    def close(self):
+        return self.assembler.feed(self.decoder.decode(b"", final=True)) + self.assembler.close()
+
+
+def iter_stream(stream, encoding=None, chunk_size=CHUNK_SIZE):
+    """
+    Menghasilkan event (LINE/FRAME, teks) dari `stream` biner sampai EOF.
+
+    Untuk Popen, gunakan bufsize=0 agar readinto() langsung mengembalikan data yang
+    tersedia. Data dibaca ke satu bytearray yang dipakai ulang untuk setiap chunk.
+    """
+    output = OutputDecoder(encoding)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        count = stream.readinto(buffer)
+        if not count:
+            break
+        yield from output.feed(view[:count])
+    yield from output.close()
@@ -0,0 +1,225 @@
+# Nama File: macan_tasks.py
+# Deskripsi: Utilitas untuk tugas latar belakang Macan Conquer: token pembatalan
+#            kooperatif, penghentian/penangguhan process tree perintah eksternal, dan
+#            penggabungan baris output worker menjadi batch.
+#
+# Modul ini tidak meng-import PySide6. psutil dan subprocess di-import saat dibutuhkan saja.
+
+import threading
+import time
+
+OUTPUT_BATCH_INTERVAL = 0.05  # Detik; baris output dikumpulkan paling lama selama ini
+OUTPUT_BATCH_LINES = 256      # Batch dikirim lebih awal jika sudah sebanyak ini
+
+
+class TaskCancelled(Exception):
+    """Dilempar oleh fungsi tugas yang berhenti karena dibatalkan pengguna."""
+
+
+class CancelToken:
+    """
+    Token pembatalan kooperatif yang dibagikan antara GUI thread dan worker.
+
+    Fungsi tugas memeriksa `cancelled` di titik-titik aman, atau mendaftarkan
+    callback lewat on_cancel() (misalnya untuk mematikan process tree yang sedang
+    memblokir readline()).
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TaskCancelled()
+
+    def wait(self, timeout):
+        """Tidur hingga `timeout` detik; kembali lebih cepat (True) jika dibatalkan."""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback):
+        """Mendaftarkan callback pembatalan. Mengembalikan fungsi untuk mencabutnya."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def kill_process_tree(pid, timeout=3):
+    """
+    Menghentikan proses `pid` beserta semua turunannya (misalnya DISM -> DismHost.exe).
+
+    Anak-anak dihentikan lebih dulu dengan terminate(), lalu yang masih hidup setelah
+    `timeout` detik di-kill(). Tanpa psutil, fallback ke 'taskkill /T /F'.
+    """
+    try:
+        import psutil
+    except ImportError:
+        import subprocess
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(pid)], capture_output=True)
+        return
+    try:
+        parent = psutil.Process(pid)
+    except psutil.NoSuchProcess:
+        return
+    processes = parent.children(recursive=True) + [parent]
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    _, alive = psutil.wait_procs(processes, timeout=timeout)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+
+def _process_tree(pid):
+    import psutil
+    parent = psutil.Process(pid)
+    return [parent] + parent.children(recursive=True)
+
+
+def suspend_process_tree(pid):
+    """Menangguhkan `pid` beserta turunannya; induk lebih dulu agar tidak membuat anak baru."""
+    import psutil
+    try:
+        processes = _process_tree(pid)
+    except psutil.NoSuchProcess:
+        return
+    for process in processes:
+        try:
+            process.suspend()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+
+def resume_process_tree(pid):
+    """Melanjutkan process tree yang ditangguhkan suspend_process_tree()."""
+    import psutil
+    try:
+        processes = _process_tree(pid)
+    except psutil.NoSuchProcess:
+        return
+    for process in reversed(processes):
+        try:
+            process.resume()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+
+class _SharedFlusher:
+    """
+    Satu thread daemon yang mem-flush semua OutputBatcher, menggantikan satu thread per
+    tugas. Thread dibuat saat batch pertama dijadwalkan dan tidur selama tidak ada batch
+    yang menunggu; setiap batcher tetap di-flush tepat pada tenggatnya sendiri.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._due = {}  # batcher -> tenggat flush (time.monotonic())
+        self._thread = None
+
+    def schedule(self, batcher, due):
+        with self._condition:
+            if batcher in self._due:
+                return  # Batch yang sama sudah menunggu; baris baru ikut terkirim saat itu
+            self._due[batcher] = due
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="MacanOutputFlusher", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def unschedule(self, batcher):
+        with self._condition:
+            self._due.pop(batcher, None)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    ready = [batcher for batcher, due in self._due.items() if due <= now]
+                    if ready:
+                        for batcher in ready:
+                            del self._due[batcher]
+                        break
+                    self._condition.wait(min(self._due.values()) - now if self._due else None)
+            for batcher in ready:
+                try:
+                    batcher.flush()
+                except Exception:
+                    pass  # Sink yang gagal tidak boleh menghentikan flush tugas lain
+
+
+_FLUSHER = _SharedFlusher()
+
+
+class OutputBatcher:
+    """
+    Pengganti `output_signal` yang menggabungkan baris menjadi list sebelum dikirim.
+
+    emit(line) bisa dipanggil dari thread mana pun. Baris dikirim ke `sink(list)` paling
+    lambat `interval` detik setelah baris pertama dalam batch masuk, atau segera setelah
+    terkumpul `max_lines` baris. Urutan baris selalu dijaga. close() mengirim sisa baris
+    dan harus dipanggil sebelum tugas dinyatakan selesai.
+
+    Batcher tidak punya thread sendiri: flush berkala dilakukan oleh satu thread bersama
+    (_SharedFlusher) untuk semua tugas yang sedang berjalan.
+    """
+
+    def __init__(self, sink, interval=OUTPUT_BATCH_INTERVAL, max_lines=OUTPUT_BATCH_LINES):
+        self.sink = sink
+        self.interval = interval
+        self.max_lines = max_lines
+        self._lines = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Menjaga urutan batch jika flush berebut
+
+    def emit(self, line):
+        with self._lock:
+            self._lines.append(line)
+            first = len(self._lines) == 1
+            full = len(self._lines) >= self.max_lines
+        if full:
+            self.flush()
+        elif first:
+            # Kumpulkan baris selama satu jendela waktu, lalu kirim sekaligus.
+            _FLUSHER.schedule(self, time.monotonic() + self.interval)
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                lines, self._lines = self._lines, []
+            if lines:
+                self.sink(lines)
+
+    def close(self):
+        _FLUSHER.unschedule(self)
+        self.flush()
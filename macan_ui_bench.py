@@ -0,0 +1,134 @@
+# Nama File: macan_ui_bench.py
+# Deskripsi: Mengukur biaya pengiriman output worker ke console GUI: satu sinyal per
+#            baris (cara lama) dibandingkan batch OutputBatcher (macan_tasks.py).
+#            Melaporkan baris/detik yang sampai ke QTextEdit, latensi event loop GUI
+#            (keterlambatan QTimer 10 ms), dan jumlah thread maksimum selama run dalam JSON.
+#
+# Cara Menjalankan (butuh PySide6):
+#   python macan_ui_bench.py --lines 50000
+#   python macan_ui_bench.py --lines 20000 --rate 5000     # simulasi tool yang mencetak 5000 baris/s
+#   python macan_ui_bench.py --lines 40000 --tasks 8       # 8 tugas paralel, masing-masing 5000 baris
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication, QTextEdit
+
+from macan_tasks import OutputBatcher
+
+TICK_MS = 10
+
+
+class Emitter(QObject):
+    line = Signal(str)
+    batch = Signal(list)
+
+
+def _produce(emit, lines, rate):
+    interval = 1.0 / rate if rate else 0.0
+    start = time.perf_counter()
+    for i in range(lines):
+        emit(f"[{i:07d}] Progress: {i} of {lines} done; Stage: 42%; Total: 13%; ETA: 0:01:23")
+        if interval:
+            delay = start + (i + 1) * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+
+def run_mode(app, mode, lines, rate, tasks=1):
+    console = QTextEdit()
+    console.setReadOnly(True)
+    console.show()
+    emitter = Emitter()
+    received = [0]
+    done_at = [None]
+    lateness = []
+    last_tick = [time.perf_counter()]
+    peak_threads = [threading.active_count()]
+
+    def append(message, count=1):
+        console.append(message)
+        console.verticalScrollBar().setValue(console.verticalScrollBar().maximum())
+        received[0] += count
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+        if received[0] >= lines and done_at[0] is None:
+            done_at[0] = time.perf_counter()
+            app.quit()
+
+    emitter.line.connect(append)
+    emitter.batch.connect(lambda batch: append("\n".join(batch), len(batch)))
+
+    def tick():
+        now = time.perf_counter()
+        lateness.append(max(0.0, (now - last_tick[0]) * 1000 - TICK_MS))
+        last_tick[0] = now
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(TICK_MS)
+
+    def worker(count):
+        if mode == "line":
+            _produce(emitter.line.emit, count, rate)
+        else:
+            output = OutputBatcher(emitter.batch.emit)
+            _produce(output.emit, count, rate)
+            output.close()
+
+    start = time.perf_counter()
+    # Setiap tugas mengirim bagiannya sendiri, seperti beberapa tugas Scheduler yang berjalan paralel
+    counts = [lines // tasks + (1 if i < lines % tasks else 0) for i in range(tasks)]
+    threads = [threading.Thread(target=worker, args=(count,), daemon=True) for count in counts]
+    for thread in threads:
+        thread.start()
+    app.exec()
+    for thread in threads:
+        thread.join()
+    timer.stop()
+    console.close()
+
+    elapsed = (done_at[0] or time.perf_counter()) - start
+    lateness.sort()
+    return {
+        "mode": mode,
+        "lines": lines,
+        "rate": rate,
+        "tasks": tasks,
+        "seconds": elapsed,
+        "lines_per_sec": lines / elapsed if elapsed else 0.0,
+        "loop_latency_ms": {
+            "p50": statistics.median(lateness) if lateness else 0.0,
+            "p95": lateness[int(len(lateness) * 0.95)] if lateness else 0.0,
+            "max": lateness[-1] if lateness else 0.0,
+        },
+        "peak_threads": peak_threads[0],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark output worker -> console GUI.")
+    parser.add_argument("--lines", type=int, default=50000, help="Jumlah baris yang dikirim worker.")
+    parser.add_argument("--rate", type=float, default=0, help="Baris per detik dari worker (0 = secepatnya).")
+    parser.add_argument("--tasks", type=int, default=1, help="Jumlah tugas paralel; --lines dibagi rata.")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = [run_mode(app, mode, args.lines, args.rate, max(1, args.tasks)) for mode in ("line", "batch")]
+    for r in results:
+        latency = r["loop_latency_ms"]
+        print(f"{r['mode']:<6} {r['lines_per_sec']:>10.0f} baris/s | latensi event loop "
+              f"p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, maks {latency['max']:.1f} ms"
+              f" | thread maks {r['peak_threads']}",
+              file=sys.stderr)
+    print(json.dumps({"results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
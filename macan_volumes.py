@@ -0,0 +1,115 @@
+# Nama File: macan_volumes.py
+# Deskripsi: Enumerasi volume lokal (psutil.disk_partitions) beserta disk fisik tempat
+#            volume tersebut berada, untuk chkdsk/defrag multi-volume.
+#
+# Cara Kerja:
+# - Disk fisik dibaca dengan IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS. Volume yang
+#   membentang di beberapa disk (spanned/striped) menempati semua disk tersebut.
+# - Setiap volume mendeklarasikan resource 'volume:X:' dan 'disk:N' untuk Scheduler
+#   (macan_scheduler.py): volume di disk fisik berbeda berjalan bersamaan, volume di disk
+#   yang sama berurutan agar tidak saling berebut head/antrian I/O disk yang sama.
+# - Jika disk fisik tidak bisa dibaca (bukan Windows, atau IOCTL gagal), volume hanya
+#   memakai resource 'volume:X:'.
+#
+# Modul ini tidak meng-import PySide6.
+
+import os
+
+import psutil
+
+from macan_cleanup import format_bytes
+
+IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS = 0x00560000
+MAX_DISK_EXTENTS = 32
+
+
+class Volume:
+    """Satu volume lokal, misalnya C: di Disk 0."""
+
+    def __init__(self, letter, fstype, total, disks):
+        self.letter = letter
+        self.fstype = fstype
+        self.total = total
+        self.disks = tuple(disks)
+
+    @property
+    def resources(self):
+        """Resource Scheduler yang dipegang selama chkdsk/defrag berjalan di volume ini."""
+        return volume_resources(self.letter, self.disks)
+
+    def describe(self):
+        disks = ", ".join(f"Disk {disk}" for disk in self.disks) or "disk tidak diketahui"
+        size = format_bytes(self.total) if self.total else "ukuran tidak diketahui"
+        return f"{self.letter} ({self.fstype or '?'}, {size}, {disks})"
+
+
+def volume_resources(letter, disks=None):
+    """{'volume:C:', 'disk:0', ...}; `disks` dibaca dari sistem jika tidak diberikan."""
+    if disks is None:
+        disks = volume_disks(letter)
+    return {f"volume:{letter}"} | {f"disk:{disk}" for disk in disks}
+
+
+def volume_disks(letter):
+    """Nomor disk fisik yang ditempati volume (tuple kosong jika tidak diketahui)."""
+    if os.name != "nt":
+        return ()
+    import ctypes
+    from ctypes import wintypes
+
+    class DISK_EXTENT(ctypes.Structure):
+        _fields_ = [("DiskNumber", wintypes.DWORD),
+                    ("StartingOffset", ctypes.c_longlong),
+                    ("ExtentLength", ctypes.c_longlong)]
+
+    class VOLUME_DISK_EXTENTS(ctypes.Structure):
+        _fields_ = [("NumberOfDiskExtents", wintypes.DWORD),
+                    ("Extents", DISK_EXTENT * MAX_DISK_EXTENTS)]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                     wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    kernel32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+                                         wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                                         wintypes.LPVOID]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    # Akses 0 cukup untuk IOCTL ini, sehingga volume yang sedang dipakai tetap bisa dibuka.
+    handle = kernel32.CreateFileW(f"\\\\.\\{letter}", 0, 0x1 | 0x2, None, 3, 0, None)
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        return ()
+    try:
+        extents = VOLUME_DISK_EXTENTS()
+        returned = wintypes.DWORD()
+        if not kernel32.DeviceIoControl(handle, IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS, None, 0,
+                                        ctypes.byref(extents), ctypes.sizeof(extents),
+                                        ctypes.byref(returned), None):
+            return ()
+        count = min(extents.NumberOfDiskExtents, MAX_DISK_EXTENTS)
+        return tuple(sorted({extents.Extents[i].DiskNumber for i in range(count)}))
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def fixed_volumes():
+    """Volume lokal ('fixed'), diurutkan menurut huruf drive."""
+    volumes = []
+    for partition in psutil.disk_partitions(all=False):
+        if 'fixed' not in partition.opts.split(','):
+            continue
+        letter = partition.device.rstrip("\\")
+        try:
+            total = psutil.disk_usage(partition.mountpoint).total
+        except OSError:
+            total = 0
+        volumes.append(Volume(letter, partition.fstype, total, volume_disks(letter)))
+    return sorted(volumes, key=lambda volume: volume.letter)
+
+
+def group_by_disk(volumes):
+    """[[Volume, ...], ...] per disk fisik; dipakai untuk meringkas rencana eksekusi di log."""
+    groups = {}
+    for volume in volumes:
+        groups.setdefault(volume.disks or (volume.letter,), []).append(volume)
+    return list(groups.values())
@@ -0,0 +1,140 @@
+# Nama File: macan_watchdog.py
+# Deskripsi: Watchdog untuk perintah eksternal (sfc, DISM, chkdsk, defrag). DISM yang
+#            hang tidak lagi menahan tugas dan resource-nya selamanya.
+#
+# Cara Kerja:
+# - Batas waktu: jika perintah berjalan lebih lama dari `time_limit` detik. Aksi default
+#   hanya WARN; KILL harus dipilih sendiri oleh pengguna, karena menghentikan sfc/DISM di
+#   tengah jalan bisa meninggalkan component store dalam keadaan tidak konsisten.
+# - Stall: jika selama `stall_seconds` detik tidak ada output (LINE maupun FRAME) dan
+#   counter kumulatif process tree (detik CPU, byte I/O) dari macan_monitor.py tidak
+#   bertambah lebih dari STALL_CPU_EPSILON / STALL_IO_EPSILON. Label sibuk/diam monitor
+#   tidak dipakai: DISM yang tenang di 5% CPU tetap dianggap berjalan.
+#   Setelah aktivitas kembali, deteksi stall aktif lagi.
+# - Aksi per kejadian: WARN (hanya log), SUSPEND (tangguhkan process tree, bisa
+#   dilanjutkan), atau KILL (hentikan process tree; tugas berakhir dengan WatchdogExpired).
+# - Setiap kejadian dicatat bersama snapshot resource saat itu.
+#
+# Pemeriksaan dilakukan setiap kali monitor mengambil sampel (paling lama MAX_INTERVAL).
+# Modul ini tidak meng-import PySide6.
+
+import time
+
+from macan_cleanup import format_bytes, format_duration
+from macan_tasks import kill_process_tree, resume_process_tree, suspend_process_tree
+
+WARN = "peringatan"
+SUSPEND = "tangguhkan"
+KILL = "hentikan"
+ACTIONS = (WARN, SUSPEND, KILL)
+
+STALL_CPU_EPSILON = 0.05       # Detik CPU; pertambahan di atas ini berarti process tree masih bekerja
+STALL_IO_EPSILON = 64 * 1024   # Byte baca+tulis; di bawah ini dianggap sisa aktivitas latar
+
+
+class WatchdogExpired(Exception):
+    """Process tree dihentikan oleh watchdog (batas waktu atau stall dengan aksi KILL)."""
+
+
+class WatchdogLimits:
+    """Batas untuk satu jenis perintah. 0 berarti nonaktif."""
+
+    def __init__(self, time_limit=0, time_action=WARN, stall_seconds=0, stall_action=WARN):
+        self.time_limit = time_limit
+        self.time_action = time_action
+        self.stall_seconds = stall_seconds
+        self.stall_action = stall_action
+
+    def describe(self):
+        parts = []
+        if self.time_limit:
+            parts.append(f"batas waktu {format_duration(self.time_limit)} ({self.time_action})")
+        if self.stall_seconds:
+            parts.append(f"stall {format_duration(self.stall_seconds)} ({self.stall_action})")
+        return ", ".join(parts) or "nonaktif"
+
+
+# DISM bisa diam lama di 62.3% sambil tetap sibuk I/O; stall hanya dihitung saat tree benar-benar diam.
+# Batas waktu sfc/DISM hanya memberi peringatan: operasi servicing tidak dihentikan tanpa izin pengguna.
+DEFAULT_LIMITS = {
+    "sfc": WatchdogLimits(time_limit=2 * 3600, time_action=WARN, stall_seconds=20 * 60),
+    "dism": WatchdogLimits(time_limit=4 * 3600, time_action=WARN, stall_seconds=30 * 60),
+    "chkdsk": WatchdogLimits(stall_seconds=30 * 60),
+    "defrag": WatchdogLimits(stall_seconds=30 * 60),
+    "default": WatchdogLimits(stall_seconds=15 * 60),
+}
+
+
+def limits_for(command, limits=None):
+    """Batas untuk `command` (hasil macan_progress.command_key), atau batas 'default'."""
+    limits = limits or DEFAULT_LIMITS
+    return limits.get(command) or limits["default"]
+
+
+class Watchdog:
+    """
+    Mengawasi satu process tree. Panggil touch() setiap ada output dan check(sample)
+    dari callback ProcessTreeMonitor.
+    """
+
+    def __init__(self, pid, limits, log):
+        self.pid = pid
+        self.limits = limits
+        self.log = log
+        self.started_at = time.monotonic()
+        self.last_activity = self.started_at
+        self.stalled = False
+        self.timed_out = False
+        self.suspended = False
+        self.expired = None  # Alasan jika process tree dihentikan watchdog
+        self._counters = None  # (detik CPU, byte I/O) saat aktivitas terakhir tercatat
+
+    def touch(self):
+        self.last_activity = time.monotonic()
+
+    def check(self, sample):
+        now = time.monotonic()
+        # Dibandingkan dengan counter saat aktivitas terakhir, bukan sampel sebelumnya, agar
+        # kemajuan yang lambat tapi terus-menerus tetap terhitung.
+        counters = (sample.cpu_time, sample.read_bytes + sample.write_bytes)
+        if self._counters is None:
+            self._counters = counters
+        elif (counters[0] - self._counters[0] > STALL_CPU_EPSILON
+              or counters[1] - self._counters[1] > STALL_IO_EPSILON):
+            self._counters = counters
+            self.last_activity = now
+        idle = now - self.last_activity
+        limits = self.limits
+        if self.stalled and idle < limits.stall_seconds:
+            self.stalled = False
+        if limits.stall_seconds and not self.stalled and idle >= limits.stall_seconds:
+            self.stalled = True
+            self._fire(limits.stall_action, f"tidak ada output maupun aktivitas CPU/I-O selama {format_duration(idle)}", sample)
+        if limits.time_limit and not self.timed_out and now - self.started_at >= limits.time_limit:
+            self.timed_out = True
+            self._fire(limits.time_action, f"melewati batas waktu {format_duration(limits.time_limit)}", sample)
+
+    def _fire(self, action, reason, sample):
+        self.log(f"⚠️ Watchdog ({action}): {reason}.")
+        self.log(f"   Snapshot: {sample.format()}")
+        self.log(f"   Total CPU {sample.cpu_time:.1f} detik, baca {format_bytes(sample.read_bytes)}, "
+                 f"tulis {format_bytes(sample.write_bytes)}, {sample.processes} proses.")
+        if action == SUSPEND and not self.suspended:
+            suspend_process_tree(self.pid)
+            self.suspended = True
+            self.log("   Process tree ditangguhkan. Lanjutkan lewat menu File atau hentikan dengan tombol Batal.")
+        elif action == KILL:
+            self.expired = reason
+            self.log("   Process tree dihentikan.")
+            kill_process_tree(self.pid)
+
+    def resume(self):
+        if self.suspended:
+            resume_process_tree(self.pid)
+            self.suspended = False
+            self.touch()
+            self.log("▶️ Process tree dilanjutkan.")
+
+    def raise_if_expired(self):
+        if self.expired:
+            raise WatchdogExpired(f"Dihentikan oleh watchdog: {self.expired}")